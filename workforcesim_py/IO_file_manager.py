@@ -15,11 +15,16 @@ DataFrames as CSV files or Matplotlib plots as PNG images).
 """
 
 import os
+import shutil
 import datetime
 import pickle
 
+import numpy as np
+import pandas as pd
+
 # Import other modules from this package.
 import config as cfg
+import wfs_records as rec
 
 
 def specify_directory_structure():
@@ -38,6 +43,20 @@ def specify_directory_structure():
         os.path.join(cfg.CURRENT_WORKING_DIR, 'datasets'))
 
 
+def delete_all_plots_from_plots_dir():
+    """
+    Deletes any existing plots in the plots directory (including any 
+    directories of plots that were rendered on demand for a dataset).
+    """
+
+    for file in os.listdir(cfg.PLOTS_DIR):
+        file_path = os.path.join(cfg.PLOTS_DIR, file)
+        if os.path.isdir(file_path):
+            shutil.rmtree(file_path)
+        else:
+            os.remove(file_path)
+
+
 def generate_unique_file_prefix_code_for_simulation_run():
     """
     Generates a unique code for this run of the simulation, which can 
@@ -136,6 +155,222 @@ def save_df_to_pickle_file(input_df_u, filename_u):
     input_df_u.to_pickle(filename_and_path)
 
 
+# The types (as inferred by pd.api.types.infer_dtype()) of object 
+# columns whose values can be stored as such in a Parquet or Feather 
+# file; the values of any other columns (e.g., Role objects) are 
+# exported as strings, just as they would be in a CSV file.
+COLUMNAR_EXPORT_NATIVE_INFERRED_TYPES = (
+    "string",
+    "boolean",
+    "integer",
+    "floating",
+    "mixed-integer-float",
+    "decimal",
+    "date",
+    "empty",
+    )
+
+
+def return_path_of_columnar_export_file(filename_u, file_ending_u):
+    """
+    Returns the path to which the current dataset should be saved when
+    exported in a columnar (Parquet or Feather) format. The file is 
+    always saved in the user_generated directory, with a suffix code 
+    identifying the dataset: for a newly generated dataset, this is the
+    code for the current simulation run; for a loaded (rather than 
+    just-generated) dataset, it's the code of the run that generated it.
+
+    PARAMETERS
+    ----------
+    filename_u
+        The desired filename (without suffix code or file ending)
+    file_ending_u
+        The file ending (e.g., ".parquet")
+    """
+
+    if cfg.visualization_data_source not in (
+            "newly_generated_dataset", "stored_dataset"):
+        raise ValueError(
+            "Unknown visualization_data_source: " \
+            + repr(cfg.visualization_data_source)
+            )
+
+    # The prefix code (e.g., "[100p-20d-99r_20230208092751]_") is 
+    # restored along with a loaded dataset, so it identifies the dataset
+    # in either case; it's converted here to the suffix variant.
+    dataset_suffix_code = \
+        "_" + cfg.unique_file_prefix_code_for_simulation_run[:-1]
+
+    return os.path.join(
+        cfg.DATASETS_DIR,
+        "user_generated",
+        filename_u + dataset_suffix_code + file_ending_u,
+        )
+
+
+def return_df_prepared_for_columnar_export(input_df_u, sort_col_u=None):
+    """
+    Returns a copy of a DataFrame prepared for export in a columnar 
+    (Parquet or Feather) format: object columns holding values that 
+    can't be stored natively are converted to strings, and string 
+    columns with relatively few distinct values are converted to 
+    categoricals (so that they're stored dictionary-encoded).
+
+    PARAMETERS
+    ----------
+    input_df_u
+        The DataFrame to be exported
+    sort_col_u : str
+        The name of a column by which the rows should be (stably) sorted
+        (optional)
+    """
+
+    df = input_df_u.reset_index(drop=True)
+    if sort_col_u is not None:
+        df = df.sort_values(sort_col_u, kind="stable", ignore_index=True)
+
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+
+        # A "mixed" column holds values of types that can't be stored
+        # natively (e.g., Role objects), alone or alongside other types,
+        # unless it's a column of lists (e.g., colleagues' IDs).
+        inferred_type = pd.api.types.infer_dtype(df[col], skipna=True)
+        if (inferred_type == "mixed") and isinstance(
+                df[col].loc[df[col].first_valid_index()], list):
+            continue
+        if inferred_type not in COLUMNAR_EXPORT_NATIVE_INFERRED_TYPES:
+            df[col] = df[col].map(str, na_action="ignore")
+            inferred_type = "string"
+
+        non_null_vals_num = df[col].count()
+        if (inferred_type == "string") \
+                and (non_null_vals_num > 0) \
+                and (df[col].nunique() <= non_null_vals_num \
+                    * cfg.COLUMNAR_EXPORT_DICTIONARY_ENCODING_MAX_UNIQUE_PRTN):
+            df[col] = df[col].astype("category")
+
+    return df
+
+
+def return_row_ranges_by_value_of_col(input_df_u, col_u):
+    """
+    Returns a list of (offset, length) pairs giving the ranges of 
+    consecutive rows in a DataFrame that share the same value in a 
+    given column (e.g., the rows for each week, if the DataFrame is 
+    sorted by week).
+
+    PARAMETERS
+    ----------
+    input_df_u
+        The DataFrame
+    col_u : str
+        The name of the column
+    """
+
+    vals = input_df_u[col_u].values
+    if len(vals) == 0:
+        return []
+
+    starts = np.flatnonzero(np.r_[True, vals[1:] != vals[:-1]])
+    ends = np.r_[starts[1:], len(vals)]
+
+    return list(zip(starts.tolist(), (ends - starts).tolist()))
+
+
+def save_df_to_parquet_file(input_df_u, filename_u, row_group_col_u=None):
+    """
+    Saves a DataFrame to disk as a Parquet file, with string columns
+    dictionary-encoded and compressed with cfg.PARQUET_EXPORT_COMPRESSION.
+
+    PARAMETERS
+    ----------
+    input_df_u
+        The DataFrame to be saved
+    filename_u
+        The desired filename (without suffix code or .parquet ending)
+    row_group_col_u : str
+        The name of a column (e.g., the week in the series) by whose 
+        values the rows should be partitioned into row groups, so that
+        readers can skip the row groups they don't need (optional)
+    """
+
+    # PyArrow is imported here (rather than at the top of the module), 
+    # since it's needed only for Parquet and Feather export.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    filename_and_path = \
+        return_path_of_columnar_export_file(filename_u, ".parquet")
+
+    df = return_df_prepared_for_columnar_export(input_df_u, row_group_col_u)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    with pq.ParquetWriter(
+        filename_and_path,
+        table.schema,
+        compression=cfg.PARQUET_EXPORT_COMPRESSION,
+        use_dictionary=True,
+        ) as writer:
+        if row_group_col_u is None:
+            writer.write_table(table)
+        else:
+            for offset, length in \
+                    return_row_ranges_by_value_of_col(df, row_group_col_u):
+                writer.write_table(
+                    table.slice(offset, length),
+                    row_group_size=length,
+                    )
+
+
+def save_df_to_feather_file(input_df_u, filename_u, row_group_col_u=None):
+    """
+    Saves a DataFrame to disk as a Feather (Arrow IPC) file, with string
+    columns dictionary-encoded and compressed with 
+    cfg.FEATHER_EXPORT_COMPRESSION.
+
+    PARAMETERS
+    ----------
+    input_df_u
+        The DataFrame to be saved
+    filename_u
+        The desired filename (without suffix code or .feather ending)
+    row_group_col_u : str
+        The name of a column (e.g., the week in the series) by whose 
+        values the rows should be partitioned into record batches 
+        (optional)
+    """
+
+    # PyArrow is imported here (rather than at the top of the module), 
+    # since it's needed only for Parquet and Feather export.
+    import pyarrow as pa
+
+    filename_and_path = \
+        return_path_of_columnar_export_file(filename_u, ".feather")
+
+    df = return_df_prepared_for_columnar_export(input_df_u, row_group_col_u)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    # All of the record batches are slices of a single table, so they 
+    # share the same dictionaries (as the IPC file format requires).
+    with pa.ipc.new_file(
+        filename_and_path,
+        table.schema,
+        options=pa.ipc.IpcWriteOptions(
+            compression=cfg.FEATHER_EXPORT_COMPRESSION),
+        ) as writer:
+        if row_group_col_u is None:
+            writer.write_table(table)
+        else:
+            for offset, length in \
+                    return_row_ranges_by_value_of_col(df, row_group_col_u):
+                writer.write_table(
+                    table.slice(offset, length),
+                    max_chunksize=length,
+                    )
+
+
 def save_key_vars_to_pickled_file():
     """
     Exports key variables to a file via pickling.
@@ -249,14 +484,16 @@ def save_wfs_behaviors_records_df_as_csv_or_pickle_for_distribution(
     file_format_u
     ):
     """
-    Exports wfs_behaviors-records_df in CSV or pickle format for 
-    distribution within the package and/or uploading to sites (e.g., 
-    Kaggle).
+    Exports wfs_behaviors-records_df in CSV, pickle, Parquet, or Feather
+    format for distribution within the package and/or uploading to sites
+    (e.g., Kaggle). In the Parquet and Feather files, the rows for each 
+    week in the series form a separate row group (or record batch).
 
     PARAMETERS
     ----------
     file_format_u : str
-        Is either "CSV" or "PICKLE", indicating the desired save format.
+        Is "CSV", "PICKLE", "PARQUET", or "FEATHER", indicating the 
+        desired save format.
     """
 
     wfs_behaviors_records_df_for_distribution = cfg.behavs_act_df.rename(
@@ -305,6 +542,15 @@ def save_wfs_behaviors_records_df_as_csv_or_pickle_for_distribution(
             "Record Conf Mat": "record_conf_matrix_h",
         })
 
+    # Render the text of any Notes that were stored only as note codes.
+    wfs_behaviors_records_df_for_distribution["recorded_note_from_sup"] = \
+        rec.return_notes_with_note_codes_rendered_as_text(
+            wfs_behaviors_records_df_for_distribution[
+                "recorded_note_from_sup"].values,
+            wfs_behaviors_records_df_for_distribution["record_comptype"].values,
+            wfs_behaviors_records_df_for_distribution["sub_fname"].values,
+            )
+
     wfs_behaviors_records_df_for_distribution = \
         wfs_behaviors_records_df_for_distribution[[
             "sub_ID",
@@ -363,6 +609,20 @@ def save_wfs_behaviors_records_df_as_csv_or_pickle_for_distribution(
             "wfs_behaviors_and_records"
             )
 
+    elif file_format_u == "PARQUET":
+        save_df_to_parquet_file(
+            wfs_behaviors_records_df_for_distribution,
+            "wfs_behaviors_and_records",
+            "event_week_in_series",
+            )
+
+    elif file_format_u == "FEATHER":
+        save_df_to_feather_file(
+            wfs_behaviors_records_df_for_distribution,
+            "wfs_behaviors_and_records",
+            "event_week_in_series",
+            )
+
 
 # ██████████████████████████████████████████████████████████████████████
 # █                                                                    █
@@ -44,6 +44,17 @@ dataset_csv_for_download_url = None
 unique_file_prefix_code_for_simulation_run = None
 unique_file_suffix_code_for_simulation_run = None
 
+# The compression codecs used when the dataset of behaviors and records 
+# is exported in Parquet format (e.g., "zstd", "snappy", "gzip", or 
+# None) or in Feather (Arrow IPC) format ("zstd", "lz4", or None).
+PARQUET_EXPORT_COMPRESSION = "zstd"
+FEATHER_EXPORT_COMPRESSION = "zstd"
+
+# When a dataset is exported in Parquet or Feather format, each string 
+# column whose number of distinct values is at most this proportion of 
+# its number of non-null values is stored dictionary-encoded.
+COLUMNAR_EXPORT_DICTIONARY_ENCODING_MAX_UNIQUE_PRTN = 0.5
+
 # The main random seed used in modules.
 RANDOM_SEED_A = 99
 
@@ -56,8 +67,41 @@ STRENGTH_OF_EFFECT = 1.0
 # subjective estimate of workers' Efficacy.
 OEE_SYSTEM_IN_USE = False
 
+# If True, managers' daily records are generated by a batched engine 
+# that makes all of the day's random draws in a single NumPy call and 
+# fills the record columns using array operations. This is much faster
+# for large workforces, but it draws its random numbers in a different
+# order than the default row-by-row logic; the results for a given 
+# random seed will thus differ from those generated with the setting 
+# False.
+USE_BATCHED_RECORDING_ENGINE = False
+
+# If True, the Note added to each True Positive record is stored in 
+# behavs_act_df only as a small integer "note code" giving the indices 
+# of the phrases selected for it, and its text is rendered only when 
+# the dataset is exported. For a given random seed, the exported text is
+# identical to that stored when this is False, but much less memory is 
+# needed during the simulation.
+STORE_NOTES_AS_NOTE_CODES = False
+
+# If True, the daily modifiers to persons' probabilities and Efficacy 
+# levels are calculated for the whole active population at once by the 
+# struct-of-arrays engine in wfs_population, which makes all of the 
+# day's random draws for each modifier in a single NumPy call; the 
+# day's attendance, Efficacy, and behavior rolls are likewise made for 
+# all active persons at once by a batched kernel. As with the batched 
+# recording engine, the random numbers are drawn in a different order 
+# than by the default person-by-person logic, so the results for a 
+# given random seed will differ.
+USE_VECTORIZED_POPULATION_ENGINE = False
+
 EMP_ID_STARTING_VALUE = 0
 
+# The personal ID number that will be assigned to the next Person object
+# created. This is seeded from EMP_ID_STARTING_VALUE and incremented 
+# each time a person is created.
+next_per_id_to_assign = None
+
 # ======================================================================
 # Variables relating to simulation iteration date and time.
 # ======================================================================
@@ -127,9 +171,72 @@ day_of_sim_iter_for_first_simulated_day = None
 # is a separate person object of the Person class.
 persons = {}
 
+# The active roster: those persons in cfg.persons who haven't been 
+# separated from employment (with the same keys and in the same order 
+# as in cfg.persons). The daily phases of the simulation iterate over 
+# this rather than over cfg.persons.
+active_persons = {}
+
+# The key in cfg.persons (and cfg.active_persons) of each active person,
+# by the person's ID, so that a separated person can be removed from the
+# active roster without searching it.
+keys_of_active_persons_by_ID = {}
+
+# The archive of persons who have been separated from employment (with 
+# the same keys as in cfg.persons), which is only needed for final 
+# statistics and export.
+separated_persons = {}
+
+# Persons who were separated since persons' modified probabilities were
+# last reset to their base probabilities (and whose probabilities must 
+# thus be reset one final time).
+persons_separated_since_last_reset = []
+
+# An index of all persons in cfg.persons (including separated persons),
+# keyed by their ID number, which allows a person to be found in 
+# constant time.
+persons_by_ID = {}
+
+# Indexes of the active (i.e., non-separated) persons in each 
+# organizational unit: e.g., the Team Leader and Laborers of each team 
+# and the Laborers, Team Leaders, and Shift Manager of each shift. The 
+# indexes are updated directly whenever Laborers are swapped between 
+# teams or workers are separated and replaced, and are used to select 
+# candidates for swaps and to rebuild persons' supervisors, colleagues,
+# and subordinates.
+org_structure_indexes = None
+
+# Whether the organizational structure (or persons' relationships) has
+# changed since persons' relationships were last rebuilt.
+personal_relationships_need_rebuild = True
+
+# The titles of the teams and shifts whose active membership has 
+# changed (e.g., through swaps or separations) since the relationships 
+# of their members were last updated at the end of a day.
+teams_with_changed_membership = set()
+shifts_with_changed_membership = set()
+
+# The shared, array-backed store (a wfs_history.Persons_history_class 
+# object) of all persons' daily histories (e.g., the number of Ideas 
+# generated or Lapses recorded on each day).
+persons_history = None
+
+# The struct-of-arrays store (a wfs_population.Population_arrays_class 
+# object) of the stats and probabilities of all active persons, which 
+# is used if USE_VECTORIZED_POPULATION_ENGINE is True.
+population_arrays = None
+
 # A DataFrame containing selected attributes of all persons.
 persons_df = None
 
+# The simple summary statistics (a wfs_summary_stats.Summary_stats_class
+# object) calculated for behavs_act_df at the end of a simulation.
+summary_stats = None
+
+# The cache (a wfs_plot_data.Plot_data_cache_class object) of the 
+# aggregates from which plots of the current dataset are generated.
+plot_data_cache = None
+
 # The dictionary of roles, in which each entry (role)
 # is a separate role object of the Role class.
 roles = {}
@@ -361,10 +468,21 @@ pers_day_df = None
 # and visualizations).
 behavs_act_df_w_priming_period = None
 
-# This is the temporary *list* of behaviors (each as an individual DF) 
-# for a given day to be added to behavs_act_df in one step, after all 
-# of the behaviors for the day have been calculated.
-list_of_behavs_to_add_to_behavs_act_df = []
+# This is the temporary columnar buffer (a wfs_events.Event_buffer_class
+# object) of behaviors for a given day to be added to behavs_act_df in 
+# one step, after all of the behaviors for the day have been calculated.
+behavs_to_add_to_behavs_act_df_buffer = None
+
+# While the simulation is running, each day's behaviors are stored as a
+# separate DataFrame in this dict (keyed by the value of day_of_sim_iter
+# for the day), rather than being repeatedly concatenated with
+# behavs_act_df. The partitions are consolidated into behavs_act_df 
+# during the simulation's finalization steps.
+behavs_act_df_day_partitions = {}
+#
+# The DataFrame of behaviors generated on the current day, which is 
+# handed off directly from the behaviors stage to the records stage.
+behavs_act_df_for_current_day = None
 
 # The average of all *actual* Efficacy values recorded in the 
 # organization to date.
@@ -374,6 +492,15 @@ org_actual_eff_values_mean = 0.0
 # organization to date.
 org_recorded_eff_values_mean = 0.0
 
+# Running totals (stored as exact fractions) and counts of all actual 
+# and recorded Efficacy values generated in the organization to date, 
+# from which the two means above are calculated at the start of each 
+# day without revisiting every person's history.
+org_actual_eff_values_sum = 0
+org_actual_eff_values_count = 0
+org_recorded_eff_values_sum = 0
+org_recorded_eff_values_count = 0
+
 # ----------------------------------------------------------------------
 # Base rates for particular actions by personnel.
 # ----------------------------------------------------------------------
@@ -516,11 +643,43 @@ STRENGTH_OF_GOOD_TP_RECORD_IMPACT_ON_EFF = 0.07
 # over the following three days on his actual Efficacy behaviors.
 STRENGTH_OF_GOOD_FN_RECORD_IMPACT_ON_EFF = 0.1875
 
+# The number of days (including the current day) for which each person
+# keeps a running tally of the True Positive and False Negative records
+# of his Good behaviors. This must be at least 4, since the impact of
+# such records is felt on D+1 through D+3.
+NUM_OF_DAYS_IN_RECENT_GOOD_RECORDS_RING = 4
+
 # ======================================================================
 # Constants/variables relating to visualizations.
 # ======================================================================
 PLOT_FIGURE_DPI = 500
 PLOT_SAVEFIG_DPI = 500
+
+# The number of worker processes in which the plots created by 
+# generate_visualizations() are rendered in parallel (None = the number 
+# of CPUs). If this is 1, plots are rendered one after another in the 
+# main process.
+NUM_OF_PLOT_RENDERING_PROCESSES = None
+
+# While plots are being queued for parallel rendering, the list of the 
+# arguments with which each plot is to be rendered; otherwise, None.
+plot_rendering_jobs = None
+
+# The named render profiles with which plots can be rendered on demand,
+# each giving the DPI and the PNG compression level (0-9) to be used.
+PLOT_RENDER_PROFILES = {
+    "preview": {"dpi": 100, "png_compress_level": 1},
+    "web": {"dpi": 200, "png_compress_level": 6},
+    "print": {"dpi": 500, "png_compress_level": 9},
+    }
+
+# The render profile used for the plots displayed in the web interface.
+PLOT_RENDER_PROFILE_FOR_WEB_INTERFACE = "web"
+
+# Whether the web interface renders each plot only when it's first 
+# requested (and then caches it on disk), rather than rendering all of 
+# the plots as soon as a dataset has been simulated or loaded.
+RENDER_PLOTS_ON_DEMAND_IN_WEB_INTERFACE = True
 PLOT_FIGSIZE = (6.5, 3)
 PLOT_XY_LABEL_FONTSIZE = 7
 PLOT_XY_LABEL_PAD = 4
@@ -16,14 +16,15 @@ the program's interface can be accessed in a user's web browser.
 import os
 
 import uvicorn
-from fastapi import FastAPI, Request, Form
+from fastapi import FastAPI, Request, Form, HTTPException
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 
 # Import other modules from this package.
 import config as cfg
 import wfs_executor as exec
+import wfs_visualizer as vis
 import io_file_manager as iofm
 
 
@@ -45,8 +46,7 @@ def get_webpage(request: Request):
 
     # Delete any existing plots in the plots directory
     # that might remain from previous simulations.
-    for file in os.listdir(cfg.PLOTS_DIR):
-        os.remove(os.path.join(cfg.PLOTS_DIR, file))
+    iofm.delete_all_plots_from_plots_dir()
 
     # Display the initial webpage so that the user can provide input.
     # Pass the default values for variables to be updated by the user 
@@ -103,8 +103,7 @@ def post_webpage(
 
     # Delete any plots in the plots directory
     # that might remain from previous simulations.
-    for file in os.listdir(cfg.PLOTS_DIR):
-        os.remove(os.path.join(cfg.PLOTS_DIR, file))
+    iofm.delete_all_plots_from_plots_dir()
 
     # Delete any user-generated datasets in the datasets/user_generated
     # directory that might remain from previous simulations.
@@ -113,7 +112,21 @@ def post_webpage(
 
     # Reset selected variables to their factory-original state.
     cfg.persons = {}
+    cfg.persons_by_ID = {}
+    cfg.active_persons = {}
+    cfg.keys_of_active_persons_by_ID = {}
+    cfg.separated_persons = {}
+    cfg.persons_separated_since_last_reset = []
+    cfg.org_structure_indexes = None
+    cfg.personal_relationships_need_rebuild = True
+    cfg.teams_with_changed_membership = set()
+    cfg.shifts_with_changed_membership = set()
+    cfg.persons_history = None
+    cfg.population_arrays = None
+    cfg.next_per_id_to_assign = None
     cfg.persons_df = None
+    cfg.summary_stats = None
+    cfg.plot_data_cache = None
     cfg.roles = {}
     cfg.shifts = {}
     cfg.teams = {}
@@ -124,7 +137,9 @@ def post_webpage(
     cfg.behavs_act_df = None
     cfg.pers_day_df = None
     cfg.behavs_act_df_w_priming_period = None
-    cfg.list_of_behavs_to_add_to_behavs_act_df = []
+    cfg.behavs_to_add_to_behavs_act_df_buffer = None
+    cfg.behavs_act_df_day_partitions = {}
+    cfg.behavs_act_df_for_current_day = None
     cfg.plots_to_display_list = []
 
     # Update variables stored in config.py with the 
@@ -146,16 +161,28 @@ def post_webpage(
     cfg.BASE_RATE_RECORDING_ACCURACY = BASE_RATE_RECORDING_ACCURACY_from_form
 
     print("cfg.visualization_data_source: ", cfg.visualization_data_source)
+    # If plots are rendered on demand, none of them is rendered here; 
+    # each is rendered when the browser first requests its URL.
+    generate_visualizations = not cfg.RENDER_PLOTS_ON_DEMAND_IN_WEB_INTERFACE
     if cfg.visualization_data_source == "newly_generated_dataset":
-        exec.run_simulation_from_scratch_using_config_settings()
+        exec.run_simulation_from_scratch_using_config_settings(
+            generate_visualizations)
 
     elif cfg.visualization_data_source == "stored_dataset":
-        exec.load_saved_dataset_from_previous_simulation_run()
+        exec.load_saved_dataset_from_previous_simulation_run(
+            generate_visualizations)
         iofm.save_wfs_behaviors_records_df_as_csv_or_pickle_for_distribution(
             "CSV"
             )
 
-    cfg.plots_to_display_list = os.listdir(cfg.PLOTS_DIR)
+    if cfg.RENDER_PLOTS_ON_DEMAND_IN_WEB_INTERFACE:
+        cfg.plots_to_display_list = \
+            vis.return_urls_of_plots_rendered_on_demand(
+                cfg.PLOT_RENDER_PROFILE_FOR_WEB_INTERFACE)
+    else:
+        cfg.plots_to_display_list = [
+            "static/plots/" + file for file in os.listdir(cfg.PLOTS_DIR)
+            ]
     print("plots_to_display_list: ", cfg.plots_to_display_list)
 
     return templates.TemplateResponse(
@@ -187,6 +214,26 @@ def post_webpage(
         )
 
 
+@app.get('/plots/{dataset_id}/{render_profile}/{plot_name}.png')
+def get_plot(dataset_id: str, render_profile: str, plot_name: str):
+    """
+    Returns a plot for the current dataset, rendered with the given 
+    render profile. The plot is rendered only the first time that it's
+    requested; thereafter, the PNG file cached on disk is returned.
+    """
+
+    if (cfg.plot_data_cache is None) \
+            or (dataset_id != cfg.plot_data_cache.dataset_id) \
+            or (render_profile not in cfg.PLOT_RENDER_PROFILES) \
+            or (plot_name not in vis.PLOTS_FOR_DATASET):
+        raise HTTPException(status_code=404, detail="Plot not found")
+
+    return FileResponse(
+        vis.return_path_of_plot_rendered_on_demand(plot_name, render_profile),
+        media_type="image/png",
+        )
+
+
 # Run the app using uvicorn.
 if __name__ == '__main__':
     uvicorn.run("wfs_app:app", reload=True)
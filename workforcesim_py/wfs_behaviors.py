@@ -16,14 +16,17 @@ interpersonal interactions of workers in the factory.
 """
 
 from datetime import timedelta
+from fractions import Fraction
 import random
-import statistics
 
 import numpy as np
 import pandas as pd
 
 # Import other modules from this package.
 import config as cfg
+import wfs_events as events
+import wfs_population as popl
+import wfs_summary_stats as summ
 import wfs_utilities as utils
 
 
@@ -85,6 +88,11 @@ def configure_behavs_act_df():
     cfg.behavs_act_df["Note"] = None
     cfg.behavs_act_df["Record Conf Mat"] = None
 
+    # Create the (empty) buffer in which newly generated behaviors will
+    # be stored until they're added to behavs_act_df.
+    cfg.behavs_to_add_to_behavs_act_df_buffer = events.Event_buffer_class()
+    events.reset_behavs_act_df_day_partitions()
+
 
 def print_modified_probabilities_of_a_person(
     person_u, # Person object for the person whose stats should be printed
@@ -133,52 +141,21 @@ def print_modified_probabilities_of_a_person(
         )
 
 
-def add_one_behav_to_list_of_behavs_to_add_to_behavs_act_df(
-    person_object_u,
-    behavior_type_u,
-    behavior_subtype_u,
-    behavior_nature_u,
-    behavior_comptype_u,
-    eff_score_u,
-    include_record_u,
-    ):
+def return_subject_fields_for_behavs_act_df_row(person_object_u):
     """
-    Adds a particular behavior by a particular person (e.g., as
-    just generated by a daily behavior-generator) to behavs_act_df,
-    the master DF of all actual behaviors performed by persons
-    (including Absences). It copies into the behavs_act_df relevant
-    facts (e.g., the ID of a person's supervisor) as they exist
-    *in the moment of the behavior*, thereby creating a lasting
-    record of the circumstances in which the behavior occurred.
+    Returns a dict with the values of those columns of a behavs_act_df 
+    row that describe the subject who performed a behavior and his 
+    supervisor, as they exist *in the moment of the behavior*.
 
     PARAMETERS
     ----------
     person_object_u
         Person object for the person who performed the behavior
-    behavior_type_u : str
-        Behavior type
-    behavior_subtype_u : str
-        Behavior subtype
-    behavior_nature_u : str
-        Behavior nature
-    behavior_comptype_u : str
-        Behavior comptype
-    eff_score_u
-        The actual Efficacy (if relevant) demonstrated in the behavior
-    include_record_u
-        Whether to include a record (e.g., for a Separation or 
-        Onboarding event)
     """
 
-    # NOTE: This function originally immediately added each new behavior
-    # to behavs_act_df as a concatenated row, but that approach
-    # generated exponential copying effects tied to the number of days 
-    # in the sim. Now all of the rows are temporarily stored and all 
-    # added to the DataFrame in a single step at the end.
-
     # ------------------------------------------------------------------
     # Calculates the contents of columns containing data
-    # regarding the behavior performed and subject who performed it.
+    # regarding the subject who performed the behavior.
     # ------------------------------------------------------------------
 
     # Calculate the values of fields related to the subject's 
@@ -215,53 +192,115 @@ def add_one_behav_to_list_of_behavs_to_add_to_behavs_act_df(
     except TypeError:
         colleague_IDs_to_use = None
 
+    return {
+        "Sub ID": person_object_u.per_id,
+        "Sub First Name": person_object_u.f_name,
+        "Sub Last Name": person_object_u.l_name,
+        "Sub Age": person_object_u.age,
+        "Sub Sex": person_object_u.sex,
+        "Sub Shift": person_object_u.shift.title,
+        "Sub Team": person_object_u.team.title,
+        "Sub Role": person_object_u.role.title,
+        "Sub Colleague IDs": colleague_IDs_to_use,
+        "Sub Same-Sex Colleagues Prtn": \
+            person_object_u.colleagues_of_same_sex_prtn,
+        "Sub Health": person_object_u.stat_health,
+        "Sub Commitment": person_object_u.stat_commitment,
+        "Sub Perceptiveness": person_object_u.stat_perceptiveness,
+        "Sub Dexterity": person_object_u.stat_dexterity,
+        "Sub Sociality": person_object_u.stat_sociality,
+        "Sub Goodness": person_object_u.stat_goodness,
+        "Sub Strength": person_object_u.stat_strength,
+        "Sub Openmindedness": person_object_u.stat_openmindedness,
+        "Sub Workstyle": person_object_u.workstyle,
+        "Sup ID": sup_ID_to_use,
+        "Sup First Name": sup_fname_to_use,
+        "Sup Last Name": sup_lname_to_use,
+        "Sup Age": sup_age_to_use,
+        "Sup-Sub Age Difference": sup_sub_age_diff,
+        "Sup Sex": sup_sex_to_use,
+        "Sup Role": sup_role_to_use,
+        "Sup Commitment": sup_commitment_to_use,
+        "Sup Perceptiveness": sup_perceptiveness_to_use,
+        "Sup Goodness": sup_goodness_to_use,
+        }
+
+
+def return_date_fields_for_behavs_act_df_row():
+    """
+    Returns a dict with the values of those columns of a behavs_act_df 
+    row that describe the date and time of a behavior performed on the
+    current simulated day.
+    """
+
     # Calculate the value for the "Week in Series" column.
     week_in_series = utils.return_week_in_series_for_given_date(
         cfg.current_datetime_obj.date()
         )
 
-    behav_to_add_df = pd.DataFrame({
-        "Sub ID": [person_object_u.per_id],
-        "Sub First Name": [person_object_u.f_name],
-        "Sub Last Name": [person_object_u.l_name],
-        "Sub Age": [person_object_u.age],
-        "Sub Sex": [person_object_u.sex],
-        "Sub Shift": [person_object_u.shift.title],
-        "Sub Team": [person_object_u.team.title],
-        "Sub Role": [person_object_u.role.title],
-        "Sub Colleague IDs": [colleague_IDs_to_use],
-        "Sub Same-Sex Colleagues Prtn": \
-            [person_object_u.colleagues_of_same_sex_prtn],
-        "Sub Health": [person_object_u.stat_health],
-        "Sub Commitment": [person_object_u.stat_commitment],
-        "Sub Perceptiveness": [person_object_u.stat_perceptiveness],
-        "Sub Dexterity": [person_object_u.stat_dexterity],
-        "Sub Sociality": [person_object_u.stat_sociality],
-        "Sub Goodness": [person_object_u.stat_goodness],
-        "Sub Strength": [person_object_u.stat_strength],
-        "Sub Openmindedness": [person_object_u.stat_openmindedness],
-        "Sub Workstyle": [person_object_u.workstyle],
-        "Sup ID": [sup_ID_to_use],
-        "Sup First Name": [sup_fname_to_use],
-        "Sup Last Name": [sup_lname_to_use],
-        "Sup Age": [sup_age_to_use],
-        "Sup-Sub Age Difference": [sup_sub_age_diff],
-        "Sup Sex": [sup_sex_to_use],
-        "Sup Role": [sup_role_to_use],
-        "Sup Commitment": [sup_commitment_to_use],
-        "Sup Perceptiveness": [sup_perceptiveness_to_use],
-        "Sup Goodness": [sup_goodness_to_use],
-        "Event Datetime": [cfg.current_datetime_obj],
-        "Event Date": [cfg.current_datetime_obj.date()],
+    return {
+        "Event Datetime": cfg.current_datetime_obj,
+        "Event Date": cfg.current_datetime_obj.date(),
         "Week in Series": week_in_series,
-        "Day in Series (1-based)": [cfg.day_of_sim_iter + 1],
-        "Weekday Num": [cfg.current_datetime_obj.weekday()],
-        "Weekday Name": [cfg.current_datetime_obj.strftime("%A")],
-        "Behavior Type": [behavior_type_u],
-        "Behavior Comptype": [behavior_comptype_u],
-        "Behavior Nature": [behavior_nature_u],
-        "Actual Efficacy": [eff_score_u],
-        "Actual Efficacy (SD)": [eff_score_u],
+        "Day in Series (1-based)": cfg.day_of_sim_iter + 1,
+        "Weekday Num": cfg.current_datetime_obj.weekday(),
+        "Weekday Name": cfg.current_datetime_obj.strftime("%A"),
+        }
+
+
+def add_one_behav_to_list_of_behavs_to_add_to_behavs_act_df(
+    person_object_u,
+    behavior_type_u,
+    behavior_subtype_u,
+    behavior_nature_u,
+    behavior_comptype_u,
+    eff_score_u,
+    include_record_u,
+    ):
+    """
+    Adds a particular behavior by a particular person (e.g., as
+    just generated by a daily behavior-generator) to behavs_act_df,
+    the master DF of all actual behaviors performed by persons
+    (including Absences). It copies into the behavs_act_df relevant
+    facts (e.g., the ID of a person's supervisor) as they exist
+    *in the moment of the behavior*, thereby creating a lasting
+    record of the circumstances in which the behavior occurred.
+
+    PARAMETERS
+    ----------
+    person_object_u
+        Person object for the person who performed the behavior
+    behavior_type_u : str
+        Behavior type
+    behavior_subtype_u : str
+        Behavior subtype
+    behavior_nature_u : str
+        Behavior nature
+    behavior_comptype_u : str
+        Behavior comptype
+    eff_score_u
+        The actual Efficacy (if relevant) demonstrated in the behavior
+    include_record_u
+        Whether to include a record (e.g., for a Separation or 
+        Onboarding event)
+    """
+
+    # NOTE: This function originally immediately added each new behavior
+    # to behavs_act_df as a concatenated row, but that approach
+    # generated exponential copying effects tied to the number of days 
+    # in the sim. Now all of the rows are temporarily stored in a 
+    # columnar buffer (see wfs_events.py) and all added to the DataFrame
+    # in a single step at the end.
+
+    behav_to_add = return_subject_fields_for_behavs_act_df_row(
+        person_object_u)
+    behav_to_add.update(return_date_fields_for_behavs_act_df_row())
+    behav_to_add.update({
+        "Behavior Type": behavior_type_u,
+        "Behavior Comptype": behavior_comptype_u,
+        "Behavior Nature": behavior_nature_u,
+        "Actual Efficacy": eff_score_u,
+        "Actual Efficacy (SD)": eff_score_u,
         "Record Type": None,
         "Record Comptype": None,
         "Record Nature": None,
@@ -282,19 +321,19 @@ def add_one_behav_to_list_of_behavs_to_add_to_behavs_act_df(
     # cycle.)
     # ------------------------------------------------------------------
     if include_record_u is True:
-        if (behav_to_add_df["Behavior Type"].values[0] == "Separation") \
-            | (behav_to_add_df["Behavior Type"].values[0] == "Onboarding"):
+        if (behav_to_add["Behavior Type"] == "Separation") \
+            | (behav_to_add["Behavior Type"] == "Onboarding"):
 
             # Copy the main Behavior Type and Comptype fields
             # into the corresponding record fields.
-            behav_to_add_df["Record Type"].values[0] = \
-                behav_to_add_df["Behavior Type"].values[0]
-            behav_to_add_df["Record Comptype"].values[0] = \
-                behav_to_add_df["Behavior Comptype"].values[0]
+            behav_to_add["Record Type"] = \
+                behav_to_add["Behavior Type"]
+            behav_to_add["Record Comptype"] = \
+                behav_to_add["Behavior Comptype"]
 
             # The lack of a Note will be represented by an empty 
             # string ("") rather than a None value.
-            behav_to_add_df["Note"].values[0] = ""
+            behav_to_add["Note"] = ""
 
             # If the event was a Termination (and not a Resignation), 
             # then the event's type and cause should be noted in the 
@@ -311,18 +350,100 @@ def add_one_behav_to_list_of_behavs_to_add_to_behavs_act_df(
             #
             # Here, the event will thus have only a record component, 
             # not a behavior component.
-            if behav_to_add_df["Behavior Comptype"].values[0] \
+            if behav_to_add["Behavior Comptype"] \
                     == "Termination":
-                behav_to_add_df["Behavior Type"].values[0] = None
-                behav_to_add_df["Behavior Comptype"].values[0] = None
-                behav_to_add_df["Record Nature"].values[0] = \
-                    behav_to_add_df["Behavior Nature"].values[0]
-                behav_to_add_df["Behavior Nature"].values[0] = None
-
-    # Appends behav_to_add_df to the list of calculated behaviors
-    # (each as a separate DF) that will later all be added to
+                behav_to_add["Behavior Type"] = None
+                behav_to_add["Behavior Comptype"] = None
+                behav_to_add["Record Nature"] = \
+                    behav_to_add["Behavior Nature"]
+                behav_to_add["Behavior Nature"] = None
+
+    # Appends the behavior as a new row in the columnar buffer of
+    # calculated behaviors, whose rows will later all be added to
     # behavs_act_df in a single step.
-    cfg.list_of_behavs_to_add_to_behavs_act_df.append(behav_to_add_df)
+    cfg.behavs_to_add_to_behavs_act_df_buffer.append_row(behav_to_add)
+
+
+def reset_org_eff_values_accumulators():
+    """
+    Resets the running totals and counts of actual and recorded 
+    Efficacy values generated in the organization (e.g., before a new 
+    run of the simulation).
+    """
+
+    cfg.org_actual_eff_values_sum = 0
+    cfg.org_actual_eff_values_count = 0
+    cfg.org_recorded_eff_values_sum = 0
+    cfg.org_recorded_eff_values_count = 0
+
+
+def set_eff_value_of_person_for_current_day(
+    person_u,
+    eff_value_u,
+    actual_or_recorded_u,
+    ):
+    """
+    Stores a person's actual or recorded Efficacy value for the current
+    day in the relevant dictionary of the Person object and updates the 
+    organization-wide running total and count of such values.
+
+    PARAMETERS
+    ----------
+    person_u
+        The Person object whose Efficacy value should be stored
+    eff_value_u
+        The actual or recorded Efficacy value
+    actual_or_recorded_u : str
+        "actual" or "recorded"
+    """
+
+    if actual_or_recorded_u == "actual":
+        dict_of_eff_values = person_u.dict_days_with_actual_eff_values
+    else:
+        dict_of_eff_values = person_u.dict_days_with_recorded_eff_values
+
+    # Note! This presumes that a person can only have one Efficacy 
+    # value of each sort per day. The new value overwrites any existing 
+    # value for the day (which is thus removed from the running total).
+    sum_change = 0
+    count_change = 0
+    previous_eff_value = dict_of_eff_values[cfg.day_of_sim_iter]
+    if previous_eff_value is not None:
+        sum_change -= Fraction(previous_eff_value)
+        count_change -= 1
+    if eff_value_u is not None:
+        sum_change += Fraction(eff_value_u)
+        count_change += 1
+
+    dict_of_eff_values[cfg.day_of_sim_iter] = eff_value_u
+
+    if actual_or_recorded_u == "actual":
+        cfg.org_actual_eff_values_sum += sum_change
+        cfg.org_actual_eff_values_count += count_change
+    else:
+        cfg.org_recorded_eff_values_sum += sum_change
+        cfg.org_recorded_eff_values_count += count_change
+
+
+def return_mean_from_eff_values_accumulator(sum_u, count_u):
+    """
+    Returns the mean of a set of Efficacy values, given their running 
+    total and count (or None, if there are no values). Because the 
+    total is kept as an exact fraction, the result is identical to that
+    of statistics.mean() applied to the full list of values.
+
+    PARAMETERS
+    ----------
+    sum_u
+        The running total of the values
+    count_u : int
+        The number of values
+    """
+
+    if count_u == 0:
+        return None
+
+    return float(Fraction(sum_u) / count_u)
 
 
 def simulate_one_day_of_behaviors():
@@ -330,6 +451,10 @@ def simulate_one_day_of_behaviors():
     Simulates one day's worth of workers' actual behaviors.
     """
 
+    # Clear the previous day's batch of behaviors (which was handed off
+    # to the records stage).
+    cfg.behavs_act_df_for_current_day = None
+
     # If the current weekday is Sunday, skip ahead
     # without generating any behaviors for any workers.
     if cfg.current_datetime_obj.weekday() == 6:
@@ -341,61 +466,40 @@ def simulate_one_day_of_behaviors():
     # of behaviors occur.
     # ------------------------------------------------------------------
 
-    # Calculate the mean of all actual Eff values generated in the org 
-    # to date. Only include the values from the Eff-value dictionaries 
-    # up through the current date of the simulation (the later values 
-    # will be None).
-    list_of_all_actual_eff_values = []
-    for p in cfg.persons:
-        list_of_all_actual_eff_values.extend(
-            list(cfg.persons[p].dict_days_with_actual_eff_values.values())[0:(
-                cfg.day_of_sim_iter \
-                    - cfg.day_of_sim_iter_for_first_simulated_day
-                    )]
-                    )
-
-    try:
-        # Remove all None values from the list of actual Efficacy 
-        # values.
-        list_of_all_actual_eff_values \
-            = [v for v in list_of_all_actual_eff_values if v is not None]
-        cfg.org_actual_eff_values_mean = \
-            statistics.mean(list_of_all_actual_eff_values)
-    # This is the case at the start of the first simulated day, when the
-    # length of the list of generated values will have a length of 0.
-    except:
-        cfg.org_actual_eff_values_mean = None
-
-    # Calculate the mean of all Eff values recorded in the org to date.
-    list_of_all_recorded_eff_values = []
-    for p in cfg.persons:
-        list_of_all_recorded_eff_values.extend(
-            list(cfg.persons[p].dict_days_with_recorded_eff_values.values())[0:(
-                cfg.day_of_sim_iter \
-                    - cfg.day_of_sim_iter_for_first_simulated_day
-                    )]
-                    )
-    try:
-        # Remove all None values from the list of recorded Efficacy 
-        # values.
-        list_of_all_recorded_eff_values \
-            = [v for v in list_of_all_recorded_eff_values if v is not None]
-        cfg.org_recorded_eff_values_mean = \
-            statistics.mean(list_of_all_recorded_eff_values)
-    # This is the case at the start of the first simulated day, when the
-    # length of the list of generated values will have a length of 0.
-    except:
-        cfg.org_recorded_eff_values_mean = None
+    # Calculate the mean of all actual and recorded Eff values 
+    # generated in the org to date (i.e., through the previous day), 
+    # using the running totals that are updated whenever an Eff value is
+    # generated. At the start of the first simulated day, no values will
+    # have been generated yet, and the means will be None.
+    cfg.org_actual_eff_values_mean = \
+        return_mean_from_eff_values_accumulator(
+            cfg.org_actual_eff_values_sum,
+            cfg.org_actual_eff_values_count,
+            )
+    cfg.org_recorded_eff_values_mean = \
+        return_mean_from_eff_values_accumulator(
+            cfg.org_recorded_eff_values_sum,
+            cfg.org_recorded_eff_values_count,
+            )
 
     print(
         "   cfg.org_actual_eff_values_mean at start of day: ", 
         cfg.org_actual_eff_values_mean
         )
 
+    # ------------------------------------------------------------------
+    # If the vectorized population engine is in use, determine all 
+    # active persons' behaviors at once.
+    # ------------------------------------------------------------------
+    if cfg.USE_VECTORIZED_POPULATION_ENGINE is True:
+        simulate_one_day_of_behaviors_of_active_persons_batched()
+        store_buffered_behaviors_as_partition_for_current_day()
+        return
+
     # ------------------------------------------------------------------
     # Determine each person's behaviors.
     # ------------------------------------------------------------------
-    for p in cfg.persons:
+    for p in cfg.active_persons:
 
         # If a person is already separated from employment, no new
         # behaviors can be generated for that person.
@@ -445,27 +549,23 @@ def simulate_one_day_of_behaviors():
         # check to see if he generates one as a result of having had at 
         # least 1 Lapse and 1 Slip in the previous 4 days.
         else:
-            lapses_num_previous_4_days = 0
-            day_deltas = [-4, -3, -2, -1]
-            days_to_search \
-                = [cfg.day_of_sim_iter + delta for delta in day_deltas]
-            for day in days_to_search:
-                # Confirm that the sought day is within the simulated 
-                # range.
-                if day in cfg.persons[p].dict_days_with_num_of_lapse_behaviors:
-                    lapses_num_previous_4_days \
-                        += cfg.persons[p].dict_days_with_num_of_lapse_behaviors[day]
-
-            slips_num_previous_4_days = 0
-            day_deltas = [-4, -3, -2, -1]
-            days_to_search \
-                = [cfg.day_of_sim_iter + delta for delta in day_deltas]
-            for day in days_to_search:
-                # Confirm that the sought day is within the simulated 
-                # range.
-                if day in cfg.persons[p].dict_days_with_num_of_slip_behaviors:
-                    slips_num_previous_4_days \
-                        += cfg.persons[p].dict_days_with_num_of_slip_behaviors[day]
+            # (Days before the start of the simulated range contribute
+            # nothing to the sums.)
+            lapses_num_previous_4_days = \
+                cfg.persons_history.return_sums_of_counter_over_previous_days(
+                    cfg.persons[p].history_row,
+                    "lapse_behaviors",
+                    cfg.day_of_sim_iter,
+                    4,
+                    )
+
+            slips_num_previous_4_days = \
+                cfg.persons_history.return_sums_of_counter_over_previous_days(
+                    cfg.persons[p].history_row,
+                    "slip_behaviors",
+                    cfg.day_of_sim_iter,
+                    4,
+                    )
 
             # If the person has at least 1 Lapse and 1 Slip in the 
             # previous 4 days...
@@ -568,8 +668,11 @@ def simulate_one_day_of_behaviors():
             # Note! This presumes that a person can only generate one 
             # Efficacy behavior per day. The new value overwrites any 
             # existing value for the day.
-            cfg.persons[p].dict_days_with_actual_eff_values[cfg.day_of_sim_iter] \
-                = eff_sco_today
+            set_eff_value_of_person_for_current_day(
+                cfg.persons[p],
+                eff_sco_today,
+                "actual",
+                )
 
             # ----------------------------------------------------------
             # Calculate whether the person performs an Idea
@@ -684,16 +787,13 @@ def simulate_one_day_of_behaviors():
             # check to see if he generates one as a result of having had
             # 2 or more Lapses in the previous 4 days.
             else:
-                lapses_num_previous_4_days = 0
-                day_deltas = [-4, -3, -2, -1]
-                days_to_search = \
-                    [cfg.day_of_sim_iter + delta for delta in day_deltas]
-                for day in days_to_search:
-                    # Confirm that the sought day is within the 
-                    # simulated range.
-                    if day in cfg.persons[p].dict_days_with_num_of_lapse_behaviors:
-                        lapses_num_previous_4_days += \
-                            cfg.persons[p].dict_days_with_num_of_lapse_behaviors[day]
+                lapses_num_previous_4_days = \
+                    cfg.persons_history.return_sums_of_counter_over_previous_days(
+                        cfg.persons[p].history_row,
+                        "lapse_behaviors",
+                        cfg.day_of_sim_iter,
+                        4,
+                        )
 
                 # If the person has 2 or more Lapses in the previous 
                 # 4 days...
@@ -801,16 +901,13 @@ def simulate_one_day_of_behaviors():
             # behavior, check to see if he generates one as a result of 
             # having had 2 or more Teamworks in the previous 5 days.
             else:
-                teamworks_num_previous_5_days = 0
-                day_deltas = [-5, -4, -3, -2, -1]
-                days_to_search = \
-                    [cfg.day_of_sim_iter + delta for delta in day_deltas]
-                for day in days_to_search:
-                    # Confirm that the sought day is within the 
-                    # simulated range.
-                    if day in cfg.persons[p].dict_days_with_num_of_teamwork_behaviors:
-                        teamworks_num_previous_5_days += \
-                            cfg.persons[p].dict_days_with_num_of_teamwork_behaviors[day]
+                teamworks_num_previous_5_days = \
+                    cfg.persons_history.return_sums_of_counter_over_previous_days(
+                        cfg.persons[p].history_row,
+                        "teamwork_behaviors",
+                        cfg.day_of_sim_iter,
+                        5,
+                        )
 
                 # If the person has 2 or more Teamworks in the previous 
                 # 5 days...
@@ -853,40 +950,128 @@ def simulate_one_day_of_behaviors():
                     False,
                     )
 
-    # ------------------------------------------------------------------
-    # Concatenate behavs_act_df with the individual DFs for the day, 
-    # each of which is a one-row DF containing info on a particular 
-    # behavior. This can't be delayed further (to avoid exponential 
-    # copying), because it's needed in order to now calculate managers' 
-    # recordings for the given day.
-    # ------------------------------------------------------------------
+    store_buffered_behaviors_as_partition_for_current_day()
 
-    # If len(cfg.behavs_act_df) == 0, this is the first day to have been 
-    # simulated; simply concatenate all of this day's DFs to one 
-    # another.
-    if len(cfg.behavs_act_df) == 0:
-        list_of_dfs_to_concatenate \
-            = cfg.list_of_behavs_to_add_to_behavs_act_df
 
-    # If len(cfg.behavs_act_df) != 0, then that DF already contains one 
-    # or more days' worth of behaviors; concatenate all of this day's 
-    # new DFs to that existing cfg.behavs_act_df.
-    else:
-        list_of_dfs_to_concatenate = [cfg.behavs_act_df]
-        list_of_dfs_to_concatenate.extend(
-            cfg.list_of_behavs_to_add_to_behavs_act_df
+def store_buffered_behaviors_as_partition_for_current_day():
+    """
+    Stores the rows for the day's behaviors that have accumulated in 
+    the buffer as a single DataFrame: the partition for this day. This 
+    can't be delayed further, because it's needed in order to now 
+    calculate managers' recordings for the given day. (The day 
+    partitions are only concatenated to form behavs_act_df once, at 
+    the end of the simulation, to avoid repeatedly copying the full DF.)
+    """
+
+    days_behavs_df = cfg.behavs_to_add_to_behavs_act_df_buffer.return_df()
+    events.add_day_partition_to_behavs_act_df(days_behavs_df)
+
+    # Hand off the day's behaviors directly to the records stage, which
+    # only needs to process the current day's batch.
+    cfg.behavs_act_df_for_current_day = days_behavs_df
+
+    # Having stored all of the day's behaviors, empty the buffer.
+    cfg.behavs_to_add_to_behavs_act_df_buffer.clear()
+
+
+def simulate_one_day_of_behaviors_of_active_persons_batched():
+    """
+    Simulates one day's worth of the actual behaviors of all active 
+    persons using the batched kernel in wfs_population, which makes all 
+    of the day's attendance, Efficacy, and behavior rolls at once. The 
+    resulting behaviors are added to the buffer in a single step, in 
+    the same order (by person, and then by type of behavior) in which 
+    they'd be generated one at a time.
+    """
+
+    rolls = popl.return_behavior_rolls_for_active_persons()
+    persons = cfg.population_arrays.persons
+    history_rows = cfg.population_arrays.history_row
+
+    # ------------------------------------------------------------------
+    # Update the Person objects and the daily histories.
+    # ------------------------------------------------------------------
+    for i, eff_sco_today in zip(
+        rolls["Presence"].tolist(), rolls["Efficacy"].tolist()):
+        persons[i].days_attended += 1
+        set_eff_value_of_person_for_current_day(
+            persons[i],
+            eff_sco_today,
+            "actual",
             )
 
-    if list_of_dfs_to_concatenate != []:
-        cfg.behavs_act_df = pd.concat(
-            list_of_dfs_to_concatenate,
-            ignore_index=True,
-            axis=0,
+    for comptype, counter in [
+        ("Idea", "idea_behaviors"),
+        ("Lapse", "lapse_behaviors"),
+        ("Slip", "slip_behaviors"),
+        ("Teamwork", "teamwork_behaviors"),
+        ]:
+        cfg.persons_history.increment_counter_for_day(
+            history_rows[rolls[comptype]],
+            counter,
+            cfg.day_of_sim_iter,
             )
 
-    # Having added all of the day's behaviors to behavs_act_df,
-    # reset this to an empty list.
-    cfg.list_of_behavs_to_add_to_behavs_act_df = []
+    # ------------------------------------------------------------------
+    # Assemble the rows for all of the day's behaviors. Each segment 
+    # gives (order of the behavior within a person's day, behavior 
+    # type, behavior comptype, indices of persons, Efficacy values).
+    # ------------------------------------------------------------------
+    segments = [
+        (0, "Attendance", "Absence", rolls["Absence"], None),
+        (0, "Attendance", "Presence", rolls["Presence"], None),
+        (1, "Efficacy", "Efficacy", rolls["Presence"], rolls["Efficacy"]),
+        ]
+    for order, (comptype, behavior_type, _) in enumerate(
+        popl.BEHAVIORS_ROLLED_DAILY, start=2):
+        segments.append(
+            (order, behavior_type, comptype, rolls[comptype], None))
+
+    num_of_rows = sum(len(idx) for _, _, _, idx, _ in segments)
+    if num_of_rows == 0:
+        return
+
+    person_idx = np.concatenate([idx for _, _, _, idx, _ in segments])
+    order_keys = np.concatenate(
+        [np.full(len(idx), order) for order, _, _, idx, _ in segments])
+    behavior_types = np.empty(num_of_rows, dtype=object)
+    behavior_comptypes = np.empty(num_of_rows, dtype=object)
+    eff_scores = np.empty(num_of_rows, dtype=object)
+    j = 0
+    for _, behavior_type, comptype, idx, eff_values in segments:
+        behavior_types[j:j + len(idx)] = behavior_type
+        behavior_comptypes[j:j + len(idx)] = comptype
+        if eff_values is not None:
+            eff_scores[j:j + len(idx)] = eff_values.tolist()
+        j += len(idx)
+
+    # Put the rows in order by person, and then by type of behavior.
+    sort_order = np.lexsort((order_keys, person_idx))
+    person_idx = person_idx[sort_order]
+
+    # Calculate the subject-related fields once for each person who 
+    # performed a behavior, and then spread them across his rows.
+    persons_involved = np.unique(person_idx)
+    position_of_person = np.searchsorted(persons_involved, person_idx)
+    subject_fields = [
+        return_subject_fields_for_behavs_act_df_row(persons[i]) \
+            for i in persons_involved.tolist()
+        ]
+
+    cols_values = return_date_fields_for_behavs_act_df_row()
+    for col in subject_fields[0]:
+        values_for_persons = np.empty(len(subject_fields), dtype=object)
+        for k, fields in enumerate(subject_fields):
+            values_for_persons[k] = fields[col]
+        cols_values[col] = values_for_persons[position_of_person]
+
+    cols_values["Behavior Type"] = behavior_types[sort_order]
+    cols_values["Behavior Comptype"] = behavior_comptypes[sort_order]
+    cols_values["Actual Efficacy"] = eff_scores[sort_order]
+    cols_values["Actual Efficacy (SD)"] = eff_scores[sort_order]
+
+    cfg.behavs_to_add_to_behavs_act_df_buffer.append_rows(
+        cols_values, num_of_rows)
 
 
 def calculate_metrics_for_persons_in_retained_simulated_period():
@@ -896,52 +1081,67 @@ def calculate_metrics_for_persons_in_retained_simulated_period():
     that is retained for analysis (excluding any priming period).
     """
 
-    for p in cfg.persons:
+    # ------------------------------------------------------------------
+    # Calculate the metrics for all persons in a single grouped 
+    # aggregation, rather than filtering the full behaviors DF once for 
+    # each person. The Good, Poor, and Presence behaviors are first 
+    # flagged in columns of their own, so that counting them is simply 
+    # a matter of summing each column within each group.
+    # ------------------------------------------------------------------
+    behavs_act_df_for_metrics = pd.DataFrame({
+        "Sub ID": cfg.behavs_act_df["Sub ID"].values,
+        "Actual Efficacy": cfg.behavs_act_df["Actual Efficacy"].values,
+        "Presence": \
+            (cfg.behavs_act_df["Behavior Comptype"] == "Presence").values,
+        "Good": (cfg.behavs_act_df["Behavior Type"] == "Good").values,
+        "Poor": (cfg.behavs_act_df["Behavior Type"] == "Poor").values,
+        })
 
-        # Prepare a DataFrame containing only the behaviors for the 
-        # given person.
-        behavs_act_df_this_pers = utils.return_df_with_rows_filtered_to_one_val_in_col(
-            cfg.behavs_act_df,
-            "Sub ID",
-            cfg.persons[p].per_id,
-            )
+    # NOTE! These really shouldn't be thought of as "scores". 
+    # They're actual behaviors.
+    #
+    # (The standard deviations are calculated group by group with 
+    # Series.std(), as the grouped "std" aggregation uses a different 
+    # algorithm that can differ from it in the last digit.)
+    metrics_df = behavs_act_df_for_metrics.groupby("Sub ID").agg(
+        days_present=("Presence", "sum"),
+        eff_bhv_act_min=("Actual Efficacy", "min"),
+        eff_bhv_act_max=("Actual Efficacy", "max"),
+        eff_bhv_act_mean=("Actual Efficacy", "mean"),
+        eff_bhv_act_sd=("Actual Efficacy", pd.Series.std),
+        good_count=("Good", "sum"),
+        poor_count=("Poor", "sum"),
+        )
+
+    # A person may have no behaviors at all in the retained period 
+    # (e.g., if he was separated during the priming period); his counts
+    # are 0 and his Efficacy metrics NaN.
+    metrics_df = metrics_df.reindex(
+        [cfg.persons[p].per_id for p in cfg.persons]
+        )
+    metrics_df[["days_present", "good_count", "poor_count"]] = \
+        metrics_df[["days_present", "good_count", "poor_count"]] \
+            .fillna(0).astype(np.int64)
 
-        try:
-            days_present = \
-                behavs_act_df_this_pers["Behavior Comptype"].value_counts()["Presence"]
-        except:
-            days_present = 0
-
-        # NOTE! These really shouldn't be thought of as "scores". 
-        # They're actual behaviors.
-        eff_bhv_act_min = behavs_act_df_this_pers["Actual Efficacy"].min()
-        eff_bhv_act_max = behavs_act_df_this_pers["Actual Efficacy"].max()
-        eff_bhv_act_mean = behavs_act_df_this_pers["Actual Efficacy"].mean()
-        eff_bhv_act_sd = behavs_act_df_this_pers["Actual Efficacy"].std()
-
-        # NOTE! This will generate an error if there *aren't* any Good 
-        # or Poor behaviors in the dataset -- which is possible, if the 
-        # number of persons or number of days simulated is very small.
-        try:
-            good_count \
-                = behavs_act_df_this_pers["Behavior Type"].value_counts()["Good"]
-        except:
-            good_count = 0
-        try:
-            poor_count \
-                = behavs_act_df_this_pers["Behavior Type"].value_counts()["Poor"]
-        except:
-            poor_count = 0
-
-        # print("person", str(p), min_eff_sco, mean_eff_sco, max_eff_sco)
-
-        cfg.persons[p].days_attended = days_present
-        cfg.persons[p].eff_bhv_act_min = eff_bhv_act_min
-        cfg.persons[p].eff_bhv_act_max = eff_bhv_act_max
-        cfg.persons[p].eff_bhv_act_mean = eff_bhv_act_mean
-        cfg.persons[p].eff_bhv_act_sd = eff_bhv_act_sd
-        cfg.persons[p].good_act_num = good_count
-        cfg.persons[p].poor_act_num = poor_count
+    # ------------------------------------------------------------------
+    # Write the metrics back to the Person objects.
+    # ------------------------------------------------------------------
+    days_present = metrics_df["days_present"].values
+    eff_bhv_act_min = metrics_df["eff_bhv_act_min"].values
+    eff_bhv_act_max = metrics_df["eff_bhv_act_max"].values
+    eff_bhv_act_mean = metrics_df["eff_bhv_act_mean"].values
+    eff_bhv_act_sd = metrics_df["eff_bhv_act_sd"].values
+    good_count = metrics_df["good_count"].values
+    poor_count = metrics_df["poor_count"].values
+
+    for i, p in enumerate(cfg.persons):
+        cfg.persons[p].days_attended = days_present[i]
+        cfg.persons[p].eff_bhv_act_min = eff_bhv_act_min[i]
+        cfg.persons[p].eff_bhv_act_max = eff_bhv_act_max[i]
+        cfg.persons[p].eff_bhv_act_mean = eff_bhv_act_mean[i]
+        cfg.persons[p].eff_bhv_act_sd = eff_bhv_act_sd[i]
+        cfg.persons[p].good_act_num = good_count[i]
+        cfg.persons[p].poor_act_num = poor_count[i]
 
 
 def return_behavs_act_df_for_person_for_DpmN(
@@ -980,6 +1180,75 @@ def return_behavs_act_df_for_person_for_DpmN(
     return temp_df
 
 
+def add_good_record_to_recent_good_records_ring_of_person(
+    person_u,
+    conf_mat_u,
+    ):
+    """
+    Increments the current day's tally of True Positive or False 
+    Negative records of Good behaviors in a person's ring buffer of 
+    recent Good records.
+
+    PARAMETERS
+    ----------
+    person_u
+        The Person object whose Good behavior was (or wasn't) recorded
+    conf_mat_u : str
+        "True Positive" or "False Negative"
+    """
+
+    ring_slot = person_u.recent_good_records_ring[
+        cfg.day_of_sim_iter % len(person_u.recent_good_records_ring)
+        ]
+
+    # If the slot still holds the tallies for an earlier day, reuse it 
+    # for the current day.
+    if ring_slot[0] != cfg.day_of_sim_iter:
+        ring_slot[0] = cfg.day_of_sim_iter
+        ring_slot[1] = 0
+        ring_slot[2] = 0
+
+    if conf_mat_u == "True Positive":
+        ring_slot[1] += 1
+    elif conf_mat_u == "False Negative":
+        ring_slot[2] += 1
+
+
+def return_num_of_good_records_of_person_on_day(
+    person_u,
+    day_of_sim_iter_u,
+    conf_mat_u,
+    ):
+    """
+    Returns the number of True Positive or False Negative records of 
+    Good behaviors that a person received on a given (recent) day.
+
+    PARAMETERS
+    ----------
+    person_u
+        The Person object whose records should be counted
+    day_of_sim_iter_u : int
+        The day_of_sim_iter value of the day to check; this must be 
+        within the last NUM_OF_DAYS_IN_RECENT_GOOD_RECORDS_RING days
+    conf_mat_u : str
+        "True Positive" or "False Negative"
+    """
+
+    ring_slot = person_u.recent_good_records_ring[
+        day_of_sim_iter_u % len(person_u.recent_good_records_ring)
+        ]
+
+    # If the slot doesn't hold the tallies for the given day, the person
+    # received no such records on that day.
+    if ring_slot[0] != day_of_sim_iter_u:
+        return 0
+
+    if conf_mat_u == "True Positive":
+        return ring_slot[1]
+    elif conf_mat_u == "False Negative":
+        return ring_slot[2]
+
+
 def return_eff_modifier_for_impact_of_previous_recordings_on_bhv_of_person_today(
     person_u, # the Person object whose behavior may be impacted
     ):
@@ -997,127 +1266,43 @@ def return_eff_modifier_for_impact_of_previous_recordings_on_bhv_of_person_today
 
     # ------------------------------------------------------------------
     # Get any Eff modifier component resulting from accurately recorded
-    # (True Positive) Idea, Feat, Teamwork, or Sacrifice behavior
-    # in recent days.
+    # (True Positive) or inaccurately recorded (False Negative) Idea, 
+    # Feat, Teamwork, or Sacrifice behavior in recent days. The numbers 
+    # of such records are read from the person's ring buffer of recent 
+    # Good records, which is updated as records are generated.
     # ------------------------------------------------------------------
 
     # Initialize these values.
     num_TP_recs_Dm3_good = 0.0
     num_TP_recs_Dm2_good = 0.0
     num_TP_recs_Dm1_good = 0.0
-
-    # Create a DF with just True Positive behaviors for the person in 
-    # question.
-    temp_df = utils.return_df_with_rows_filtered_to_one_val_in_col(
-        cfg.behavs_act_df,
-        "Sub ID",
-        person_u.per_id,
-        )
-    temp_df_TP_good = temp_df[ 
-        (temp_df["Behavior Type"] == "Good") \
-        & (temp_df["Record Conf Mat"] == "True Positive")
-        ]
-
-    # Check for an accurately recorded behavior of the given type
-    # on D-3. Only run this check if the current day of the simulation
-    # is day 4 or later.
-    if cfg.day_of_sim_iter >= 4:
-        target_datetime = cfg.current_datetime_obj + timedelta(days = -3)
-        temp_df_TP_good_this_day \
-            = utils.return_df_with_rows_filtered_to_one_val_in_col(
-                temp_df_TP_good,
-                "Event Datetime",
-                target_datetime,
-                )
-        num_TP_recs_Dm3_good = len(temp_df_TP_good_this_day)
-
-    # Check for an accurately recorded behavior of the given type
-    # on D-2. Only run this check if the current day of the simulation
-    # is day 3 or later.
-    if cfg.day_of_sim_iter >= 3:
-        target_datetime = cfg.current_datetime_obj + timedelta(days = -2)
-        temp_df_TP_good_this_day \
-            = utils.return_df_with_rows_filtered_to_one_val_in_col(
-                temp_df_TP_good,
-                "Event Datetime",
-                target_datetime,
-                )
-        num_TP_recs_Dm2_good = len(temp_df_TP_good_this_day)
-
-    # Check for an accurately recorded behavior of the given type
-    # on D-1. Only run this check if the current day of the simulation
-    # is day 2 or later.
-    if cfg.day_of_sim_iter >= 2:
-        target_datetime = cfg.current_datetime_obj + timedelta(days = -1)
-        temp_df_TP_good_this_day \
-            = utils.return_df_with_rows_filtered_to_one_val_in_col(
-                temp_df_TP_good,
-                "Event Datetime",
-                target_datetime,
-                )
-        num_TP_recs_Dm1_good = len(temp_df_TP_good_this_day)
-
-    # ------------------------------------------------------------------
-    # Get any Eff modifier component resulting from inaccurately 
-    # recorded (False Negative) Idea, Feat, Teamwork, or Sacrifice 
-    # behavior in recent days.
-    # ------------------------------------------------------------------
-
-    # Initialize these values.
     num_FN_recs_Dm3_good = 0.0
     num_FN_recs_Dm2_good = 0.0
     num_FN_recs_Dm1_good = 0.0
 
-    # Create a DF with just False Negative behaviors for the person in 
-    # question.
-    temp_df = utils.return_df_with_rows_filtered_to_one_val_in_col(
-        cfg.behavs_act_df,
-        "Sub ID",
-        person_u.per_id,
-        )
-    temp_df_FN_good = temp_df[ 
-        (temp_df["Behavior Type"] == "Good") \
-        & (temp_df["Record Conf Mat"] == "False Negative")
-        ]
-
-    # Check for an inaccurately recorded behavior of the given type
-    # on D-3. Only run this check if the current day of the simulation
-    # is day 4 or later.
+    # Check for records on D-3. Only run this check if the current day 
+    # of the simulation is day 4 or later.
     if cfg.day_of_sim_iter >= 4:
-        target_datetime = cfg.current_datetime_obj + timedelta(days = -3)
-        temp_df_FN_good_this_day \
-            = utils.return_df_with_rows_filtered_to_one_val_in_col(
-                temp_df_FN_good,
-                "Event Datetime",
-                target_datetime,
-                )
-        num_FN_recs_Dm3_good = len(temp_df_FN_good_this_day)
+        num_TP_recs_Dm3_good = return_num_of_good_records_of_person_on_day(
+            person_u, cfg.day_of_sim_iter - 3, "True Positive")
+        num_FN_recs_Dm3_good = return_num_of_good_records_of_person_on_day(
+            person_u, cfg.day_of_sim_iter - 3, "False Negative")
 
-    # Check for an inaccurately recorded behavior of the given type
-    # on D-2. Only run this check if the current day of the simulation
-    # is day 3 or later.
+    # Check for records on D-2. Only run this check if the current day 
+    # of the simulation is day 3 or later.
     if cfg.day_of_sim_iter >= 3:
-        target_datetime = cfg.current_datetime_obj + timedelta(days = -2)
-        temp_df_FN_good_this_day \
-            = utils.return_df_with_rows_filtered_to_one_val_in_col(
-                temp_df_FN_good,
-                "Event Datetime",
-                target_datetime,
-                )
-        num_FN_recs_Dm2_good = len(temp_df_FN_good_this_day)
+        num_TP_recs_Dm2_good = return_num_of_good_records_of_person_on_day(
+            person_u, cfg.day_of_sim_iter - 2, "True Positive")
+        num_FN_recs_Dm2_good = return_num_of_good_records_of_person_on_day(
+            person_u, cfg.day_of_sim_iter - 2, "False Negative")
 
-    # Check for an inaccurately recorded behavior of the given type
-    # on D-1. Only run this check if the current day of the simulation
-    # is day 2 or later.
+    # Check for records on D-1. Only run this check if the current day 
+    # of the simulation is day 2 or later.
     if cfg.day_of_sim_iter >= 2:
-        target_datetime = cfg.current_datetime_obj + timedelta(days = -1)
-        temp_df_FN_good_this_day \
-            = utils.return_df_with_rows_filtered_to_one_val_in_col(
-                temp_df_FN_good,
-                "Event Datetime",
-                target_datetime,
-                )
-        num_FN_recs_Dm1_good = len(temp_df_FN_good_this_day)
+        num_TP_recs_Dm1_good = return_num_of_good_records_of_person_on_day(
+            person_u, cfg.day_of_sim_iter - 1, "True Positive")
+        num_FN_recs_Dm1_good = return_num_of_good_records_of_person_on_day(
+            person_u, cfg.day_of_sim_iter - 1, "False Negative")
 
     # ------------------------------------------------------------------
     # Calculate the overall modifier.
@@ -1146,11 +1331,13 @@ def display_simple_behavior_statistics():
     simulation.
     """
 
+    summary_stats = summ.return_summary_stats()
+
     # Get the number of Good and Poor behaviors (per person per day).
-    behavs_good_num = \
-        cfg.behavs_act_df["Behavior Type"].value_counts()["Good"]
-    behavs_poor_num = \
-        cfg.behavs_act_df["Behavior Type"].value_counts()["Poor"]
+    behavs_good_num = summary_stats.return_count(
+        summary_stats.behavior_type_counts, "Good")
+    behavs_poor_num = summary_stats.return_count(
+        summary_stats.behavior_type_counts, "Poor")
 
     behavs_good_num_per_pers_per_day = \
         behavs_good_num \
@@ -1173,15 +1360,11 @@ def display_simple_behavior_statistics():
         )
 
     # Get the number of Resignations of various types.
-    temp_df = cfg.behavs_act_df.copy()
-    temp_df = temp_df[ temp_df["Behavior Comptype"] == "Resignation"]
-    print( temp_df["Behavior Nature"].value_counts() )
+    print(summary_stats.resignation_nature_counts)
 
     # Get the number of Terminations of various types (technically
     # these are records rather than behaviors).
-    temp_df = cfg.behavs_act_df.copy()
-    temp_df = temp_df[ temp_df["Record Comptype"] == "Termination"]
-    print( temp_df["Record Nature"].value_counts() )
+    print(summary_stats.termination_nature_counts)
 
 
 # ██████████████████████████████████████████████████████████████████████
@@ -0,0 +1,322 @@
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   Synaptans WorkforceSim™ is open-source software for simulating   ║
+# ║   the complex dynamics of a factory workforce.                     ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden • ©2021-23 NeuraXenetica LLC     ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+"""
+This module defines the columnar buffer in which newly generated
+behaviors and events are stored before being added to behavs_act_df.
+Rather than creating a separate one-row DataFrame for each behavior,
+the values of each column are written into a growable NumPy array, and
+a DataFrame is only constructed when one is actually requested. The
+module also manages the per-day partitions in which behaviors are kept
+until they're consolidated into behavs_act_df at the end of a run.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Import other modules from this package.
+import config as cfg
+
+
+# ----------------------------------------------------------------------
+# The columns (and their dtypes) of the rows stored in an event buffer.
+# These match the columns created by configure_behavs_act_df(). Columns
+# that may contain None values (or lists, Role objects, etc.) are
+# stored with the "object" dtype, so that the None values are preserved
+# exactly as they would be in a DataFrame built from individual rows.
+# ----------------------------------------------------------------------
+
+BEHAVS_ACT_DF_COLS_AND_DTYPES = [
+    ("Sub ID", np.int64),
+    ("Sub First Name", object),
+    ("Sub Last Name", object),
+    ("Sub Age", np.int64),
+    ("Sub Sex", object),
+    ("Sub Shift", object),
+    ("Sub Team", object),
+    ("Sub Role", object),
+    ("Sub Colleague IDs", object),
+    ("Sub Same-Sex Colleagues Prtn", object),
+    ("Sub Health", np.float64),
+    ("Sub Commitment", np.float64),
+    ("Sub Perceptiveness", np.float64),
+    ("Sub Dexterity", np.float64),
+    ("Sub Sociality", np.float64),
+    ("Sub Goodness", np.float64),
+    ("Sub Strength", np.float64),
+    ("Sub Openmindedness", np.float64),
+    ("Sub Workstyle", object),
+    ("Sup ID", object),
+    ("Sup First Name", object),
+    ("Sup Last Name", object),
+    ("Sup Age", object),
+    ("Sup-Sub Age Difference", object),
+    ("Sup Sex", object),
+    ("Sup Role", object),
+    ("Sup Commitment", object),
+    ("Sup Perceptiveness", object),
+    ("Sup Goodness", object),
+    ("Event Datetime", "datetime64[ns]"),
+    ("Event Date", object),
+    ("Week in Series", np.int64),
+    ("Day in Series (1-based)", np.int64),
+    ("Weekday Num", np.int64),
+    ("Weekday Name", object),
+    ("Behavior Type", object),
+    ("Behavior Comptype", object),
+    ("Behavior Nature", object),
+    ("Actual Efficacy", object),
+    ("Actual Efficacy (SD)", object),
+    ("Record Type", object),
+    ("Record Comptype", object),
+    ("Record Nature", object),
+    ("Recorded Efficacy", object),
+    ("Note", object),
+    ("Record Conf Mat", object),
+    ]
+
+# The number of rows for which space is initially reserved in a new
+# buffer. Whenever the buffer is full, its capacity is doubled.
+EVENT_BUFFER_INITIAL_CAPACITY = 1024
+
+
+class Event_buffer_class:
+    """
+    An append-only, columnar store of behavior/event rows. Each column
+    is held as a NumPy array whose capacity grows geometrically, so
+    that appending a row takes (amortized) constant time.
+    """
+
+    def __init__(self,
+        cols_and_dtypes_u=None,
+        initial_capacity_u=EVENT_BUFFER_INITIAL_CAPACITY,
+        ):
+        """
+        Creates an empty buffer.
+
+        PARAMETERS
+        ----------
+        cols_and_dtypes_u : list
+            A list of (column name, dtype) tuples; by default, the
+            columns of behavs_act_df
+        initial_capacity_u : int
+            The number of rows for which space is initially reserved
+        """
+
+        if cols_and_dtypes_u is None:
+            cols_and_dtypes_u = BEHAVS_ACT_DF_COLS_AND_DTYPES
+
+        self.cols_and_dtypes = list(cols_and_dtypes_u)
+        self.cols = [c for c, _ in self.cols_and_dtypes]
+        self.capacity = max(int(initial_capacity_u), 1)
+        self.num_of_rows = 0
+        self.arrays = {
+            col: np.empty(self.capacity, dtype=dtype)
+            for col, dtype in self.cols_and_dtypes
+            }
+
+    def __len__(self):
+        return self.num_of_rows
+
+    def grow_capacity(self):
+        """
+        Doubles the capacity of every column array, copying over the
+        rows that have already been stored.
+        """
+
+        new_capacity = self.capacity * 2
+        for col, dtype in self.cols_and_dtypes:
+            new_array = np.empty(new_capacity, dtype=dtype)
+            new_array[:self.num_of_rows] = \
+                self.arrays[col][:self.num_of_rows]
+            self.arrays[col] = new_array
+        self.capacity = new_capacity
+
+    def append_row(self, row_values_u):
+        """
+        Appends a single row to the buffer and returns its index.
+
+        PARAMETERS
+        ----------
+        row_values_u : dict
+            A dict whose keys are column names; any column not present
+            in the dict receives a None value
+        """
+
+        if self.num_of_rows == self.capacity:
+            self.grow_capacity()
+
+        i = self.num_of_rows
+        for col in self.cols:
+            self.arrays[col][i] = row_values_u.get(col)
+        self.num_of_rows += 1
+
+        return i
+
+    def append_rows(self, cols_values_u, num_of_rows_u):
+        """
+        Appends a batch of rows to the buffer in a single step and 
+        returns the indices of the new rows (as a range).
+
+        PARAMETERS
+        ----------
+        cols_values_u : dict
+            A dict whose keys are column names and whose values are 
+            either arrays of length num_of_rows_u or single values to 
+            be used for all of the new rows; any column not present in 
+            the dict receives None values
+        num_of_rows_u : int
+            The number of rows to append
+        """
+
+        while self.num_of_rows + num_of_rows_u > self.capacity:
+            self.grow_capacity()
+
+        start = self.num_of_rows
+        stop = start + num_of_rows_u
+        for col in self.cols:
+            self.arrays[col][start:stop] = cols_values_u.get(col)
+        self.num_of_rows = stop
+
+        return range(start, stop)
+
+    def return_df(self, start_u=0, stop_u=None):
+        """
+        Returns a new DataFrame containing (a copy of) the rows stored
+        in the buffer, optionally restricted to a given range of rows.
+
+        PARAMETERS
+        ----------
+        start_u : int
+            The index of the first row to include
+        stop_u : int
+            The index after the last row to include (by default, the
+            number of rows in the buffer)
+        """
+
+        if stop_u is None:
+            stop_u = self.num_of_rows
+
+        return pd.DataFrame(
+            {col: self.arrays[col][start_u:stop_u].copy() for col in self.cols},
+            columns=self.cols,
+            )
+
+    def clear(self):
+        """
+        Empties the buffer (while retaining its current capacity).
+        Object columns are reset so that they don't keep references to
+        values from discarded rows.
+        """
+
+        for col, dtype in self.cols_and_dtypes:
+            if self.arrays[col].dtype == object:
+                self.arrays[col][:self.num_of_rows] = None
+        self.num_of_rows = 0
+
+
+# ----------------------------------------------------------------------
+# The functions below manage the storage of behaviors during a run of
+# the simulation. Rather than concatenating each day's new behaviors
+# onto an ever-growing behavs_act_df (which would copy the full DF
+# every day), each day's behaviors are kept as a separate DataFrame (a 
+# "day partition"). The partitions are only consolidated into 
+# behavs_act_df once, when the simulation is finalized.
+# ----------------------------------------------------------------------
+
+def reset_behavs_act_df_day_partitions():
+    """
+    Empties the store of day partitions (e.g., before a new run of the
+    simulation).
+    """
+
+    cfg.behavs_act_df_day_partitions = {}
+    cfg.behavs_act_df_for_current_day = None
+
+
+def add_day_partition_to_behavs_act_df(day_df_u):
+    """
+    Stores a DataFrame of newly generated behaviors as the partition
+    for the current day of the simulation. Once the day's records have
+    been generated, a partition isn't modified further.
+
+    PARAMETERS
+    ----------
+    day_df_u
+        The DataFrame containing the day's new behaviors
+    """
+
+    # An empty partition is never stored, as concatenating it with the 
+    # other partitions could alter the dtypes of the consolidated DF.
+    if len(day_df_u) == 0:
+        return
+
+    cfg.behavs_act_df_day_partitions[cfg.day_of_sim_iter] = day_df_u
+
+
+def materialize_behavs_act_df_from_day_partitions():
+    """
+    Consolidates all of the day partitions into cfg.behavs_act_df in a
+    single concatenation step and then empties the partition store.
+    """
+
+    if cfg.behavs_act_df_day_partitions != {}:
+        partitions = [
+            cfg.behavs_act_df_day_partitions[d]
+            for d in sorted(cfg.behavs_act_df_day_partitions)
+            ]
+        if len(partitions) == 1:
+            cfg.behavs_act_df = partitions[0]
+        else:
+            cfg.behavs_act_df = pd.concat(
+                partitions,
+                ignore_index=True,
+                axis=0,
+                )
+
+    reset_behavs_act_df_day_partitions()
+
+
+# ██████████████████████████████████████████████████████████████████████
+# █                                                                    █
+# █    █████  ██  ██ █ ███   ████   ████ █████  ███   █ ███   █████    █
+# █   ██   ██ ██  ██ ██  ██ ██  ██ ██  █  ██   ██  ██ ██  ██ ██   ██   █
+# █   ██      ██  ██ ██  ██ ██   █ ██  █  ██   ██   █ ██  ██ ██        █
+# █    █████   ██ ██ ██  ██ ██   █ ██  █  ██   ██   █ ██  ██  █████    █
+# █        ██   ███  ██  ██ ██████ ██  █  ██   ██████ ██  ██      ██   █
+# █   ██   ██   ██   ██  ██ ██   █ ████   ██   ██   █ ██  ██ ██   ██   █
+# █    █████    ██   ██  ██ ██   █ ██     ██   ██   █ ██  ██  █████    █
+# █                                                                    █
+# █                        /██\                      /███\             █
+# █  █   █            █    █  █                      █   █  ██    (TM) █
+# █  █   █            █    █                         █                 █
+# █  █ █ █ /███\ /██\ █  █ ███ /███\ /██\ /███ /███\ \███\  █  █/█ █\  █
+# █  █ █ █ █   █ █  █ ███  █   █   █ █  █ █    █  ██     █  █  ██ █ █  █
+# █  █ █ █ █   █ █    █  █ █   █   █ █    █    ███   █   █  █  ██ █ █  █
+# █  \█ █/ \███/ █    █  █ █   \███/ █    \███ \███  \███/  █  ██ █ █  █
+# █                                                                    █
+# █         @     @          @     @                                   █
+# █      @    @ @  @       @    @   @@                                 █
+# █     @  @   @@         @@   @ @           █\\\\\\\\\\\\\\\\\\\\\    █
+# █      @@ @ @             @@@   @          ██\\\\\\\\\\\\\\\\\\\\\   █
+# █         @  @               @   @         ███\\\\\\\\\\\\\\\\\\\\\  █
+# █          █  █               █  █         ███▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒ █
+# █      █\\\█\\█\          █\\\█\\█\        ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █      ██\\█\\█\\         ██\\█\\█\\       ███░██░██░█☺░██░██░██░██░ █
+# █ \☺/  ███\\\\\\\\        ███\\\\\\\\      ███░██░██░██░██░██░██░██░ █
+# █  0   ███▒▒▒▒▒▒▒▒▒  ☺    ███▒▒▒▒▒▒▒▒▒  ☺  ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █ / \  ███▒▒▒▒▒▒▒▒▒ /U\   ███▒▒▒▒▒▒▒▒▒ /O] ███▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒ █
+# █      ███▒▒▒▒▒▒▒▒▒  LL   ███▒▒▒▒▒▒▒▒▒ / \ ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █   ☺   ██▒▒█▒███▒▒        ██▒▒███▒▒█▒      ██░████████░██░██░☺█░██░ █
+# █  /8\   █▒▒█▒███▒▒     ☺   █▒▒███▒▒█▒   ☺   █░████☺███░██░██░██░██░ █
+# █   /|    ▒▒▒▒███▒▒    <V>   ▒▒███▒▒▒▒  {D\   ░███[O\██░░░░░░░░░░░░░ █
+# █                      / \               /|       / \                █
+# █                                                                    █
+# ██████████████████████████████████████████████████████████████████████
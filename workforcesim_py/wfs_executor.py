@@ -27,6 +27,7 @@ import numpy as np
 import config as cfg
 import io_file_manager as iofm
 import wfs_behaviors as bhv
+import wfs_events as events
 import wfs_utilities as utils
 import wfs_visualizer as vis
 import wfs_personnel as pers
@@ -112,6 +113,7 @@ def run_one_time_simulation_setup_steps():
     pers.assign_subordinates_to_all_supervisors()
 
     bhv.configure_behavs_act_df()
+    bhv.reset_org_eff_values_accumulators()
     # update_current_tasks()
     cfg.persons_df = \
         pers.create_df_with_selected_attributes_of_all_persons()
@@ -158,6 +160,10 @@ def run_one_time_simulation_finalization_steps():
     the days' behaviors is done.
     """
 
+    # Consolidate the day partitions in which behaviors were stored 
+    # during the run into behavs_act_df, in a single step.
+    events.materialize_behavs_act_df_from_day_partitions()
+
     # Save an archival "full" copy of events before deleting any entries
     # from the priming period (which is excluded from analysis and
     # visualization).
@@ -171,6 +177,10 @@ def run_one_time_simulation_finalization_steps():
     # that occurred during any priming period.
     bhv.calculate_metrics_for_persons_in_retained_simulated_period()
 
+    # Bring all persons' supervisor, subordinate, and colleague 
+    # relationships into their final state before exporting them.
+    pers.bring_personal_relationships_into_final_state()
+
     cfg.persons_df = \
         pers.create_df_with_selected_attributes_of_all_persons()
 
@@ -212,33 +222,20 @@ def generate_visualizations():
     plt.rcParams.update({'figure.max_open_warning': 0})
 
     # ------------------------------------------------------------------
-    # Generate (selected) visualizations.
+    # Generate (selected) visualizations. If plots are rendered in 
+    # parallel, each of the calls below only prepares its plot's data 
+    # (from the shared aggregate cache) and queues the plot; all of them
+    # are then rendered at once, each in its own worker process. (When 
+    # they're instead rendered one after another in this process, the 
+    # import of Seaborn for the heatmaps changes the Matplotlib settings
+    # used for any plots rendered after them.)
     # ------------------------------------------------------------------
 
-    vis.plot_Eff_mean_vs_Eff_sd_with_workstyles_scatter()
-    vis.plot_ideas_mean_by_workstyle_group_bar()
-    vis.plot_distribution_of_MNGR_CAP_scores_hist()
-    vis.plot_Eff_by_weekday_bar()
-    vis.plot_Eff_by_day_in_series_bar()
-    vis.plot_recorded_Eff_by_sub_sup_age_difference_line()
-    vis.generate_event_row_internal_correlations_heatmap()
-    vis.generate_interpersonal_correlations_heatmap()
-    try:
-        vis.plot_mday_series_Eff_for_behav_comptype_bar(
-            "Record Conf Mat",
-            "True Positive",
-            cfg.PLOT_COLOR_GREEN,
-            )
-    except:
-        pass
-    try:
-        vis.plot_mday_series_Eff_for_behav_comptype_bar(
-            "Record Conf Mat",
-            "False Negative",
-            cfg.PLOT_COLOR_SALMON,
-            )
-    except:
-        pass
+    vis.begin_queuing_plots_for_parallel_rendering()
+
+    vis.generate_plots_for_dataset()
+
+    vis.render_queued_plots_in_parallel()
 
 
 def calculate_NUM_OF_DAYS_TO_SIMULATE():
@@ -326,31 +323,49 @@ def run_simulation_of_personnel_behaviors_records():
 #    simulation.
 # ----------------------------------------------------------------------
 
-def run_simulation_from_scratch_using_config_settings():
+def run_simulation_from_scratch_using_config_settings(
+    generate_visualizations_u=True,
+    ):
     """
     # Runs the simulation from scratch, using the current settings
     # found in config.py.
+
+    PARAMETERS
+    ----------
+    generate_visualizations_u : bool
+        Whether all of the visualizations should be generated now 
+        (rather than being rendered on demand)
     """
 
     run_simulation_of_personnel_behaviors_records()
     print("len(cfg.persons): ", len(cfg.persons))
     print("cfg.behavs_act_df.shape: ", cfg.behavs_act_df.shape)
-    generate_visualizations()
+    if generate_visualizations_u:
+        generate_visualizations()
     iofm.save_wfs_behaviors_records_df_as_csv_or_pickle_for_distribution(
         "CSV"
         )
 
 
-def load_saved_dataset_from_previous_simulation_run():
+def load_saved_dataset_from_previous_simulation_run(
+    generate_visualizations_u=True,
+    ):
     """
     Loads a saved dataset from a previous run of the simulation.
+
+    PARAMETERS
+    ----------
+    generate_visualizations_u : bool
+        Whether all of the visualizations should be generated now 
+        (rather than being rendered on demand)
     """
 
     iofm.load_key_vars_from_pickled_file(
         "[148p-90d-99r_20230208092751]_wfs_exported_variables")
     print("len(cfg.persons): ", len(cfg.persons))
     print("cfg.behavs_act_df.shape: ", cfg.behavs_act_df.shape)
-    generate_visualizations()
+    if generate_visualizations_u:
+        generate_visualizations()
 
 
 # ██████████████████████████████████████████████████████████████████████
@@ -0,0 +1,574 @@
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   Synaptans WorkforceSim™ is open-source software for simulating   ║
+# ║   the complex dynamics of a factory workforce.                     ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden • ©2021-23 NeuraXenetica LLC     ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+"""
+This module defines the shared, array-backed store in which the daily
+histories of all persons (e.g., the number of Ideas generated or Lapses
+recorded on each day, or the actual and recorded Efficacy values for 
+each day) are kept. Rather than giving every Person object a dozen 
+dictionaries with an entry for every simulated day, all of these values 
+are held in a single preallocated NumPy array for counts and another for
+Efficacy values, with one row per person. Each Person object accesses 
+its own row through lightweight dict-like accessor objects, so code that
+reads or updates a person's history works as it did with dictionaries.
+
+So that the sum of a counter over some window of days can be found 
+without summing all of the days in the window, the store also keeps 
+prefix sums of the counters for each row; any window sum is then the 
+difference of two prefix sums. The mean of a person's Efficacy values 
+to date is found from running totals of the values for each row. A 
+day's values are added to the prefix sums and running totals once the 
+day is complete.
+"""
+
+from fractions import Fraction
+
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+# The kinds of daily history stored for each person. Counters are 
+# stored as small integers; Efficacy values are stored as floats (with 
+# NaN representing a day with no value, i.e., None).
+# ----------------------------------------------------------------------
+
+HISTORY_COUNTERS = [
+    "idea_behaviors",
+    "lapse_behaviors",
+    "slip_behaviors",
+    "teamwork_behaviors",
+    "absences_recorded",
+    "lapses_recorded",
+    "sabotages_recorded",
+    "slips_recorded",
+    "disruptions_recorded",
+    "FN_good_records",
+    ]
+
+HISTORY_EFF_VALUES = [
+    "actual_eff_values",
+    "recorded_eff_values",
+    ]
+
+# The dtypes used for the two arrays. (Efficacy values are stored at 
+# full precision, as they're compared against thresholds when 
+# determining, e.g., whether a worker is terminated, and rounding them
+# would alter the simulation's results.)
+HISTORY_COUNTS_DTYPE = np.int16
+HISTORY_EFF_VALUES_DTYPE = np.float64
+
+# The dtype used for the prefix sums of the counters.
+HISTORY_COUNTS_PREFIX_SUMS_DTYPE = np.int32
+
+# Converts an array of floats to an object array of the equivalent exact
+# Fractions.
+FRACTION_FROM_FLOAT = np.frompyfunc(Fraction, 1, 1)
+
+# The number of persons for whom rows are initially reserved if no 
+# other number is specified. Whenever the store is full, its capacity 
+# is doubled.
+PERSONS_HISTORY_INITIAL_CAPACITY = 64
+
+
+class Persons_history_class:
+    """
+    Stores the daily histories of all persons in two arrays of shape
+    (persons × days × counters) and (persons × days × Eff value types).
+    """
+
+    def __init__(self,
+        first_day_of_sim_iter_u,
+        num_of_days_u,
+        initial_capacity_u=PERSONS_HISTORY_INITIAL_CAPACITY,
+        ):
+        """
+        Creates an empty store.
+
+        PARAMETERS
+        ----------
+        first_day_of_sim_iter_u : int
+            The day_of_sim_iter value of the first simulated day (which
+            may be negative, if there's a priming period)
+        num_of_days_u : int
+            The total number of days to be simulated
+        initial_capacity_u : int
+            The number of persons for whom rows are initially reserved
+        """
+
+        self.first_day_of_sim_iter = int(first_day_of_sim_iter_u)
+        self.num_of_days = int(num_of_days_u)
+        self.capacity = max(int(initial_capacity_u), 1)
+        self.num_of_rows = 0
+        self.counter_index = {
+            name: i for i, name in enumerate(HISTORY_COUNTERS)}
+        self.eff_values_index = {
+            name: i for i, name in enumerate(HISTORY_EFF_VALUES)}
+        self.counts = np.zeros(
+            (self.capacity, self.num_of_days, len(HISTORY_COUNTERS)),
+            dtype=HISTORY_COUNTS_DTYPE,
+            )
+        self.eff_values = np.full(
+            (self.capacity, self.num_of_days, len(HISTORY_EFF_VALUES)),
+            np.nan,
+            dtype=HISTORY_EFF_VALUES_DTYPE,
+            )
+
+        # --------------------------------------------------------------
+        # Prefix sums. For a given row, counts_prefix_sums[row, i] holds
+        # the sums of the counters over days 0 through i-1. Only the 
+        # entries for i <= num_of_days_closed are valid.
+        # --------------------------------------------------------------
+        self.counts_prefix_sums = np.zeros(
+            (self.capacity, self.num_of_days + 1, len(HISTORY_COUNTERS)),
+            dtype=HISTORY_COUNTS_PREFIX_SUMS_DTYPE,
+            )
+        self.num_of_days_closed = 0
+
+        # --------------------------------------------------------------
+        # Running totals. For a given row, eff_values_sums[row] and 
+        # eff_values_nums[row] hold the sums (as exact Fractions, so 
+        # that means match those calculated by statistics.mean()) and 
+        # the numbers of the non-None Efficacy values over the days 
+        # before eff_values_num_of_days_closed.
+        # --------------------------------------------------------------
+        self.eff_values_sums = np.full(
+            (self.capacity, len(HISTORY_EFF_VALUES)),
+            Fraction(0),
+            dtype=object,
+            )
+        self.eff_values_nums = np.zeros(
+            (self.capacity, len(HISTORY_EFF_VALUES)),
+            dtype=np.int64,
+            )
+        self.eff_values_num_of_days_closed = 0
+
+    def grow_capacity(self):
+        """
+        Doubles the number of persons for whom rows are reserved.
+        """
+
+        new_capacity = self.capacity * 2
+
+        new_counts = np.zeros(
+            (new_capacity, self.num_of_days, len(HISTORY_COUNTERS)),
+            dtype=HISTORY_COUNTS_DTYPE,
+            )
+        new_counts[:self.num_of_rows] = self.counts[:self.num_of_rows]
+        self.counts = new_counts
+
+        new_eff_values = np.full(
+            (new_capacity, self.num_of_days, len(HISTORY_EFF_VALUES)),
+            np.nan,
+            dtype=HISTORY_EFF_VALUES_DTYPE,
+            )
+        new_eff_values[:self.num_of_rows] = \
+            self.eff_values[:self.num_of_rows]
+        self.eff_values = new_eff_values
+
+        new_counts_prefix_sums = np.zeros(
+            (new_capacity, self.num_of_days + 1, len(HISTORY_COUNTERS)),
+            dtype=HISTORY_COUNTS_PREFIX_SUMS_DTYPE,
+            )
+        new_counts_prefix_sums[:self.num_of_rows] = \
+            self.counts_prefix_sums[:self.num_of_rows]
+        self.counts_prefix_sums = new_counts_prefix_sums
+
+        new_eff_values_sums = np.full(
+            (new_capacity, len(HISTORY_EFF_VALUES)),
+            Fraction(0),
+            dtype=object,
+            )
+        new_eff_values_sums[:self.num_of_rows] = \
+            self.eff_values_sums[:self.num_of_rows]
+        self.eff_values_sums = new_eff_values_sums
+
+        new_eff_values_nums = np.zeros(
+            (new_capacity, len(HISTORY_EFF_VALUES)),
+            dtype=np.int64,
+            )
+        new_eff_values_nums[:self.num_of_rows] = \
+            self.eff_values_nums[:self.num_of_rows]
+        self.eff_values_nums = new_eff_values_nums
+
+        self.capacity = new_capacity
+
+    def add_person_row(self):
+        """
+        Reserves a (zeroed) row for a new person and returns its index.
+        """
+
+        if self.num_of_rows == self.capacity:
+            self.grow_capacity()
+
+        row = self.num_of_rows
+        self.num_of_rows += 1
+        return row
+
+    def return_day_index(self, day_of_sim_iter_u):
+        """
+        Returns the index along the days axis for a given day (or None,
+        if the day is outside of the simulated period).
+
+        PARAMETERS
+        ----------
+        day_of_sim_iter_u : int
+            The day_of_sim_iter value of the day
+        """
+
+        try:
+            day_index = int(day_of_sim_iter_u) - self.first_day_of_sim_iter
+        except (TypeError, ValueError):
+            return None
+        if (day_index < 0) or (day_index >= self.num_of_days):
+            return None
+        return day_index
+
+    def return_sums_of_counter_over_previous_days(self,
+        rows_u,
+        name_u,
+        day_of_sim_iter_u,
+        num_of_days_u,
+        ):
+        """
+        Returns an array with the sum of a counter over the given number
+        of days preceding a given day, for each of the given rows. (Days
+        that fall outside of the simulated period contribute nothing.)
+
+        PARAMETERS
+        ----------
+        rows_u
+            An array of persons' rows in the store (or a single row)
+        name_u : str
+            The name of the counter (e.g., "lapse_behaviors")
+        day_of_sim_iter_u : int
+            The day_of_sim_iter value of the day (which isn't itself 
+            included in the sums)
+        num_of_days_u : int
+            The number of preceding days to include
+        """
+
+        day_index = int(day_of_sim_iter_u) - self.first_day_of_sim_iter
+        start = min(max(day_index - num_of_days_u, 0), self.num_of_days)
+        stop = min(max(day_index, 0), self.num_of_days)
+        self.close_days_before_day_index(stop)
+        col = self.counter_index[name_u]
+
+        return self.counts_prefix_sums[rows_u, stop, col] \
+            - self.counts_prefix_sums[rows_u, start, col]
+
+    def return_sum_of_counter_from_day_index(self,
+        row_u,
+        name_u,
+        start_index_u,
+        day_of_sim_iter_u,
+        ):
+        """
+        Returns the sum of a counter for one row over the days from a 
+        given day index through a given (current) day. This equals the 
+        sum of the person's list of values for all days, sliced from 
+        start_index_u onward, as no values exist yet for later days.
+
+        PARAMETERS
+        ----------
+        row_u : int
+            The person's row in the store
+        name_u : str
+            The name of the counter (e.g., "absences_recorded")
+        start_index_u : int
+            The start of the slice (which, as with a list slice, is 
+            counted back from the end of the simulated period if it's 
+            negative)
+        day_of_sim_iter_u : int
+            The day_of_sim_iter value of the current day (which is 
+            included in the sum)
+        """
+
+        start = slice(start_index_u, None).indices(self.num_of_days)[0]
+        day_index = self.return_day_index(day_of_sim_iter_u)
+        if start > day_index:
+            return 0
+
+        self.close_days_before_day_index(day_index)
+        col = self.counter_index[name_u]
+
+        return int(
+            self.counts_prefix_sums[row_u, day_index, col] \
+            + self.counts[row_u, day_index, col] \
+            - self.counts_prefix_sums[row_u, start, col]
+            )
+
+    def return_sum_and_num_of_eff_values(self,
+        row_u,
+        name_u,
+        day_of_sim_iter_u,
+        include_day_u=False,
+        ):
+        """
+        Returns the sum (as a Fraction) and the number of a row's 
+        non-None Efficacy values for the days preceding a given 
+        (current) day and, optionally, for that day itself.
+
+        PARAMETERS
+        ----------
+        row_u : int
+            The person's row in the store
+        name_u : str
+            The name of the Efficacy value type (e.g., 
+            "actual_eff_values")
+        day_of_sim_iter_u : int
+            The day_of_sim_iter value of the current day
+        include_day_u : bool
+            Whether the current day's value (if any) should be included
+        """
+
+        day_index = self.return_day_index(day_of_sim_iter_u)
+        self.close_days_before_day_index(day_index)
+        col = self.eff_values_index[name_u]
+
+        values_sum = self.eff_values_sums[row_u, col]
+        values_num = int(self.eff_values_nums[row_u, col])
+
+        if include_day_u:
+            value = self.eff_values[row_u, day_index, col]
+            if not np.isnan(value):
+                values_sum = values_sum + Fraction(float(value))
+                values_num += 1
+
+        return values_sum, values_num
+
+    def close_days_before_day_index(self, day_index_u):
+        """
+        Adds to the prefix sums and running totals the values for all 
+        days before a given day index that haven't yet been added. This 
+        should only be done for days that are complete (i.e., whose 
+        values won't change).
+
+        PARAMETERS
+        ----------
+        day_index_u : int
+            The index of the first day that shouldn't be added
+        """
+
+        rows = self.num_of_rows
+
+        for day_index in range(self.num_of_days_closed, day_index_u):
+            self.counts_prefix_sums[:rows, day_index + 1] = \
+                self.counts_prefix_sums[:rows, day_index] \
+                + self.counts[:rows, day_index]
+
+        self.num_of_days_closed = max(self.num_of_days_closed, day_index_u)
+
+        # The running totals can't be rolled back to an earlier day, so
+        # if they already include the given day, they're rebuilt.
+        if day_index_u < self.eff_values_num_of_days_closed:
+            self.clear_eff_values_running_totals()
+
+        for day_index in range(
+                self.eff_values_num_of_days_closed, day_index_u):
+            values = self.eff_values[:rows, day_index]
+            values_are_present = ~np.isnan(values)
+            self.eff_values_nums[:rows] += values_are_present
+            for col in range(len(HISTORY_EFF_VALUES)):
+                rows_with_value = np.flatnonzero(values_are_present[:, col])
+                self.eff_values_sums[rows_with_value, col] += \
+                    FRACTION_FROM_FLOAT(values[rows_with_value, col])
+
+        self.eff_values_num_of_days_closed = max(
+            self.eff_values_num_of_days_closed, day_index_u)
+
+    def clear_eff_values_running_totals(self):
+        """
+        Resets the running totals of the Efficacy values so that they 
+        include no days.
+        """
+
+        self.eff_values_sums[:] = Fraction(0)
+        self.eff_values_nums[:] = 0
+        self.eff_values_num_of_days_closed = 0
+
+    def reopen_days_from_day_index(self, day_index_u):
+        """
+        Marks the prefix sums as invalid from a given day index onward,
+        and the running totals as invalid (because a value for that day
+        is being changed after the day was added to them); they'll be 
+        recalculated when needed.
+
+        PARAMETERS
+        ----------
+        day_index_u : int
+            The index of the day whose value is being changed
+        """
+
+        if day_index_u < self.num_of_days_closed:
+            self.num_of_days_closed = day_index_u
+        if day_index_u < self.eff_values_num_of_days_closed:
+            self.clear_eff_values_running_totals()
+
+    def increment_counter_for_day(self,
+        rows_u,
+        name_u,
+        day_of_sim_iter_u,
+        ):
+        """
+        Increments a counter by 1 on a given day for each of the given 
+        rows.
+
+        PARAMETERS
+        ----------
+        rows_u
+            An array of persons' rows in the store (each of which may 
+            appear more than once)
+        name_u : str
+            The name of the counter (e.g., "idea_behaviors")
+        day_of_sim_iter_u : int
+            The day_of_sim_iter value of the day
+        """
+
+        day_index = self.return_day_index(day_of_sim_iter_u)
+        if day_index is None:
+            raise KeyError(day_of_sim_iter_u)
+
+        self.reopen_days_from_day_index(day_index)
+        np.add.at(
+            self.counts[:, day_index, self.counter_index[name_u]],
+            rows_u,
+            1,
+            )
+
+
+class Person_history_dict_class:
+    """
+    A dict-like view of one kind of daily history for one person, keyed
+    by day_of_sim_iter (like the dictionaries that it replaces). Values
+    are read from and written to the shared Persons_history_class store.
+    """
+
+    __slots__ = ("history", "row", "is_eff_value", "col")
+
+    def __init__(self, history_u, row_u, name_u):
+        """
+        Creates the view.
+
+        PARAMETERS
+        ----------
+        history_u
+            The Persons_history_class store
+        row_u : int
+            The person's row in the store
+        name_u : str
+            The name of the counter or Efficacy value type (e.g., 
+            "idea_behaviors" or "actual_eff_values")
+        """
+
+        self.history = history_u
+        self.row = row_u
+        self.is_eff_value = name_u in history_u.eff_values_index
+        if self.is_eff_value:
+            self.col = history_u.eff_values_index[name_u]
+        else:
+            self.col = history_u.counter_index[name_u]
+
+    def return_array(self):
+        """
+        Returns (a view of) the person's values for all days.
+        """
+
+        if self.is_eff_value:
+            return self.history.eff_values[self.row, :, self.col]
+        return self.history.counts[self.row, :, self.col]
+
+    def __getitem__(self, day_of_sim_iter_u):
+        day_index = self.history.return_day_index(day_of_sim_iter_u)
+        if day_index is None:
+            raise KeyError(day_of_sim_iter_u)
+
+        if self.is_eff_value:
+            value = self.history.eff_values[self.row, day_index, self.col]
+            if np.isnan(value):
+                return None
+            return float(value)
+        return int(self.history.counts[self.row, day_index, self.col])
+
+    def __setitem__(self, day_of_sim_iter_u, value_u):
+        day_index = self.history.return_day_index(day_of_sim_iter_u)
+        if day_index is None:
+            raise KeyError(day_of_sim_iter_u)
+
+        self.history.reopen_days_from_day_index(day_index)
+        if self.is_eff_value:
+            if value_u is None:
+                value_u = np.nan
+            self.history.eff_values[self.row, day_index, self.col] = value_u
+        else:
+            self.history.counts[self.row, day_index, self.col] = value_u
+
+    def __contains__(self, day_of_sim_iter_u):
+        return self.history.return_day_index(day_of_sim_iter_u) is not None
+
+    def __len__(self):
+        return self.history.num_of_days
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        return list(range(
+            self.history.first_day_of_sim_iter,
+            self.history.first_day_of_sim_iter + self.history.num_of_days,
+            ))
+
+    def values(self):
+        if self.is_eff_value:
+            return [
+                None if np.isnan(v) else v 
+                for v in self.return_array().tolist()
+                ]
+        return self.return_array().tolist()
+
+    def items(self):
+        return list(zip(self.keys(), self.values()))
+
+
+# ██████████████████████████████████████████████████████████████████████
+# █                                                                    █
+# █    █████  ██  ██ █ ███   ████   ████ █████  ███   █ ███   █████    █
+# █   ██   ██ ██  ██ ██  ██ ██  ██ ██  █  ██   ██  ██ ██  ██ ██   ██   █
+# █   ██      ██  ██ ██  ██ ██   █ ██  █  ██   ██   █ ██  ██ ██        █
+# █    █████   ██ ██ ██  ██ ██   █ ██  █  ██   ██   █ ██  ██  █████    █
+# █        ██   ███  ██  ██ ██████ ██  █  ██   ██████ ██  ██      ██   █
+# █   ██   ██   ██   ██  ██ ██   █ ████   ██   ██   █ ██  ██ ██   ██   █
+# █    █████    ██   ██  ██ ██   █ ██     ██   ██   █ ██  ██  █████    █
+# █                                                                    █
+# █                        /██\                      /███\             █
+# █  █   █            █    █  █                      █   █  ██    (TM) █
+# █  █   █            █    █                         █                 █
+# █  █ █ █ /███\ /██\ █  █ ███ /███\ /██\ /███ /███\ \███\  █  █/█ █\  █
+# █  █ █ █ █   █ █  █ ███  █   █   █ █  █ █    █  ██     █  █  ██ █ █  █
+# █  █ █ █ █   █ █    █  █ █   █   █ █    █    ███   █   █  █  ██ █ █  █
+# █  \█ █/ \███/ █    █  █ █   \███/ █    \███ \███  \███/  █  ██ █ █  █
+# █                                                                    █
+# █         @     @          @     @                                   █
+# █      @    @ @  @       @    @   @@                                 █
+# █     @  @   @@         @@   @ @           █\\\\\\\\\\\\\\\\\\\\\    █
+# █      @@ @ @             @@@   @          ██\\\\\\\\\\\\\\\\\\\\\   █
+# █         @  @               @   @         ███\\\\\\\\\\\\\\\\\\\\\  █
+# █          █  █               █  █         ███▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒ █
+# █      █\\\█\\█\          █\\\█\\█\        ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █      ██\\█\\█\\         ██\\█\\█\\       ███░██░██░█☺░██░██░██░██░ █
+# █ \☺/  ███\\\\\\\\        ███\\\\\\\\      ███░██░██░██░██░██░██░██░ █
+# █  0   ███▒▒▒▒▒▒▒▒▒  ☺    ███▒▒▒▒▒▒▒▒▒  ☺  ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █ / \  ███▒▒▒▒▒▒▒▒▒ /U\   ███▒▒▒▒▒▒▒▒▒ /O] ███▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒ █
+# █      ███▒▒▒▒▒▒▒▒▒  LL   ███▒▒▒▒▒▒▒▒▒ / \ ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █   ☺   ██▒▒█▒███▒▒        ██▒▒███▒▒█▒      ██░████████░██░██░☺█░██░ █
+# █  /8\   █▒▒█▒███▒▒     ☺   █▒▒███▒▒█▒   ☺   █░████☺███░██░██░██░██░ █
+# █   /|    ▒▒▒▒███▒▒    <V>   ▒▒███▒▒▒▒  {D\   ░███[O\██░░░░░░░░░░░░░ █
+# █                      / \               /|       / \                █
+# █                                                                    █
+# ██████████████████████████████████████████████████████████████████████
@@ -14,9 +14,10 @@ the workforce and determining and determining of their (more or less)
 permanent personal characteristics.
 """
 
+from bisect import insort
 import random
 from collections import defaultdict
-import statistics
+from datetime import timedelta
 
 import numpy as np
 import pandas as pd
@@ -24,6 +25,9 @@ import pandas as pd
 # Import other modules from this package.
 import config as cfg
 import wfs_behaviors as bhv
+import wfs_history as hist
+import wfs_population as popl
+import wfs_summary_stats as summ
 import wfs_utilities as utils
 
 
@@ -45,6 +49,46 @@ def calculate_id_starting_value():
     # will be 3000001).
     cfg.EMP_ID_STARTING_VALUE = int(cfg.RANDOM_SEED_A * 1000000 + 1)
 
+    # Seed the ID allocator, so that the first Person object created 
+    # receives this value.
+    cfg.next_per_id_to_assign = cfg.EMP_ID_STARTING_VALUE
+
+
+def allocate_next_per_id():
+    """
+    Returns the personal ID number to be assigned to a newly created 
+    Person object and advances the allocator by 1. IDs are thus assigned
+    in constant time and in the same deterministic sequence as before 
+    (i.e., one higher than the max ID already used).
+    """
+
+    # If the allocator hasn't been seeded (e.g., if persons were loaded
+    # from a file), seed it based on the persons that already exist.
+    if cfg.next_per_id_to_assign is None:
+        if len(cfg.persons) == 0:
+            cfg.next_per_id_to_assign = cfg.EMP_ID_STARTING_VALUE
+        else:
+            cfg.next_per_id_to_assign = \
+                max(cfg.persons[p].per_id for p in cfg.persons) + 1
+
+    per_id = cfg.next_per_id_to_assign
+    cfg.next_per_id_to_assign += 1
+    return per_id
+
+
+def return_persons_history():
+    """
+    Returns the shared store of persons' daily histories, creating it 
+    if it doesn't yet exist.
+    """
+
+    if cfg.persons_history is None:
+        cfg.persons_history = hist.Persons_history_class(
+            cfg.day_of_sim_iter_for_first_simulated_day,
+            cfg.NUM_OF_DAYS_TO_SIMULATE,
+            )
+    return cfg.persons_history
+
 
 class Person_class:
     """
@@ -63,10 +107,7 @@ class Person_class:
         # Assign an emp_id number that's one higher than the max number 
         # already used (or that equals "EMP_ID_STARTING_VALUE", if this 
         # is the first Person class person object to be created).
-        if len(cfg.persons) == 0:
-            self.per_id = cfg.EMP_ID_STARTING_VALUE
-        else:
-            self.per_id = max(cfg.persons[p].per_id for p in cfg.persons ) + 1
+        self.per_id = allocate_next_per_id()
 
         # --------------------------------------------------------------
         # Sex, age, and other basic demographic traits.
@@ -417,78 +458,63 @@ class Person_class:
         # internally-stored dicts for the given person than to sift
         # through the entire behavs_act_df for all persons.
 
+        # The values for all of these are stored in a single shared 
+        # array-backed store (see wfs_history.py) in which each person 
+        # has his own row; each of the attributes below is a dict-like 
+        # view of one kind of history in the person's row, keyed by 
+        # day_of_sim_iter.
+        persons_history = return_persons_history()
+        self.history_row = persons_history.add_person_row()
+
         self.dict_days_with_actual_eff_values \
-            = {key: None for key in list(range(
-                cfg.day_of_sim_iter_for_first_simulated_day,
-                cfg.day_of_sim_iter_for_first_simulated_day \
-                    +  cfg.NUM_OF_DAYS_TO_SIMULATE
-                )) }
+            = hist.Person_history_dict_class(
+                persons_history, self.history_row, "actual_eff_values")
         self.dict_days_with_recorded_eff_values \
-            = {key: None for key in list(range(
-                cfg.day_of_sim_iter_for_first_simulated_day,
-                cfg.day_of_sim_iter_for_first_simulated_day \
-                    + cfg.NUM_OF_DAYS_TO_SIMULATE
-                )) }
+            = hist.Person_history_dict_class(
+                persons_history, self.history_row, "recorded_eff_values")
         self.dict_days_with_num_of_idea_behaviors \
-            = {key: 0 for key in list(range(
-                cfg.day_of_sim_iter_for_first_simulated_day,
-                cfg.day_of_sim_iter_for_first_simulated_day \
-                    +  cfg.NUM_OF_DAYS_TO_SIMULATE
-                )) }
+            = hist.Person_history_dict_class(
+                persons_history, self.history_row, "idea_behaviors")
         self.dict_days_with_num_of_lapse_behaviors \
-            = {key: 0 for key in list(range(
-                cfg.day_of_sim_iter_for_first_simulated_day,
-                cfg.day_of_sim_iter_for_first_simulated_day \
-                    + cfg.NUM_OF_DAYS_TO_SIMULATE
-                )) }
+            = hist.Person_history_dict_class(
+                persons_history, self.history_row, "lapse_behaviors")
         self.dict_days_with_num_of_slip_behaviors \
-            = {key: 0 for key in list(range(
-                cfg.day_of_sim_iter_for_first_simulated_day,
-                cfg.day_of_sim_iter_for_first_simulated_day \
-                    +  cfg.NUM_OF_DAYS_TO_SIMULATE
-                )) }
+            = hist.Person_history_dict_class(
+                persons_history, self.history_row, "slip_behaviors")
         self.dict_days_with_num_of_teamwork_behaviors \
-            = {key: 0 for key in list(range(
-                cfg.day_of_sim_iter_for_first_simulated_day,
-                cfg.day_of_sim_iter_for_first_simulated_day \
-                    +  cfg.NUM_OF_DAYS_TO_SIMULATE
-                )) }
+            = hist.Person_history_dict_class(
+                persons_history, self.history_row, "teamwork_behaviors")
         self.dict_days_with_num_of_absences_recorded \
-            = {key: 0 for key in list(range(
-                cfg.day_of_sim_iter_for_first_simulated_day,
-                cfg.day_of_sim_iter_for_first_simulated_day \
-                    + cfg.NUM_OF_DAYS_TO_SIMULATE
-                )) }
+            = hist.Person_history_dict_class(
+                persons_history, self.history_row, "absences_recorded")
         self.dict_days_with_num_of_lapses_recorded \
-            = {key: 0 for key in list(range(
-                cfg.day_of_sim_iter_for_first_simulated_day,
-                cfg.day_of_sim_iter_for_first_simulated_day \
-                    + cfg.NUM_OF_DAYS_TO_SIMULATE
-                )) }
+            = hist.Person_history_dict_class(
+                persons_history, self.history_row, "lapses_recorded")
         self.dict_days_with_num_of_sabotages_recorded \
-            = {key: 0 for key in list(range(
-                cfg.day_of_sim_iter_for_first_simulated_day,
-                cfg.day_of_sim_iter_for_first_simulated_day \
-                    + cfg.NUM_OF_DAYS_TO_SIMULATE
-                )) }
+            = hist.Person_history_dict_class(
+                persons_history, self.history_row, "sabotages_recorded")
         self.dict_days_with_num_of_slips_recorded \
-            = {key: 0 for key in list(range(
-                cfg.day_of_sim_iter_for_first_simulated_day,
-                cfg.day_of_sim_iter_for_first_simulated_day \
-                    + cfg.NUM_OF_DAYS_TO_SIMULATE
-                )) }
+            = hist.Person_history_dict_class(
+                persons_history, self.history_row, "slips_recorded")
         self.dict_days_with_num_of_disruptions_recorded \
-            = {key: 0 for key in list(range(
-                cfg.day_of_sim_iter_for_first_simulated_day,
-                cfg.day_of_sim_iter_for_first_simulated_day \
-                    + cfg.NUM_OF_DAYS_TO_SIMULATE
-                )) }
+            = hist.Person_history_dict_class(
+                persons_history, self.history_row, "disruptions_recorded")
         self.dict_days_with_num_of_FN_good_records \
-            = {key: 0 for key in list(range(
-                cfg.day_of_sim_iter_for_first_simulated_day,
-                cfg.day_of_sim_iter_for_first_simulated_day \
-                    + cfg.NUM_OF_DAYS_TO_SIMULATE
-                )) }
+            = hist.Person_history_dict_class(
+                persons_history, self.history_row, "FN_good_records")
+
+        # A small ring buffer storing the number of the person's Good 
+        # behaviors that were recorded as True Positives or False 
+        # Negatives by his supervisor on each of the last few days. Each
+        # slot is a list of [day_of_sim_iter, num of TP records, num of 
+        # FN records]; the slot for a given day is that day's 
+        # day_of_sim_iter modulo the length of the ring. This allows the
+        # impact of recent records on the person's Efficacy to be 
+        # calculated without searching behavs_act_df.
+        self.recent_good_records_ring = [
+            [None, 0, 0] 
+            for i in range(cfg.NUM_OF_DAYS_IN_RECENT_GOOD_RECORDS_RING)
+            ]
 
     def __str__(self):
         """
@@ -612,10 +638,30 @@ def create_initial_population_of_persons():
         + 4
 
     cfg.persons = defaultdict(list)
+    cfg.persons_by_ID = {}
+    cfg.active_persons = {}
+    cfg.keys_of_active_persons_by_ID = {}
+    cfg.separated_persons = {}
+    cfg.persons_separated_since_last_reset = []
+    cfg.org_structure_indexes = None
+    cfg.personal_relationships_need_rebuild = True
+    cfg.teams_with_changed_membership = set()
+    cfg.shifts_with_changed_membership = set()
+
+    # Create the shared store for persons' daily histories, with room
+    # for the initial community and (at first) an equal number of 
+    # replacement hires.
+    cfg.persons_history = hist.Persons_history_class(
+        cfg.day_of_sim_iter_for_first_simulated_day,
+        cfg.NUM_OF_DAYS_TO_SIMULATE,
+        initial_capacity_u=cfg.SIZE_OF_COMM_INITIAL * 2,
+        )
 
     # Populate the community.
     for i in range(0, cfg.SIZE_OF_COMM_INITIAL):
         cfg.persons[i] = Person_class()
+        add_person_to_index_of_persons_by_ID(cfg.persons[i])
+        add_person_to_active_roster(i, cfg.persons[i])
         # print(cfg.persons[i])
 
 
@@ -1225,6 +1271,10 @@ def assign_supervisor_to_each_person():
                 and (cfg.persons[x].separated is False)
                 ))]
 
+    # Since the relationships have been recalculated by this function's
+    # own rules, they'll need to be rebuilt during the next day.
+    cfg.personal_relationships_need_rebuild = True
+
 
 def assign_subordinates_to_all_supervisors():
     """
@@ -1278,6 +1328,10 @@ def assign_subordinates_to_all_supervisors():
         elif cfg.persons[i].role.title == cfg.LABORER_TERM:
             cfg.persons[i].subs = None
 
+    # Since the relationships have been recalculated by this function's
+    # own rules, they'll need to be rebuilt during the next day.
+    cfg.personal_relationships_need_rebuild = True
+
 
 def assign_colleagues_to_all_persons():
     """
@@ -1350,6 +1404,10 @@ def assign_colleagues_to_all_persons():
                 = [item for internal_list in colleagues_temp_list for item in internal_list]
             cfg.persons[i].colleagues = colleagues_temp_list
 
+    # Since the relationships have been recalculated by this function's
+    # own rules, they'll need to be rebuilt during the next day.
+    cfg.personal_relationships_need_rebuild = True
+
 
 def update_persons_colleagues_of_same_sex_prtn():
     """
@@ -1358,21 +1416,34 @@ def update_persons_colleagues_of_same_sex_prtn():
     """
 
     for p in cfg.persons:
+        update_colleagues_of_same_sex_prtn_of_person(cfg.persons[p])
 
-        # This is only relevant if the person has colleagues (i.e.,
-        # isn't the factory's Production Director).
-        if cfg.persons[p].colleagues:
-            sex_this_person = cfg.persons[p].sex
-            colleagues_of_this_person = cfg.persons[p].colleagues
-            sex_of_colleagues_list \
-                = [coll.sex for coll in colleagues_of_this_person]
+
+def update_colleagues_of_same_sex_prtn_of_person(person_u):
+    """
+    Updates the calculation of the proportion of a given person's 
+    colleagues who are of the same sex.
+
+    PARAMETERS
+    ----------
+    person_u
+        The Person object
+    """
+
+    # This is only relevant if the person has colleagues (i.e.,
+    # isn't the factory's Production Director).
+    if person_u.colleagues:
+        sex_this_person = person_u.sex
+        colleagues_of_this_person = person_u.colleagues
+        sex_of_colleagues_list \
+            = [coll.sex for coll in colleagues_of_this_person]
+        colleagues_of_same_sex_num \
+            = sex_of_colleagues_list.count(sex_this_person)
+        colleagues_of_same_sex_prtn = \
             colleagues_of_same_sex_num \
-                = sex_of_colleagues_list.count(sex_this_person)
-            colleagues_of_same_sex_prtn = \
-                colleagues_of_same_sex_num \
-                / len(sex_of_colleagues_list)
-            cfg.persons[p].colleagues_of_same_sex_prtn \
-                = colleagues_of_same_sex_prtn
+            / len(sex_of_colleagues_list)
+        person_u.colleagues_of_same_sex_prtn \
+            = colleagues_of_same_sex_prtn
 
 
 def reset_modified_probs_to_base_probs_for_all_persons():
@@ -1382,25 +1453,48 @@ def reset_modified_probs_to_base_probs_for_all_persons():
     should be done at the start of each new simulated day.
     """
 
-    for p in cfg.persons:
-        cfg.persons[p].prob_modified_presence \
-            = cfg.persons[p].prob_base_presence
-        cfg.persons[p].prob_modified_idea = cfg.persons[p].prob_base_idea
-        cfg.persons[p].prob_modified_lapse = cfg.persons[p].prob_base_lapse
-        cfg.persons[p].prob_modified_feat = cfg.persons[p].prob_base_feat
-        cfg.persons[p].prob_modified_slip = cfg.persons[p].prob_base_slip
-        cfg.persons[p].prob_modified_teamwork \
-            = cfg.persons[p].prob_base_teamwork
-        cfg.persons[p].prob_modified_disruption \
-            = cfg.persons[p].prob_base_disruption
-        cfg.persons[p].prob_modified_sacrifice \
-            = cfg.persons[p].prob_base_sacrifice
-        cfg.persons[p].prob_modified_sabotage \
-            = cfg.persons[p].prob_base_sabotage
-        cfg.persons[p].level_modified_efficacy \
-            = cfg.persons[p].level_base_efficacy
-        cfg.persons[p].prob_modified_recording_accurately \
-            = cfg.persons[p].prob_base_recording_accurately
+    # Persons who were separated at the end of the previous day still 
+    # have that day's modified probabilities; reset them a final time. 
+    # (As they no longer generate behaviors, they won't be visited 
+    # again.)
+    for person in cfg.persons_separated_since_last_reset:
+        reset_modified_probs_to_base_probs_for_person(person)
+    cfg.persons_separated_since_last_reset = []
+
+    # If the vectorized population engine is in use, reset the values
+    # stored in its arrays. (They are written to the Person objects when
+    # the day's modifiers have been calculated.)
+    if cfg.USE_VECTORIZED_POPULATION_ENGINE is True:
+        popl.reset_modified_probs_to_base_probs_for_active_persons()
+        return
+
+    for p in cfg.active_persons:
+        reset_modified_probs_to_base_probs_for_person(cfg.persons[p])
+
+
+def reset_modified_probs_to_base_probs_for_person(person_u):
+    """
+    Resets a person's modified daily probabilities to his base 
+    probabilities.
+
+    PARAMETERS
+    ----------
+    person_u
+        The Person object
+    """
+
+    person_u.prob_modified_presence = person_u.prob_base_presence
+    person_u.prob_modified_idea = person_u.prob_base_idea
+    person_u.prob_modified_lapse = person_u.prob_base_lapse
+    person_u.prob_modified_feat = person_u.prob_base_feat
+    person_u.prob_modified_slip = person_u.prob_base_slip
+    person_u.prob_modified_teamwork = person_u.prob_base_teamwork
+    person_u.prob_modified_disruption = person_u.prob_base_disruption
+    person_u.prob_modified_sacrifice = person_u.prob_base_sacrifice
+    person_u.prob_modified_sabotage = person_u.prob_base_sabotage
+    person_u.level_modified_efficacy = person_u.level_base_efficacy
+    person_u.prob_modified_recording_accurately \
+        = person_u.prob_base_recording_accurately
 
 
 def calculate_person_modifiers_to_implement_dependencies_and_covariance():
@@ -1411,7 +1505,13 @@ def calculate_person_modifiers_to_implement_dependencies_and_covariance():
     for certain personal or environmental factors).
     """
 
-    for p in cfg.persons:
+    # If the vectorized population engine is in use, calculate the 
+    # modifiers for all active persons at once.
+    if cfg.USE_VECTORIZED_POPULATION_ENGINE is True:
+        popl.calculate_person_modifiers_for_active_persons()
+        return
+
+    for p in cfg.active_persons:
 
         # If a person is already separated from employment, do not 
         # proceed with updating that person; skip ahead to the next 
@@ -1696,10 +1796,78 @@ def person_object_with_given_sub_ID(sub_ID_u):
         The subject ID for the person object being sought
     """
 
+    if sub_ID_u is None:
+        return None
+
+    # Look up the person in the ID index. If the person isn't found 
+    # there and the index is out of date (e.g., because cfg.persons was 
+    # loaded from a file rather than created during the current 
+    # session), rebuild the index and try once more.
+    try:
+        return cfg.persons_by_ID[sub_ID_u]
+    except KeyError:
+        if len(cfg.persons_by_ID) != len(cfg.persons):
+            rebuild_index_of_persons_by_ID()
+            return cfg.persons_by_ID.get(sub_ID_u)
+        return None
+
+
+def add_person_to_index_of_persons_by_ID(person_u):
+    """
+    Adds a Person object to cfg.persons_by_ID, the index that allows 
+    a person to be found by his ID number in constant time.
+
+    PARAMETERS
+    ----------
+    person_u
+        The Person object to be added to the index
+    """
+
+    cfg.persons_by_ID[person_u.per_id] = person_u
+
+
+def rebuild_index_of_persons_by_ID():
+    """
+    Rebuilds cfg.persons_by_ID from scratch, using all of the persons 
+    in cfg.persons (including separated persons).
+    """
+
+    cfg.persons_by_ID = {}
     for p in cfg.persons:
-        if cfg.persons[p].per_id == sub_ID_u:
-            return cfg.persons[p]
-    return None
+        add_person_to_index_of_persons_by_ID(cfg.persons[p])
+
+
+def add_person_to_active_roster(key_u, person_u):
+    """
+    Adds a newly created person to the active roster.
+
+    PARAMETERS
+    ----------
+    key_u
+        The person's key in cfg.persons
+    person_u
+        The Person object
+    """
+
+    cfg.active_persons[key_u] = person_u
+    cfg.keys_of_active_persons_by_ID[person_u.per_id] = key_u
+
+
+def move_person_from_active_roster_to_archive(person_u):
+    """
+    Moves a person who has been separated from employment from the 
+    active roster to the archive of separated persons.
+
+    PARAMETERS
+    ----------
+    person_u
+        The Person object
+    """
+
+    key = cfg.keys_of_active_persons_by_ID.pop(person_u.per_id)
+    del cfg.active_persons[key]
+    cfg.separated_persons[key] = person_u
+    cfg.persons_separated_since_last_reset.append(person_u)
 
 
 def display_simple_personnel_statistics():
@@ -1713,11 +1881,14 @@ def display_simple_personnel_statistics():
         "Persons in community at start of simulation: ",
         cfg.SIZE_OF_COMM_INITIAL
         )
+    summary_stats = summ.return_summary_stats()
+
     print("Separations during retained period: ",
-        cfg.behavs_act_df["Behavior Type"].value_counts()["Separation"])
+        summary_stats.return_count(
+            summary_stats.behavior_type_counts, "Separation"))
     print(
         "Unique subjects of behaviors/events in retained cfg.behavs_act_df: ",
-        cfg.behavs_act_df["Sub ID"].nunique()
+        summary_stats.unique_subjects_num
         )
     print(
         "Total persons in persons_df at end of simulation (including priming-period separations): ",
@@ -1725,6 +1896,270 @@ def display_simple_personnel_statistics():
         )
 
 
+def return_org_structure_index_keys_for_person(person_u):
+    """
+    Returns a list of (index name, key) pairs identifying the entries
+    in cfg.org_structure_indexes under which a given active person is 
+    listed (e.g., ("Laborers by team", "Team 3")).
+
+    PARAMETERS
+    ----------
+    person_u
+        The Person object
+    """
+
+    if person_u.role.title == cfg.LABORER_TERM:
+        return [
+            ("Laborers by team", person_u.team.title),
+            ("Laborers by shift", person_u.shift.title),
+            ]
+
+    elif person_u.role.title == cfg.TEAM_LEADER_TERM:
+        return [
+            ("Team Leaders by team", person_u.team.title),
+            ("Team Leaders by shift", person_u.shift.title),
+            ]
+
+    elif person_u.role.title == cfg.SHIFT_MANAGER_TERM:
+        return [("Shift Managers by shift", person_u.shift.title)]
+
+    return []
+
+
+def add_person_to_org_structure_indexes(person_u):
+    """
+    Lists an active person in the relevant organizational-structure 
+    indexes. Each entry's list of persons is kept in the same order as
+    cfg.persons (i.e., in order of personal ID number).
+
+    PARAMETERS
+    ----------
+    person_u
+        The Person object
+    """
+
+    indexes = return_org_structure_indexes()
+    for index_name, key in return_org_structure_index_keys_for_person(
+        person_u):
+        insort(
+            indexes[index_name][key],
+            person_u,
+            key=lambda person: person.per_id,
+            )
+
+    record_change_in_membership_of_persons_org_units(person_u)
+
+
+def remove_person_from_org_structure_indexes(person_u):
+    """
+    Removes a person from the organizational-structure indexes (e.g., 
+    because he is being separated, or before he is moved to a different
+    team).
+
+    PARAMETERS
+    ----------
+    person_u
+        The Person object
+    """
+
+    indexes = return_org_structure_indexes()
+    for index_name, key in return_org_structure_index_keys_for_person(
+        person_u):
+        indexes[index_name][key].remove(person_u)
+
+    record_change_in_membership_of_persons_org_units(person_u)
+
+
+def record_change_in_membership_of_persons_org_units(person_u):
+    """
+    Records that the active membership of the team (and, for a Team 
+    Leader, the shift) to which a person belongs has changed, so that 
+    the relationships of its members will be updated.
+
+    PARAMETERS
+    ----------
+    person_u
+        The Person object who has joined or left the unit
+    """
+
+    for index_name, key in return_org_structure_index_keys_for_person(
+        person_u):
+        if index_name.endswith("by team"):
+            cfg.teams_with_changed_membership.add(key)
+        elif index_name == "Team Leaders by shift":
+            cfg.shifts_with_changed_membership.add(key)
+
+    cfg.personal_relationships_need_rebuild = True
+
+
+def rebuild_org_structure_indexes():
+    """
+    Builds the organizational-structure indexes from scratch, by 
+    listing all persons on the active roster.
+    """
+
+    cfg.org_structure_indexes = {
+        "Laborers by team": defaultdict(list),
+        "Laborers by shift": defaultdict(list),
+        "Team Leaders by team": defaultdict(list),
+        "Team Leaders by shift": defaultdict(list),
+        "Shift Managers by shift": defaultdict(list),
+        }
+
+    for p in cfg.active_persons:
+        for index_name, key in return_org_structure_index_keys_for_person(
+            cfg.persons[p]):
+            cfg.org_structure_indexes[index_name][key].append(
+                cfg.persons[p])
+
+    cfg.personal_relationships_need_rebuild = True
+
+
+def return_org_structure_indexes():
+    """
+    Returns the organizational-structure indexes, building them first 
+    if they don't yet exist.
+    """
+
+    if cfg.org_structure_indexes is None:
+        rebuild_org_structure_indexes()
+
+    return cfg.org_structure_indexes
+
+
+def update_personal_relationships_in_org_units(
+    team_titles_u,
+    shift_titles_u,
+    ):
+    """
+    Recalculates the supervisor, subordinate, and colleague 
+    relationships (and same-sex colleague proportions) of the active 
+    members of the given teams and shifts, following the same rules as 
+    assign_supervisor_to_each_person(), 
+    assign_subordinates_to_all_supervisors(), and
+    assign_colleagues_to_all_persons(). The work required is 
+    proportional to the size of the given teams and shifts, rather than
+    to the size of the whole workforce.
+
+    PARAMETERS
+    ----------
+    team_titles_u
+        The titles of the teams whose members should be updated
+    shift_titles_u
+        The titles of the shifts whose Team Leaders and Shift Manager 
+        should be updated
+    """
+
+    indexes = return_org_structure_indexes()
+    laborers_by_team = indexes["Laborers by team"]
+    team_leaders_by_team = indexes["Team Leaders by team"]
+    team_leaders_by_shift = indexes["Team Leaders by shift"]
+    shift_managers_by_shift = indexes["Shift Managers by shift"]
+
+    persons_with_updated_colleagues = []
+
+    # Update each team's Laborers and the subordinates of its Team 
+    # Leader.
+    for team_title in sorted(team_titles_u):
+        team_leader = team_leaders_by_team[team_title][0]
+        team_leader.subs = list(laborers_by_team[team_title])
+
+        for laborer in laborers_by_team[team_title]:
+            laborer.sup = team_leader
+            laborer.subs = None
+            laborer.colleagues = [
+                coll for coll in laborers_by_team[team_title] \
+                    if coll.per_id != laborer.per_id
+                ]
+            persons_with_updated_colleagues.append(laborer)
+
+    # Update each shift's Team Leaders and the subordinates of its Shift
+    # Manager.
+    for shift_title in sorted(shift_titles_u):
+        shift_manager = shift_managers_by_shift[shift_title][0]
+        shift_manager.subs = list(team_leaders_by_shift[shift_title])
+
+        for team_leader in team_leaders_by_shift[shift_title]:
+            team_leader.sup = shift_manager
+            team_leader.colleagues = [
+                coll for coll in team_leaders_by_shift[shift_title] \
+                    if coll.per_id != team_leader.per_id
+                ]
+            persons_with_updated_colleagues.append(team_leader)
+
+    for person in persons_with_updated_colleagues:
+        update_colleagues_of_same_sex_prtn_of_person(person)
+
+
+def update_personal_relationships_in_changed_org_units():
+    """
+    Recalculates the relationships of the active members of all teams 
+    and shifts whose membership has changed since this was last done 
+    (e.g., because Laborers were swapped between teams or workers were
+    separated and replaced).
+    """
+
+    update_personal_relationships_in_org_units(
+        cfg.teams_with_changed_membership,
+        cfg.shifts_with_changed_membership,
+        )
+
+    cfg.teams_with_changed_membership = set()
+    cfg.shifts_with_changed_membership = set()
+
+
+def reassign_personal_relationships_of_all_persons():
+    """
+    Recalculates the supervisor, subordinate, and colleague 
+    relationships of all persons following the rules of the assign_*
+    functions (with separated persons having no relationships). 
+
+    During the simulation, the daily rebuild of relationships follows
+    slightly different rules (e.g., a Team Leader is listed among his 
+    own colleagues), and only the teams and shifts affected by swaps or
+    separations are updated following the assign_* rules at the end of
+    each day. This brings all persons' relationships into the state that
+    they would have if the assign_* functions were applied, e.g., before
+    the persons' attributes are exported at the end of the simulation.
+    """
+
+    for p in cfg.separated_persons:
+        cfg.persons[p].sup = None
+        cfg.persons[p].subs = None
+        cfg.persons[p].colleagues = None
+
+    indexes = return_org_structure_indexes()
+    update_personal_relationships_in_org_units(
+        list(indexes["Laborers by team"]) \
+            + list(indexes["Team Leaders by team"]),
+        indexes["Team Leaders by shift"],
+        )
+
+    cfg.teams_with_changed_membership = set()
+    cfg.shifts_with_changed_membership = set()
+
+
+def bring_personal_relationships_into_final_state():
+    """
+    Brings all persons' supervisor, subordinate, and colleague 
+    relationships into the state left by the last phase of the final 
+    simulated day that recalculated them, before they're exported.
+
+    If the final day was a weekday, that was the recalculation at the 
+    end of the day following the rules of the assign_* functions. If it
+    was a Saturday or Sunday (when no separations occur), it was the 
+    daily rebuild carried out on Saturday after Friday's recalculation, 
+    which is applied to all persons (including separated ones).
+    """
+
+    reassign_personal_relationships_of_all_persons()
+
+    final_simulated_day_datetime_obj = \
+        cfg.current_datetime_obj - timedelta(days = 1)
+    if final_simulated_day_datetime_obj.weekday() in (5, 6):
+        rebuild_personal_relationships_of_persons(cfg.persons)
+
+
 def rebuild_selected_personal_relationships():
     """
     At some point during the day, use each Team Leader and each 
@@ -1734,81 +2169,75 @@ def rebuild_selected_personal_relationships():
     swapped between Teams and that Team Leaders and Laborers can be 
     separated from employment and replaced in the course of the 
     simulation.
+
+    The active members of each team and shift are read from the 
+    organizational-structure indexes. If nothing has changed since the 
+    relationships were last rebuilt, there is nothing to do.
     """
 
-    for p in cfg.persons:
+    if cfg.personal_relationships_need_rebuild is False:
+        return
+
+    rebuild_personal_relationships_of_persons(cfg.active_persons)
+
+    cfg.personal_relationships_need_rebuild = False
+
+
+def rebuild_personal_relationships_of_persons(person_keys_u):
+    """
+    Rebuilds the supervisor, colleague, and subordinate data of the 
+    given persons following the rules of the daily rebuild (see 
+    rebuild_selected_personal_relationships()).
+
+    PARAMETERS
+    ----------
+    person_keys_u
+        The keys in cfg.persons of the persons whose relationships 
+        should be rebuilt
+    """
+
+    indexes = return_org_structure_indexes()
+    laborers_by_team = indexes["Laborers by team"]
+    team_leaders_by_team = indexes["Team Leaders by team"]
+    team_leaders_by_shift = indexes["Team Leaders by shift"]
+    shift_managers_by_shift = indexes["Shift Managers by shift"]
+
+    for p in person_keys_u:
 
         # If the person is a Laborer...
         if (cfg.persons[p].role.title == cfg.LABORER_TERM):
+            team_title = cfg.persons[p].team.title
+
             # Update the person's supervisor.
-            person_sup_mono_list \
-                = [cfg.persons[sup] for sup in cfg.persons if (\
-                    (cfg.persons[sup].role.title == "Team Leader") \
-                    & (cfg.persons[sup].separated is False) \
-                    & (cfg.persons[sup].team.title \
-                        == cfg.persons[p].team.title) \
-                    )]
-            person_sup = person_sup_mono_list[0]
-            cfg.persons[p].sup = person_sup
+            cfg.persons[p].sup = team_leaders_by_team[team_title][0]
 
             # Update the person's colleagues.
-            colleagues_temp_list \
-                = [cfg.persons[coll] for coll in cfg.persons if (\
-                    (cfg.persons[coll].role.title == "Laborer") \
-                    & (cfg.persons[coll].separated is False) \
-                    & (cfg.persons[coll].team.title \
-                        == cfg.persons[p].team.title) \
-                    & (cfg.persons[coll].per_id != cfg.persons[p].per_id)
-                    )]
-            cfg.persons[p].colleagues = colleagues_temp_list
-
+            cfg.persons[p].colleagues = [
+                coll for coll in laborers_by_team[team_title] \
+                    if coll.per_id != cfg.persons[p].per_id
+                ]
 
         # If the person is a Team Leader...
-        elif (cfg.persons[p].role.title == "Team Leader"):
+        elif (cfg.persons[p].role.title == cfg.TEAM_LEADER_TERM):
+            shift_title = cfg.persons[p].shift.title
+
             # Update the person's supervisor.
-            person_sup_mono_list \
-                = [cfg.persons[sup] for sup in cfg.persons if (\
-                    (cfg.persons[sup].role.title == "Shift Manager") \
-                    & (cfg.persons[sup].separated is False) \
-                    & (cfg.persons[sup].shift.title \
-                        == cfg.persons[p].shift.title) \
-                    )]
-            person_sup = person_sup_mono_list[0]
-            cfg.persons[p].sup = person_sup
+            cfg.persons[p].sup = shift_managers_by_shift[shift_title][0]
 
             # Update the person's colleagues.
-            colleagues_temp_list \
-                = [cfg.persons[coll] for coll in cfg.persons if (\
-                    (cfg.persons[coll].role.title == "Team Leader") \
-                    & (cfg.persons[coll].separated is False) \
-                    & (cfg.persons[coll].shift.title \
-                        == cfg.persons[p].shift.title) \
-                    )]
-            cfg.persons[p].colleagues = colleagues_temp_list
+            cfg.persons[p].colleagues = \
+                list(team_leaders_by_shift[shift_title])
 
             # Update the person's subordinates.
-            subordinates_temp_list \
-                = [cfg.persons[sub] for sub in cfg.persons if (\
-                    (cfg.persons[sub].role.title == "Laborer") \
-                    & (cfg.persons[sub].separated is False) \
-                    & (cfg.persons[sub].team.title \
-                        == cfg.persons[p].team.title) \
-                    )]
-            cfg.persons[p].subs = subordinates_temp_list
-
+            cfg.persons[p].subs = \
+                list(laborers_by_team[cfg.persons[p].team.title])
 
         # If the person is a Shift Manager...
-        elif (cfg.persons[p].role.title == "Shift Manager"):
+        elif (cfg.persons[p].role.title == cfg.SHIFT_MANAGER_TERM):
 
             # Update the person's subordinates.
-            subordinates_temp_list \
-                = [cfg.persons[sub] for sub in cfg.persons if (\
-                    (cfg.persons[sub].role.title == "Team Leader") \
-                    & (cfg.persons[sub].separated is False) \
-                    & (cfg.persons[sub].shift.title \
-                        == cfg.persons[p].shift.title) \
-                    )]
-            cfg.persons[p].subs = subordinates_temp_list
+            cfg.persons[p].subs = \
+                list(team_leaders_by_shift[cfg.persons[p].shift.title])
 
 
 def check_for_and_execute_worker_swaps():
@@ -1818,7 +2247,9 @@ def check_for_and_execute_worker_swaps():
     will only be run on a Monday, at the start of a new workweek.
     """
 
-    for p in cfg.persons:
+    laborers_by_shift = return_org_structure_indexes()["Laborers by shift"]
+
+    for p in cfg.active_persons:
 
         # Only consider a swap if a person is a Laborer.
         if cfg.persons[p].role.title == cfg.LABORER_TERM:
@@ -1831,32 +2262,15 @@ def check_for_and_execute_worker_swaps():
                 if random.uniform(0.0, 1.0) \
                         < cfg.PROB_LABORER_SWAP_TO_DIFFERENT_TEAM:
 
-                    # Create a list of all the persons who aren't 
-                    # separated from employment.
-                    Laborers_avail_for_swap_list = \
-                        [person for person in cfg.persons \
-                            if cfg.persons[person].separated is not True]
-
-                    # Keep only the persons in the list who are 
-                    # Laborers.
-                    Laborers_avail_for_swap_list = \
-                        [person for person in Laborers_avail_for_swap_list \
-                            if cfg.persons[person].role.title \
-                                == cfg.LABORER_TERM]
-
-                    # Keep only the persons in the list who are on the 
-                    # same Shift as the given worker.
-                    Laborers_avail_for_swap_list = \
-                        [person for person in Laborers_avail_for_swap_list \
-                            if cfg.persons[person].shift \
-                                == cfg.persons[p].shift]
-
-                    # Keep only the persons in the list who are on a 
-                    # different Team from the given worker.
-                    Laborers_avail_for_swap_list = \
-                        [person for person in Laborers_avail_for_swap_list \
-                            if cfg.persons[person].team \
-                                != cfg.persons[p].team]
+                    # From the index of the active Laborers on the same
+                    # Shift as the given worker (which is kept in the 
+                    # same order as cfg.persons), keep only those who 
+                    # are on a different Team.
+                    Laborers_avail_for_swap_list = [
+                        person for person in laborers_by_shift[
+                            cfg.persons[p].shift.title] \
+                            if person.team != cfg.persons[p].team
+                        ]
 
                     # Randomly shuffle the list of Laborers and select 
                     # the first one as the person with whom the given 
@@ -1868,12 +2282,17 @@ def check_for_and_execute_worker_swaps():
                     # Swap the two Laborers' Teams. (That will 
                     # automatically swap, e.g., their supervisors, as 
                     # well?)
+                    remove_person_from_org_structure_indexes(
+                        cfg.persons[p])
+                    remove_person_from_org_structure_indexes(
+                        Laborer_selected_for_swap)
                     first_Laborer_old_Team = cfg.persons[p].team
-                    second_Laborer_old_Team \
-                        = cfg.persons[Laborer_selected_for_swap].team
+                    second_Laborer_old_Team = Laborer_selected_for_swap.team
                     cfg.persons[p].team = second_Laborer_old_Team
-                    cfg.persons[Laborer_selected_for_swap].team \
-                        = first_Laborer_old_Team
+                    Laborer_selected_for_swap.team = first_Laborer_old_Team
+                    add_person_to_org_structure_indexes(cfg.persons[p])
+                    add_person_to_org_structure_indexes(
+                        Laborer_selected_for_swap)
 
 
 def check_for_and_execute_worker_separation_and_replacement():
@@ -1906,9 +2325,70 @@ def check_for_and_execute_worker_separation_and_replacement():
     # during iteration".
     # ------------------------------------------------------------------
 
+    # ------------------------------------------------------------------
+    # Find the start of the window of days for which each type of 
+    # record will be counted. These don't depend on the person; and 
+    # because each person's counts are kept with prefix sums in the 
+    # shared history store (see wfs_history.py), the sum for a given 
+    # person over any window is found in constant time, regardless of 
+    # how many days have elapsed.
+    #
+    # Each window is expressed as the index of the first item in the 
+    # list of a person's values for all days that's included in the 
+    # sum (as before, when the lists were sliced to find the sums), so 
+    # that the windows are unchanged.
+    # ------------------------------------------------------------------
+    history = cfg.persons_history
+
+    # Absences recorded for a person during the period covering the 
+    # current day plus the previous N days.
+    #
+    # Note that because workers are checked for termination events 
+    # *after* the end of the workday, the day just completed is always 
+    # checked for termination events. If 
+    # previous_days_to_check_for_absences_num = 1, then the 
+    # day-just-ended is checked, *and also the 1 day previous to that*.
+    #
+    # The lowest value that this can have is 0, even if there's a 
+    # sizeable priming period. That's because slicing of the list 
+    # [start:stop] indexes the first item in the list as 0, not 
+    # (e.g.) -31.
+    previous_days_to_check_for_absences_num = 16
+    earliest_index_to_include_for_absences = \
+        (cfg.day_of_sim_iter - previous_days_to_check_for_absences_num) \
+            - cfg.day_of_sim_iter_for_first_simulated_day
+    if earliest_index_to_include_for_absences \
+            <= cfg.day_of_sim_iter_for_first_simulated_day:
+        earliest_index_to_include_for_absences = 0
+
+    # Lapses, Slips, and Disruptions recorded for a person during the 
+    # period covering the current day plus the previous N days. These 
+    # calculations have the same conditions and caveats as the 
+    # calculation of the number of Absences.
+    previous_days_to_check_for_lapses_num = 90
+    earliest_index_to_include_for_lapses \
+        = cfg.day_of_sim_iter - previous_days_to_check_for_lapses_num
+    if earliest_index_to_include_for_lapses \
+            <= cfg.day_of_sim_iter_for_first_simulated_day:
+        earliest_index_to_include_for_lapses = 0
+
+    previous_days_to_check_for_slips_num = 90
+    earliest_index_to_include_for_slips \
+        = cfg.day_of_sim_iter - previous_days_to_check_for_slips_num
+    if earliest_index_to_include_for_slips \
+            <= cfg.day_of_sim_iter_for_first_simulated_day:
+        earliest_index_to_include_for_slips = 0
+
+    previous_days_to_check_for_disruptions_num = 45
+    earliest_index_to_include_for_disruptions \
+        = cfg.day_of_sim_iter - previous_days_to_check_for_disruptions_num
+    if earliest_index_to_include_for_disruptions \
+            <= cfg.day_of_sim_iter_for_first_simulated_day:
+        earliest_index_to_include_for_disruptions = 0
+
     list_of_persons_to_replace = []
 
-    for p in cfg.persons:
+    for p in cfg.active_persons:
 
         # If a person is the Production Director or a Shift Manager,
         # he cannot be separated; do not check whether a separation 
@@ -1929,174 +2409,95 @@ def check_for_and_execute_worker_separation_and_replacement():
         # event occurs.
         # ==============================================================
 
+        row = cfg.persons[p].history_row
+
         # --------------------------------------------------------------
         # Absences recorded for the person during the period covering 
         # the current day plus the previous N days.
         # --------------------------------------------------------------
-
-        # Find the current day's spot in the list, count backwards by N 
-        # to find the spot of the list correspondingn to the first day 
-        # of the period that should be searched for events, and delete 
-        # any items found in the list before that point.
-        #
-        # Note that because workers are checked for termination events 
-        # *after* the end of the workday, the day just completed is 
-        # always checked for termination events. If 
-        # previous_days_to_check_num = 1, then the day-just-ended is 
-        # checked, *and also the 1 day previous to that*.
-
-        list_of_absences_recorded_for_pers \
-            = list(cfg.persons[p].dict_days_with_num_of_absences_recorded.values())
-        previous_days_to_check_for_absences_num = 16
-
-        # The lowest value that this can have is 0, even if there's a 
-        # sizeable priming period. That's because slicing of the list 
-        # [start:stop] indexes the first item in the list as 0, not 
-        # (e.g.) -31.
-        earliest_index_to_include = \
-            (cfg.day_of_sim_iter - previous_days_to_check_for_absences_num) \
-                - cfg.day_of_sim_iter_for_first_simulated_day
-
-        cfg.day_of_sim_iter - previous_days_to_check_for_absences_num
-
-        if earliest_index_to_include \
-                <= cfg.day_of_sim_iter_for_first_simulated_day:
-            list_of_absences_recorded_for_pers_in_last_n_days \
-                = list_of_absences_recorded_for_pers
-        elif earliest_index_to_include \
-                > cfg.day_of_sim_iter_for_first_simulated_day:
-            list_of_absences_recorded_for_pers_in_last_n_days = \
-                list_of_absences_recorded_for_pers[earliest_index_to_include:]
         pers_absences_recorded_in_last_n_days_sum = \
-            sum(list_of_absences_recorded_for_pers_in_last_n_days)
+            history.return_sum_of_counter_from_day_index(
+                row,
+                "absences_recorded",
+                earliest_index_to_include_for_absences,
+                cfg.day_of_sim_iter,
+                )
 
         # --------------------------------------------------------------
         # Idea behaviors generated by the person to date.
         # --------------------------------------------------------------
         pers_idea_behaviors_to_date_sum = \
-            sum(list(cfg.persons[p].dict_days_with_num_of_idea_behaviors.values()))
+            history.return_sum_of_counter_from_day_index(
+                row, "idea_behaviors", 0, cfg.day_of_sim_iter)
 
         # --------------------------------------------------------------
         # Lapses recorded for the person during the period covering the 
         # current day plus the previous N days.
         # --------------------------------------------------------------
-
-        # This calculation has the same conditions and caveats as the 
-        # calculation of the number of Absences recorded during the 
-        # current and previous N days.
-
-        list_of_lapses_recorded_for_pers \
-            = list(cfg.persons[p].dict_days_with_num_of_lapses_recorded.values())
-
-        previous_days_to_check_for_lapses_num = 90
-        earliest_index_to_include \
-            = cfg.day_of_sim_iter - previous_days_to_check_for_lapses_num
-
-        if earliest_index_to_include \
-                <= cfg.day_of_sim_iter_for_first_simulated_day:
-            list_of_lapses_recorded_for_pers_in_last_n_days \
-                = list_of_lapses_recorded_for_pers
-        elif earliest_index_to_include \
-                > cfg.day_of_sim_iter_for_first_simulated_day:
-            list_of_lapses_recorded_for_pers_in_last_n_days \
-                = list_of_lapses_recorded_for_pers[earliest_index_to_include:]
         pers_lapses_recorded_in_last_n_days_sum = \
-            sum(list_of_lapses_recorded_for_pers_in_last_n_days)
+            history.return_sum_of_counter_from_day_index(
+                row,
+                "lapses_recorded",
+                earliest_index_to_include_for_lapses,
+                cfg.day_of_sim_iter,
+                )
 
         # --------------------------------------------------------------
         # Slips recorded for the person during the period covering the 
         # current day plus the previous N days.
         # --------------------------------------------------------------
-
-        # This calculation has the same conditions and caveats as the 
-        # calculation of the number of Absences recorded during the 
-        # current and previous N days.
-
-        list_of_slips_recorded_for_pers \
-            = list(cfg.persons[p].dict_days_with_num_of_slips_recorded.values())
-
-        previous_days_to_check_for_slips_num = 90
-        earliest_index_to_include \
-            = cfg.day_of_sim_iter - previous_days_to_check_for_slips_num
-
-        if earliest_index_to_include \
-                <= cfg.day_of_sim_iter_for_first_simulated_day:
-            list_of_slips_recorded_for_pers_in_last_n_days \
-                = list_of_slips_recorded_for_pers
-        elif earliest_index_to_include \
-                > cfg.day_of_sim_iter_for_first_simulated_day:
-            list_of_slips_recorded_for_pers_in_last_n_days = \
-                list_of_slips_recorded_for_pers[earliest_index_to_include:]
         pers_slips_recorded_in_last_n_days_sum = \
-            sum(list_of_slips_recorded_for_pers_in_last_n_days)
+            history.return_sum_of_counter_from_day_index(
+                row,
+                "slips_recorded",
+                earliest_index_to_include_for_slips,
+                cfg.day_of_sim_iter,
+                )
 
         # --------------------------------------------------------------
         # Disruptions recorded for the person during the period covering
         # the current day plus the previous N days.
         # --------------------------------------------------------------
-
-        # This calculation has the same conditions and caveats as the 
-        # calculation of the number of Absences recorded during the 
-        # current and previous N days.
-
-        list_of_disruptions_recorded_for_pers \
-            = list(cfg.persons[p].dict_days_with_num_of_disruptions_recorded.values())
-
-        previous_days_to_check_for_disruptions_num = 45
-        earliest_index_to_include \
-            = cfg.day_of_sim_iter - previous_days_to_check_for_disruptions_num
-
-        if earliest_index_to_include \
-                <= cfg.day_of_sim_iter_for_first_simulated_day:
-            list_of_disruptions_recorded_for_pers_in_last_n_days \
-                = list_of_disruptions_recorded_for_pers
-        elif earliest_index_to_include \
-                > cfg.day_of_sim_iter_for_first_simulated_day:
-            list_of_disruptions_recorded_for_pers_in_last_n_days \
-                = list_of_disruptions_recorded_for_pers[earliest_index_to_include:]
         pers_disruptions_recorded_in_last_n_days_sum = \
-            sum(list_of_disruptions_recorded_for_pers_in_last_n_days)
+            history.return_sum_of_counter_from_day_index(
+                row,
+                "disruptions_recorded",
+                earliest_index_to_include_for_disruptions,
+                cfg.day_of_sim_iter,
+                )
 
         # --------------------------------------------------------------
         # Sabotages recorded for the person to date.
         # --------------------------------------------------------------
         pers_sabotages_recorded_to_date_sum = \
-            sum(list(cfg.persons[p].dict_days_with_num_of_sabotages_recorded.values()))
+            history.return_sum_of_counter_from_day_index(
+                row, "sabotages_recorded", 0, cfg.day_of_sim_iter)
 
         # --------------------------------------------------------------
         # Unrecorded (False Negative) Good behaviors for the person to 
         # date.
         # --------------------------------------------------------------
         pers_FN_good_records_to_date_sum = \
-            sum(list(cfg.persons[p].dict_days_with_num_of_FN_good_records.values()))
-
-        # Note that when instantiated, a given person's 
-        # dict_days_with_actual_eff_values dictionary includes None 
-        # values for all days, including those days that haven't been 
-        # simulated yet. When calculating means, we restrict the 
-        # calculation to those entries in the dict corresponding to days
-        # that have already been simulated.
-        #
-        # Delete from the list any None values, which correspond to days
-        # on which a person was absent and thus had no actual or 
-        # recorded Efficacy.
+            history.return_sum_of_counter_from_day_index(
+                row, "FN_good_records", 0, cfg.day_of_sim_iter)
+
+        # The means of a person's Efficacy values are calculated for 
+        # the days before the current day, leaving out days on which 
+        # the person was absent and thus had no actual or recorded 
+        # Efficacy (i.e., the None values). The sums are exact 
+        # Fractions, so the means equal those that statistics.mean() 
+        # would calculate for the same values.
 
         # --------------------------------------------------------------
         # Mean of actual Efficacy values.
         # --------------------------------------------------------------
 
         # On the first day, there won't yet be any Efficacy values.
-        try:
-            temp_list = \
-                list(cfg.persons[p].dict_days_with_actual_eff_values.values())[
-                    0:(cfg.day_of_sim_iter \
-                        - cfg.day_of_sim_iter_for_first_simulated_day)
-                    ]
-            list_of_actual_eff_values_without_Nones \
-                = [v for v in temp_list if v is not None]
-            pers_actual_eff_values_mean = \
-                statistics.mean(list_of_actual_eff_values_without_Nones)
-        except:
+        values_sum, values_num = history.return_sum_and_num_of_eff_values(
+            row, "actual_eff_values", cfg.day_of_sim_iter)
+        if values_num > 0:
+            pers_actual_eff_values_mean = float(values_sum / values_num)
+        else:
             pers_actual_eff_values_mean = None
 
         # --------------------------------------------------------------
@@ -2104,17 +2505,11 @@ def check_for_and_execute_worker_separation_and_replacement():
         # --------------------------------------------------------------
 
         # On the first day, there won't yet be any Efficacy values.
-        try:
-            temp_list = \
-                list(cfg.persons[p].dict_days_with_recorded_eff_values.values())[
-                    0:(cfg.day_of_sim_iter \
-                        - cfg.day_of_sim_iter_for_first_simulated_day)
-                    ]
-            list_of_recorded_eff_values_without_Nones \
-                = [v for v in temp_list if v is not None]
-            pers_recorded_eff_values_mean = \
-                statistics.mean(list_of_recorded_eff_values_without_Nones)
-        except:
+        values_sum, values_num = history.return_sum_and_num_of_eff_values(
+            row, "recorded_eff_values", cfg.day_of_sim_iter)
+        if values_num > 0:
+            pers_recorded_eff_values_mean = float(values_sum / values_num)
+        else:
             pers_recorded_eff_values_mean = None
 
         # --------------------------------------------------------------
@@ -2129,19 +2524,24 @@ def check_for_and_execute_worker_separation_and_replacement():
             pers_current_colleagues_total_num = 0
 
         # --------------------------------------------------------------
-        # Mean actual Efficacy behaviors for colleagues.
+        # Mean actual Efficacy behaviors for colleagues (including 
+        # their values for the current day).
         # --------------------------------------------------------------
         try:
-            list_of_all_colleague_actual_eff_values = []
+            colleagues_values_sum = 0
+            colleagues_values_num = 0
             for c in cfg.persons[p].colleagues:
-                list_of_all_colleague_actual_eff_values.extend(
-                    list(c.dict_days_with_actual_eff_values.values())
-                    )
-            list_of_all_colleague_actual_eff_values \
-                = [v for v in list_of_all_colleague_actual_eff_values \
-                    if v is not None]
+                values_sum, values_num = \
+                    history.return_sum_and_num_of_eff_values(
+                        c.history_row,
+                        "actual_eff_values",
+                        cfg.day_of_sim_iter,
+                        include_day_u=True,
+                        )
+                colleagues_values_sum += values_sum
+                colleagues_values_num += values_num
             pers_colleagues_actual_eff_values_mean \
-                = statistics.mean(list_of_all_colleague_actual_eff_values)
+                = float(colleagues_values_sum / colleagues_values_num)
         except:
             # This is the case of the Production Director, who has no 
             # colleagues.
@@ -2742,16 +3142,12 @@ def check_for_and_execute_worker_separation_and_replacement():
         # newly-generated person.
         separate_and_replace_worker_with_new_person(person)
 
-    # Recalculate all supervisor, subordinate, and colleage relationships,
-    # to account for any changes in personnel.
-    assign_supervisor_to_each_person()
-    assign_subordinates_to_all_supervisors()
-    assign_colleagues_to_all_persons()
-
-    # Update all persons' portion of same-sex colleagues (since a 
-    # replacement worker may have a different sex than the one whom he 
-    # replaced).
-    update_persons_colleagues_of_same_sex_prtn()
+    # Recalculate the supervisor, subordinate, and colleague 
+    # relationships (and portion of same-sex colleagues) of the members
+    # of those teams and shifts whose membership has changed, to account
+    # for any changes in personnel. (A replacement worker may have a 
+    # different sex than the one whom he replaced.)
+    update_personal_relationships_in_changed_org_units()
 
 
 def separate_and_replace_worker_with_new_person(person_to_separate_u):
@@ -2782,6 +3178,10 @@ def separate_and_replace_worker_with_new_person(person_to_separate_u):
     task_to_transfer = person_to_separate_u.task
     curr_actvty_to_transfer = person_to_separate_u.curr_actvty
 
+    # Remove the person from the indexes of each team's and shift's 
+    # active members.
+    remove_person_from_org_structure_indexes(person_to_separate_u)
+
     # ------------------------------------------------------------------
     # Randomly generate a new person.
     # ------------------------------------------------------------------
@@ -2791,6 +3191,9 @@ def separate_and_replace_worker_with_new_person(person_to_separate_u):
 
     # Create the new Person object.
     cfg.persons[new_person_index] = Person_class()
+    add_person_to_index_of_persons_by_ID(cfg.persons[new_person_index])
+    add_person_to_active_roster(
+        new_person_index, cfg.persons[new_person_index])
     # print(cfg.persons[new_person_index])
 
     # ------------------------------------------------------------------
@@ -2803,6 +3206,10 @@ def separate_and_replace_worker_with_new_person(person_to_separate_u):
     # so that he no longer generates activities and isn't connected to a
     # supervisor, colleagues, or subordinates.
     person_to_separate_u.separated = True
+    person_to_separate_u.sup = None
+    person_to_separate_u.colleagues = None
+    person_to_separate_u.subs = None
+    move_person_from_active_roster_to_archive(person_to_separate_u)
 
     # ------------------------------------------------------------------
     # Connect and activate the new person who is being employed.
@@ -2817,6 +3224,7 @@ def separate_and_replace_worker_with_new_person(person_to_separate_u):
     cfg.persons[new_person_index].subs = subs_to_transfer
     cfg.persons[new_person_index].task = task_to_transfer
     cfg.persons[new_person_index].curr_actvty = curr_actvty_to_transfer
+    add_person_to_org_structure_indexes(cfg.persons[new_person_index])
 
     # Generate an "Onboarding" behavior and record for the newly hired 
     # person to the behaviors DF.
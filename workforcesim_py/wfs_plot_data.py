@@ -0,0 +1,340 @@
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   Synaptans WorkforceSim™ is open-source software for simulating   ║
+# ║   the complex dynamics of a factory workforce.                     ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden • ©2021-23 NeuraXenetica LLC     ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+"""
+This module provides the aggregation layer from which the plots in 
+wfs_visualizer.py (and any other consumer, such as the web app) obtain
+their data. Each aggregate (e.g., the mean Efficacy by weekday, or the 
+per-person totals used for the interpersonal correlations heatmap) is 
+calculated directly from behavs_act_df and persons_df -- without first 
+copying them -- the first time that it's requested, and is then 
+memoized in a Plot_data_cache_class object, of which there is one per 
+dataset.
+"""
+
+import uuid
+
+import pandas as pd
+
+# Import other modules from this package.
+import config as cfg
+
+
+# ----------------------------------------------------------------------
+# The Behavior Comptypes and Record Conf Mat values for which per-person
+# totals are calculated.
+# ----------------------------------------------------------------------
+BEHAVIOR_COMPTYPES_COUNTED_PER_PERSON = [
+    "Presence",
+    "Idea",
+    "Lapse",
+    "Feat",
+    "Slip",
+    "Teamwork",
+    "Disruption",
+    "Sacrifice",
+    "Sabotage",
+    ]
+
+RECORD_CONF_MATS_COUNTED_PER_PERSON = [
+    "True Positive",
+    "False Negative",
+    ]
+
+# The columns that describe a single behavior-record event (and whose 
+# correlations are shown in the first heatmap).
+EVENT_ROW_CORRELATION_COLS = [
+    "Sub Health",
+    "Sub Commitment",
+    "Sub Perceptiveness",
+    "Sub Dexterity",
+    "Sub Sociality",
+    "Sub Goodness",
+    "Sub Strength",
+    "Sub Openmindedness",
+    "Sub Age",
+    "Sup-Sub Age Difference",
+    "Sub Same-Sex Colleagues Prtn",
+    "Weekday Num",
+    "Actual Efficacy",
+    "Recorded Efficacy",
+    ]
+
+# The mday series columns (see add_eff_mday_series_to_behavs_act_df()).
+MDAY_SERIES_COLS = [
+    "D-4 Eff",
+    "D-3 Eff",
+    "D-2 Eff",
+    "D-1 Eff",
+    "D0 Eff",
+    "D+1 Eff",
+    "D+2 Eff",
+    "D+3 Eff",
+    "D+4 Eff",
+    ]
+
+
+class Plot_data_cache_class(object):
+    """
+    Memoizes the aggregates calculated for one dataset (i.e., one pair 
+    of behavs_act_df and persons_df). The DFs are only read, never 
+    copied or modified; an aggregate returned by the cache is shared by
+    all of its consumers and shouldn't be modified by them.
+    """
+
+    def __init__(self, behavs_act_df_u, persons_df_u):
+        """
+        Creates an empty cache for a dataset.
+
+        PARAMETERS
+        ----------
+        behavs_act_df_u
+            The dataset's behavs_act_df
+        persons_df_u
+            The dataset's persons_df
+        """
+
+        self.behavs_act_df = behavs_act_df_u
+        self.persons_df = persons_df_u
+
+        # An identifier that's unique to this dataset (e.g., for use in
+        # the keys of caches of rendered plots).
+        self.dataset_id = uuid.uuid4().hex
+
+        self.aggregates = {}
+
+    def return_whether_dataset_matches(self, behavs_act_df_u, persons_df_u):
+        """
+        Returns whether the cache belongs to the given dataset.
+
+        PARAMETERS
+        ----------
+        behavs_act_df_u
+            A behavs_act_df
+        persons_df_u
+            A persons_df
+        """
+
+        return (self.behavs_act_df is behavs_act_df_u) \
+            and (self.persons_df is persons_df_u)
+
+    def return_aggregate(self, key_u, calculate_aggregate_u):
+        """
+        Returns the aggregate stored under a given key, calculating it 
+        first if it isn't yet stored.
+
+        PARAMETERS
+        ----------
+        key_u
+            The key under which the aggregate is stored
+        calculate_aggregate_u
+            A function that calculates the aggregate if it isn't stored
+        """
+
+        if key_u not in self.aggregates:
+            self.aggregates[key_u] = calculate_aggregate_u()
+        return self.aggregates[key_u]
+
+    def return_mean_of_col_by_group(self, group_col_u, mean_col_u):
+        """
+        Returns a DF with the mean of one column of behavs_act_df for 
+        each value of another column (e.g., the mean Actual Efficacy by 
+        weekday).
+
+        PARAMETERS
+        ----------
+        group_col_u : str
+            The column by whose values rows should be grouped
+        mean_col_u : str
+            The column whose mean should be calculated
+        """
+
+        return self.return_aggregate(
+            ("Mean by group", group_col_u, mean_col_u),
+            lambda: self.behavs_act_df.groupby(
+                group_col_u, as_index=False).agg({mean_col_u: 'mean'}),
+            )
+
+    def return_per_person_df(self):
+        """
+        Returns a DF with one row for each subject in behavs_act_df, 
+        containing his (latest) stats, his mean and SD of Actual 
+        Efficacy, and his total numbers of behaviors of each Comptype 
+        and of records with each Conf Mat value.
+        """
+
+        return self.return_aggregate(
+            "Per person",
+            self.calculate_per_person_df,
+            )
+
+    def calculate_per_person_df(self):
+        """
+        Calculates the DF returned by return_per_person_df().
+        """
+
+        # Rather than one-hot encoding the full DF, only the indicator 
+        # columns that are summed are assembled (together with the 
+        # columns that are aggregated in other ways) into the DF that's 
+        # grouped.
+        df_to_group = pd.DataFrame({
+            col: self.behavs_act_df[col] for col in [
+                "Sub ID",
+                "Sub Health",
+                "Sub Commitment",
+                "Sub Perceptiveness",
+                "Sub Dexterity",
+                "Sub Sociality",
+                "Sub Goodness",
+                "Sub Strength",
+                "Sub Openmindedness",
+                "Sub Age",
+                "Sub Workstyle",
+                "Sup-Sub Age Difference",
+                "Sub Same-Sex Colleagues Prtn",
+                "Actual Efficacy",
+                "Actual Efficacy (SD)",
+                "Recorded Efficacy",
+                ]
+            })
+        aggregations = {
+            "Sub Health": 'last',
+            "Sub Commitment": 'last',
+            "Sub Perceptiveness": 'last',
+            "Sub Dexterity": 'last',
+            "Sub Sociality": 'last',
+            "Sub Goodness": 'last',
+            "Sub Strength": 'last',
+            "Sub Openmindedness": 'last',
+            "Sub Age": 'last',
+            "Sub Workstyle": 'last',
+            "Sup-Sub Age Difference": 'mean',
+            "Sub Same-Sex Colleagues Prtn": 'mean',
+            "Actual Efficacy": 'mean',
+            "Actual Efficacy (SD)": 'std',
+            "Recorded Efficacy": 'mean',
+            }
+
+        for comptype in BEHAVIOR_COMPTYPES_COUNTED_PER_PERSON:
+            df_to_group["BC " + comptype] = \
+                (self.behavs_act_df["Behavior Comptype"] == comptype) \
+                    .astype("uint8")
+            aggregations["BC " + comptype] = 'sum'
+        for conf_mat in RECORD_CONF_MATS_COUNTED_PER_PERSON:
+            df_to_group["RCM " + conf_mat] = \
+                (self.behavs_act_df["Record Conf Mat"] == conf_mat) \
+                    .astype("uint8")
+            aggregations["RCM " + conf_mat] = 'sum'
+
+        return df_to_group.groupby("Sub ID", as_index=False).agg(
+            aggregations)
+
+    def return_event_row_correlations_df(self):
+        """
+        Returns a DF with the correlations between the variables that 
+        all appear on the same row of behavs_act_df.
+        """
+
+        # It's important to convert all columns to a numerical type, to
+        # keep Pandas from eliminating some of the (non-numerical) 
+        # columns.
+        return self.return_aggregate(
+            "Event row correlations",
+            lambda: self.behavs_act_df[EVENT_ROW_CORRELATION_COLS] \
+                .astype(float).corr(),
+            )
+
+    def return_mday_series_means(self, d0_event_col_name_u, d0_event_name_u):
+        """
+        Returns a list of the mean values of the mday series columns for
+        the rows with a given D0 event.
+
+        PARAMETERS
+        ----------
+        d0_event_col_name_u : str
+            Name of the column (e.g., "Behavior Type", "Record Conf 
+            Mat") in which the D0 event is noted
+        d0_event_name_u : str
+            Name of the D0 event type (e.g., "Good", "False Negative")
+        """
+
+        def calculate_mday_series_means():
+            rows_with_d0_event = self.behavs_act_df[d0_event_col_name_u] \
+                == d0_event_name_u
+
+            # Like the other aggregations, this raises an error if there
+            # aren't any such rows.
+            if not rows_with_d0_event.any():
+                raise KeyError(d0_event_name_u)
+
+            return [
+                self.behavs_act_df.loc[rows_with_d0_event, col] \
+                    .astype(float).mean()
+                for col in MDAY_SERIES_COLS
+                ]
+
+        return self.return_aggregate(
+            ("Mday series means", d0_event_col_name_u, d0_event_name_u),
+            calculate_mday_series_means,
+            )
+
+
+def return_plot_data_cache():
+    """
+    Returns the aggregate cache for the current dataset (i.e., the 
+    current cfg.behavs_act_df and cfg.persons_df), creating it (and 
+    storing it in cfg.plot_data_cache) if it doesn't yet exist.
+    """
+
+    if (cfg.plot_data_cache is None) \
+            or not cfg.plot_data_cache.return_whether_dataset_matches(
+                cfg.behavs_act_df, cfg.persons_df):
+        cfg.plot_data_cache = Plot_data_cache_class(
+            cfg.behavs_act_df, cfg.persons_df)
+
+    return cfg.plot_data_cache
+
+
+# ██████████████████████████████████████████████████████████████████████
+# █                                                                    █
+# █    █████  ██  ██ █ ███   ████   ████ █████  ███   █ ███   █████    █
+# █   ██   ██ ██  ██ ██  ██ ██  ██ ██  █  ██   ██  ██ ██  ██ ██   ██   █
+# █   ██      ██  ██ ██  ██ ██   █ ██  █  ██   ██   █ ██  ██ ██        █
+# █    █████   ██ ██ ██  ██ ██   █ ██  █  ██   ██   █ ██  ██  █████    █
+# █        ██   ███  ██  ██ ██████ ██  █  ██   ██████ ██  ██      ██   █
+# █   ██   ██   ██   ██  ██ ██   █ ████   ██   ██   █ ██  ██ ██   ██   █
+# █    █████    ██   ██  ██ ██   █ ██     ██   ██   █ ██  ██  █████    █
+# █                                                                    █
+# █                        /██\                      /███\             █
+# █  █   █            █    █  █                      █   █  ██    (TM) █
+# █  █   █            █    █                         █                 █
+# █  █ █ █ /███\ /██\ █  █ ███ /███\ /██\ /███ /███\ \███\  █  █/█ █\  █
+# █  █ █ █ █   █ █  █ ███  █   █   █ █  █ █    █  ██     █  █  ██ █ █  █
+# █  █ █ █ █   █ █    █  █ █   █   █ █    █    ███   █   █  █  ██ █ █  █
+# █  \█ █/ \███/ █    █  █ █   \███/ █    \███ \███  \███/  █  ██ █ █  █
+# █                                                                    █
+# █         @     @          @     @                                   █
+# █      @    @ @  @       @    @   @@                                 █
+# █     @  @   @@         @@   @ @           █\\\\\\\\\\\\\\\\\\\\\    █
+# █      @@ @ @             @@@   @          ██\\\\\\\\\\\\\\\\\\\\\   █
+# █         @  @               @   @         ███\\\\\\\\\\\\\\\\\\\\\  █
+# █          █  █               █  █         ███▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒ █
+# █      █\\\█\\█\          █\\\█\\█\        ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █      ██\\█\\█\\         ██\\█\\█\\       ███░██░██░█☺░██░██░██░██░ █
+# █ \☺/  ███\\\\\\\\        ███\\\\\\\\      ███░██░██░██░██░██░██░██░ █
+# █  0   ███▒▒▒▒▒▒▒▒▒  ☺    ███▒▒▒▒▒▒▒▒▒  ☺  ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █ / \  ███▒▒▒▒▒▒▒▒▒ /U\   ███▒▒▒▒▒▒▒▒▒ /O] ███▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒ █
+# █      ███▒▒▒▒▒▒▒▒▒  LL   ███▒▒▒▒▒▒▒▒▒ / \ ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █   ☺   ██▒▒█▒███▒▒        ██▒▒███▒▒█▒      ██░████████░██░██░☺█░██░ █
+# █  /8\   █▒▒█▒███▒▒     ☺   █▒▒███▒▒█▒   ☺   █░████☺███░██░██░██░██░ █
+# █   /|    ▒▒▒▒███▒▒    <V>   ▒▒███▒▒▒▒  {D\   ░███[O\██░░░░░░░░░░░░░ █
+# █                      / \               /|       / \                █
+# █                                                                    █
+# ██████████████████████████████████████████████████████████████████████
@@ -0,0 +1,540 @@
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   Synaptans WorkforceSim™ is open-source software for simulating   ║
+# ║   the complex dynamics of a factory workforce.                     ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden • ©2021-23 NeuraXenetica LLC     ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+"""
+This module defines the optional struct-of-arrays model of the active
+population that is used when cfg.USE_VECTORIZED_POPULATION_ENGINE is 
+True. The stats, base probabilities, and modified probabilities of all
+persons who haven't been separated are kept as NumPy columns (one 
+element per person), so that each day's modifiers can be calculated for
+the whole population at once with array math and batched random draws
+(as can the day's attendance, Efficacy, and behavior rolls). The 
+Person objects remain the interface used by the rest of the simulation:
+after the arrays have been updated, the resulting values are written 
+back to each person's attributes.
+"""
+
+import numpy as np
+
+# Import other modules from this package.
+import config as cfg
+import wfs_behaviors as bhv
+
+
+# ----------------------------------------------------------------------
+# The probabilities for which both a base and a modified value are 
+# stored for each person. (Each name corresponds to a pair of Person 
+# attributes, e.g., prob_base_idea and prob_modified_idea.)
+# ----------------------------------------------------------------------
+POPULATION_PROBS = [
+    "presence",
+    "idea",
+    "lapse",
+    "feat",
+    "slip",
+    "teamwork",
+    "disruption",
+    "sacrifice",
+    "sabotage",
+    "recording_accurately",
+    ]
+
+# The Good and Poor behaviors for which a daily defense roll is made, in
+# the order in which they're generated for each person: (behavior 
+# comptype, behavior type, name of the probability).
+BEHAVIORS_ROLLED_DAILY = [
+    ("Idea", "Good", "idea"),
+    ("Lapse", "Poor", "lapse"),
+    ("Feat", "Good", "feat"),
+    ("Slip", "Poor", "slip"),
+    ("Teamwork", "Good", "teamwork"),
+    ("Disruption", "Poor", "disruption"),
+    ("Sacrifice", "Good", "sacrifice"),
+    ("Sabotage", "Poor", "sabotage"),
+    ]
+
+# The integer codes by which Workstyle groups are stored in the arrays.
+WORKSTYLE_CODES = {
+    "Group A": 0,
+    "Group B": 1,
+    "Group C": 2,
+    "Group D": 3,
+    "Group E": 4,
+    }
+
+
+class Population_arrays_class(object):
+    """
+    A struct-of-arrays store of the stats and probabilities of a given
+    list of (active) persons. Element i of every array belongs to the
+    Person object self.persons[i].
+    """
+
+    def __init__(self,
+        persons_u, # list of Person objects to be stored
+        ):
+
+        self.persons = list(persons_u)
+
+        # Stats that don't change over the course of a person's 
+        # employment.
+        self.age = np.array(
+            [person.age for person in self.persons], dtype=np.float64)
+        self.history_row = np.array(
+            [person.history_row for person in self.persons], dtype=np.intp)
+        self.workstyle_code = np.array(
+            [WORKSTYLE_CODES.get(person.workstyle, -1) \
+                for person in self.persons], dtype=np.int8)
+
+        # Base and modified probabilities.
+        self.prob_base = {}
+        self.prob_modified = {}
+        for prob in POPULATION_PROBS:
+            self.prob_base[prob] = np.array(
+                [getattr(person, "prob_base_" + prob) \
+                    for person in self.persons], dtype=np.float64)
+            self.prob_modified[prob] = self.prob_base[prob].copy()
+
+        # Base and modified Efficacy levels.
+        self.level_base_efficacy = np.array(
+            [person.level_base_efficacy for person in self.persons],
+            dtype=np.float64)
+        self.level_modified_efficacy = self.level_base_efficacy.copy()
+
+        # The daily variability in Efficacy, which is determined by a 
+        # person's Workstyle group. (A Person object only acquires this
+        # attribute once his modifiers have first been calculated.)
+        self.workstyle_eff_daily_variability = np.array(
+            [getattr(person, "workstyle_eff_daily_variability", 0.0) \
+                for person in self.persons], dtype=np.float64)
+
+    def __len__(self):
+        return len(self.persons)
+
+    def return_whether_persons_match(self, persons_u):
+        """
+        Returns True if the store holds exactly the given list of Person
+        objects (in the same order).
+
+        PARAMETERS
+        ----------
+        persons_u
+            A list of Person objects
+        """
+
+        if len(persons_u) != len(self.persons):
+            return False
+        for person_stored, person in zip(self.persons, persons_u):
+            if person_stored is not person:
+                return False
+        return True
+
+    def return_relationship_stats(self):
+        """
+        Returns arrays of those stats that depend on a person's current
+        supervisor and colleagues (which may change from day to day as
+        a result of separations and shift swaps): whether the person has
+        colleagues, the proportion of his colleagues who are of the same
+        sex, whether he has a supervisor, and his supervisor's age.
+        """
+
+        num_of_persons = len(self.persons)
+        has_colleagues = np.zeros(num_of_persons, dtype=bool)
+        colleagues_of_same_sex_prtn = np.zeros(num_of_persons)
+        has_sup = np.zeros(num_of_persons, dtype=bool)
+        sup_age = np.zeros(num_of_persons)
+
+        for i, person in enumerate(self.persons):
+            if person.colleagues:
+                has_colleagues[i] = True
+                colleagues_of_same_sex_prtn[i] = \
+                    person.colleagues_of_same_sex_prtn
+            if person.sup:
+                has_sup[i] = True
+                sup_age[i] = person.sup.age
+
+        return has_colleagues, colleagues_of_same_sex_prtn, has_sup, sup_age
+
+    def reset_modified_probs_to_base_probs(self):
+        """
+        Resets all modified probabilities (and the modified Efficacy 
+        level) to their base values.
+        """
+
+        for prob in POPULATION_PROBS:
+            self.prob_modified[prob][:] = self.prob_base[prob]
+        self.level_modified_efficacy[:] = self.level_base_efficacy
+
+    def write_modified_values_to_persons(self):
+        """
+        Writes the modified probabilities, modified Efficacy level, and
+        daily Efficacy variability stored in the arrays to the 
+        attributes of the corresponding Person objects.
+        """
+
+        prob_modified_lists = {
+            prob: self.prob_modified[prob].tolist() \
+                for prob in POPULATION_PROBS
+            }
+        level_modified_efficacy_list = self.level_modified_efficacy.tolist()
+        workstyle_eff_daily_variability_list = \
+            self.workstyle_eff_daily_variability.tolist()
+
+        for i, person in enumerate(self.persons):
+            for prob in POPULATION_PROBS:
+                setattr(
+                    person,
+                    "prob_modified_" + prob,
+                    prob_modified_lists[prob][i],
+                    )
+            person.level_modified_efficacy = level_modified_efficacy_list[i]
+            person.workstyle_eff_daily_variability = \
+                workstyle_eff_daily_variability_list[i]
+
+
+def return_population_arrays_for_active_persons():
+    """
+    Returns the struct-of-arrays store of all persons who haven't been 
+    separated from employment. The store is only rebuilt if the set of 
+    active persons has changed since it was last built (e.g., because 
+    workers were separated and replaced).
+    """
+
+    active_persons = list(cfg.active_persons.values())
+
+    if (cfg.population_arrays is None) \
+        or (not cfg.population_arrays.return_whether_persons_match(
+            active_persons)):
+        cfg.population_arrays = Population_arrays_class(active_persons)
+
+    return cfg.population_arrays
+
+
+def reset_modified_probs_to_base_probs_for_active_persons():
+    """
+    Resets the modified probabilities of all active persons to their 
+    base probabilities, using the population arrays.
+    """
+
+    popl = return_population_arrays_for_active_persons()
+    popl.reset_modified_probs_to_base_probs()
+
+
+def calculate_person_modifiers_for_active_persons():
+    """
+    Calculates (for all active persons at once) the modifiers that 
+    implement dependencies and covariance among certain stats and 
+    variables, and writes the resulting values to the Person objects.
+    This is the vectorized equivalent of
+    pers.calculate_person_modifiers_to_implement_dependencies_and_covariance();
+    all of the day's random numbers for each modifier are drawn in a 
+    single NumPy call.
+    """
+
+    popl = return_population_arrays_for_active_persons()
+    num_of_persons = len(popl)
+    if num_of_persons == 0:
+        return
+
+    strength = cfg.STRENGTH_OF_EFFECT
+    workstyle_code = popl.workstyle_code
+    day_num = cfg.day_of_month_1_indexed
+
+    # ------------------------------------------------------------------
+    # Update persons' probabilities of generating certain Good or Poor
+    # behaviors.
+    # ------------------------------------------------------------------
+
+    # Elevate or reduce the probability of generating an Idea for 
+    # persons in the relevant Workstyle groups.
+    prob_modified_idea = popl.prob_base["idea"].copy()
+    prob_modified_idea[workstyle_code == WORKSTYLE_CODES["Group A"]] \
+        *= (1 + cfg.PROB_ELEVATION_FOR_IDEA_DUE_TO_WORKSTYLE)
+    prob_modified_idea[workstyle_code == WORKSTYLE_CODES["Group E"]] \
+        *= (1 - cfg.PROB_REDUCTION_FOR_IDEA_DUE_TO_WORKSTYLE)
+
+    # Elevate or reduce the probability of generating a Disruption for 
+    # persons in the relevant Workstyle groups.
+    prob_modified_disruption = popl.prob_base["disruption"].copy()
+    prob_modified_disruption[workstyle_code == WORKSTYLE_CODES["Group B"]] \
+        *= (1 + cfg.PROB_ELEVATION_FOR_DISRUPTION_DUE_TO_WORKSTYLE)
+    prob_modified_disruption[workstyle_code == WORKSTYLE_CODES["Group D"]] \
+        *= (1 - cfg.PROB_REDUCTION_FOR_DISRUPTION_DUE_TO_WORKSTYLE)
+
+    prob_modified_teamwork = popl.prob_modified["teamwork"]
+    prob_modified_slip = popl.prob_modified["slip"]
+
+    # Increase the probability of Teamworks and Disruptions beginning on
+    # the 23rd day of the month.
+    if day_num >= 23:
+        days_past_22nd = day_num - 22
+        prob_modified_teamwork *= \
+            (1 + days_past_22nd * strength * np.random.uniform(
+                0.0,
+                cfg.PROB_ELEVATION_MAX_FOR_TEAMWORK_DUE_TO_DAY_IN_MONTH,
+                size=num_of_persons,
+                ))
+        prob_modified_disruption *= \
+            (1 + days_past_22nd * strength * np.random.uniform(
+                0.0,
+                cfg.PROB_ELEVATION_MAX_FOR_DISRUPTION_DUE_TO_DAY_IN_MONTH,
+                size=num_of_persons,
+                ))
+
+    # Increase the probability of a Slip beginning on the 26th day of 
+    # the month.
+    if day_num >= 26:
+        days_past_25th = day_num - 25
+        prob_modified_slip *= \
+            (1 + days_past_25th * strength * np.random.uniform(
+                0.0,
+                cfg.PROB_ELEVATION_MAX_FOR_SLIP_DUE_TO_DAY_IN_MONTH,
+                size=num_of_persons,
+                ))
+
+    popl.prob_modified["idea"] = prob_modified_idea
+    popl.prob_modified["disruption"] = prob_modified_disruption
+
+    # ------------------------------------------------------------------
+    # Calculate the modifiers to persons' Efficacy levels.
+    # ------------------------------------------------------------------
+    eff = popl.level_base_efficacy.copy()
+
+    # Bonus based on Age.
+    eff *= (1 + popl.age * strength * np.random.uniform(
+        0.0, cfg.EFF_BONUS_MAX_FROM_PERSON_AGE, size=num_of_persons))
+
+    # Bonus based on the day of the work week.
+    weekday_num = cfg.current_datetime_obj.weekday()
+    eff *= (1 + weekday_num * strength * np.random.uniform(
+        0.0, cfg.EFF_BONUS_MAX_FROM_WEEKDAY, size=num_of_persons))
+
+    # Bonus beginning on the 20th day of the month.
+    if day_num >= 20:
+        days_past_19th = day_num - 19
+        eff *= (1 + days_past_19th * strength * np.random.uniform(
+            0.0, cfg.EFF_BONUS_MAX_FROM_DAY_IN_MONTH, size=num_of_persons))
+
+    # Penalty in the middle of the calendar year (with no random 
+    # element).
+    day_in_year = cfg.current_datetime_obj.timetuple().tm_yday
+    penalty_multiplier_for_current_day \
+        = 1.0 - ( abs(day_in_year - 182.5) / 182.5 )
+    eff *= (1 - cfg.EFF_PENALTY_MAX_FROM_SEASON_OF_YEAR \
+        * strength * penalty_multiplier_for_current_day)
+
+    # Bonus based on the proportion of colleagues of the same sex, and
+    # penalty based on the difference in age from one's supervisor. 
+    # These only apply to persons who have colleagues or a supervisor.
+    has_colleagues, colleagues_of_same_sex_prtn, has_sup, sup_age \
+        = popl.return_relationship_stats()
+    eff = np.where(
+        has_colleagues,
+        eff * (1 + colleagues_of_same_sex_prtn * strength \
+            * np.random.uniform(
+                0.0, cfg.EFF_BONUS_MAX_FROM_TEAMMATE_SEXES,
+                size=num_of_persons)),
+        eff,
+        )
+    eff = np.where(
+        has_sup,
+        eff * (1 - np.abs(popl.age - sup_age) * strength \
+            * np.random.uniform(
+                0.0, cfg.EFF_PENALTY_MAX_FROM_SUP_AGE_DIFF,
+                size=num_of_persons)),
+        eff,
+        )
+
+    # Bonus or penalty to the Efficacy level, and stable or variable 
+    # daily Efficacy, based on a person's Workstyle group.
+    workstyle_draws = np.random.uniform(0.0, 1.0, size=num_of_persons)
+    workstyle_elevated = np.isin(
+        workstyle_code,
+        [WORKSTYLE_CODES["Group A"], WORKSTYLE_CODES["Group B"]],
+        )
+    workstyle_reduced = np.isin(
+        workstyle_code,
+        [WORKSTYLE_CODES["Group D"], WORKSTYLE_CODES["Group E"]],
+        )
+    eff[workstyle_elevated] *= (1 + cfg.WORKSTYLE_EFF_LEVEL_MODIFIER \
+        * strength * workstyle_draws[workstyle_elevated])
+    eff[workstyle_reduced] *= (1 - cfg.WORKSTYLE_EFF_LEVEL_MODIFIER \
+        * strength * workstyle_draws[workstyle_reduced])
+
+    workstyle_stable = np.isin(
+        workstyle_code,
+        [
+            WORKSTYLE_CODES["Group A"],
+            WORKSTYLE_CODES["Group C"],
+            WORKSTYLE_CODES["Group D"],
+            ],
+        )
+    workstyle_variable = np.isin(
+        workstyle_code,
+        [WORKSTYLE_CODES["Group B"], WORKSTYLE_CODES["Group E"]],
+        )
+    popl.workstyle_eff_daily_variability[workstyle_stable] = 0.0
+    popl.workstyle_eff_daily_variability[workstyle_variable] = \
+        cfg.WORKSTYLE_EFF_MAX_DAILY_VARIABILITY * strength
+
+    # Bonus (or penalty) based on the accurate or inaccurate recording 
+    # of Good behaviors in the previous days. (This involves no random 
+    # draws; the values are read from each person's ring buffer of 
+    # recent Good records.)
+    eff *= np.array([
+        bhv.return_eff_modifier_for_impact_of_previous_recordings_on_bhv_of_person_today(
+            person
+            ) for person in popl.persons
+        ], dtype=np.float64)
+
+    popl.level_modified_efficacy = eff
+
+    # Write the results to the Person objects.
+    popl.write_modified_values_to_persons()
+
+
+def return_behavior_rolls_for_active_persons():
+    """
+    Makes all of the current day's attendance, Efficacy, and behavior
+    rolls for the active population in a handful of NumPy calls, using 
+    the modified probabilities stored in the population arrays. Returns
+    a dict of arrays of indices (into the population arrays) of the 
+    persons who performed each kind of behavior: "Absence", "Presence",
+    and each of the comptypes in BEHAVIORS_ROLLED_DAILY. The dict also
+    includes "Efficacy", an array (aligned with "Presence") of the 
+    actual Efficacy values of the persons who are present.
+    """
+
+    popl = return_population_arrays_for_active_persons()
+    num_of_persons = len(popl)
+    history = cfg.persons_history
+
+    # ------------------------------------------------------------------
+    # Determine who works today. On a Saturday, there is only a tiny 
+    # chance that a given worker will be called in for work.
+    # ------------------------------------------------------------------
+    if cfg.current_datetime_obj.weekday() == 5:
+        working = np.random.uniform(0.0, 1.0, size=num_of_persons) \
+            <= cfg.BASE_RATE_ATTENDANCE_sat
+    else:
+        working = np.ones(num_of_persons, dtype=bool)
+
+    # ------------------------------------------------------------------
+    # Attendance. A person may be randomly absent; otherwise, if he had 
+    # at least 1 Lapse and 1 Slip in the previous 4 days, he has a 90% 
+    # chance of being absent.
+    # ------------------------------------------------------------------
+    lapses_num_previous_4_days = \
+        history.return_sums_of_counter_over_previous_days(
+            popl.history_row, "lapse_behaviors", cfg.day_of_sim_iter, 4)
+    slips_num_previous_4_days = \
+        history.return_sums_of_counter_over_previous_days(
+            popl.history_row, "slip_behaviors", cfg.day_of_sim_iter, 4)
+
+    absent_randomly = working & (popl.prob_modified["presence"] \
+        < np.random.uniform(0.0, 1.0, size=num_of_persons))
+    absent_after_lapse_and_slip = working & ~absent_randomly \
+        & (lapses_num_previous_4_days >= 1) \
+        & (slips_num_previous_4_days >= 1) \
+        & (np.random.uniform(0.0, 1.0, size=num_of_persons) <= 0.9)
+    absent = absent_randomly | absent_after_lapse_and_slip
+    present = working & ~absent
+
+    rolls = {
+        "Absence": np.flatnonzero(absent),
+        "Presence": np.flatnonzero(present),
+        }
+
+    # ------------------------------------------------------------------
+    # Efficacy.
+    # ------------------------------------------------------------------
+    eff_values = popl.level_modified_efficacy * 1 \
+        + np.random.normal(
+            loc=0, scale=cfg.BASE_MAX_EFFICACY_VARIABILITY,
+            size=num_of_persons) \
+        * popl.workstyle_eff_daily_variability
+    eff_values = np.array(
+        [round(value, 3) for value in eff_values[present].tolist()],
+        dtype=np.float64)
+    eff_values[eff_values < 0.0] = 0.0
+    rolls["Efficacy"] = eff_values
+
+    # ------------------------------------------------------------------
+    # Good and Poor behaviors. A person who doesn't randomly generate a
+    # Slip has a 90% chance of generating one if he had 2 or more Lapses
+    # in the previous 4 days; a person who doesn't randomly generate a 
+    # Sacrifice has an 80% chance of generating one if he had 2 or more
+    # Teamworks in the previous 5 days.
+    # ------------------------------------------------------------------
+    for comptype, behavior_type, prob in BEHAVIORS_ROLLED_DAILY:
+        if behavior_type == "Good":
+            defense_roll_max = cfg.DEFENSE_ROLL_MAX_BEHAVIOR_GOOD
+        else:
+            defense_roll_max = cfg.DEFENSE_ROLL_MAX_BEHAVIOR_POOR
+
+        performed = present & (popl.prob_modified[prob] \
+            >= np.random.uniform(
+                0.0, defense_roll_max, size=num_of_persons))
+
+        if comptype == "Slip":
+            performed |= present & ~performed \
+                & (lapses_num_previous_4_days >= 2) \
+                & (np.random.uniform(0.0, 1.0, size=num_of_persons) <= 0.9)
+
+        elif comptype == "Sacrifice":
+            teamworks_num_previous_5_days = \
+                history.return_sums_of_counter_over_previous_days(
+                    popl.history_row, "teamwork_behaviors", 
+                    cfg.day_of_sim_iter, 5)
+            performed |= present & ~performed \
+                & (teamworks_num_previous_5_days >= 2) \
+                & (np.random.uniform(0.0, 1.0, size=num_of_persons) <= 0.8)
+
+        rolls[comptype] = np.flatnonzero(performed)
+
+    return rolls
+
+
+# ██████████████████████████████████████████████████████████████████████
+# █                                                                    █
+# █    █████  ██  ██ █ ███   ████   ████ █████  ███   █ ███   █████    █
+# █   ██   ██ ██  ██ ██  ██ ██  ██ ██  █  ██   ██  ██ ██  ██ ██   ██   █
+# █   ██      ██  ██ ██  ██ ██   █ ██  █  ██   ██   █ ██  ██ ██        █
+# █    █████   ██ ██ ██  ██ ██   █ ██  █  ██   ██   █ ██  ██  █████    █
+# █        ██   ███  ██  ██ ██████ ██  █  ██   ██████ ██  ██      ██   █
+# █   ██   ██   ██   ██  ██ ██   █ ████   ██   ██   █ ██  ██ ██   ██   █
+# █    █████    ██   ██  ██ ██   █ ██     ██   ██   █ ██  ██  █████    █
+# █                                                                    █
+# █                        /██\                      /███\             █
+# █  █   █            █    █  █                      █   █  ██    (TM) █
+# █  █   █            █    █                         █                 █
+# █  █ █ █ /███\ /██\ █  █ ███ /███\ /██\ /███ /███\ \███\  █  █/█ █\  █
+# █  █ █ █ █   █ █  █ ███  █   █   █ █  █ █    █  ██     █  █  ██ █ █  █
+# █  █ █ █ █   █ █    █  █ █   █   █ █    █    ███   █   █  █  ██ █ █  █
+# █  \█ █/ \███/ █    █  █ █   \███/ █    \███ \███  \███/  █  ██ █ █  █
+# █                                                                    █
+# █         @     @          @     @                                   █
+# █      @    @ @  @       @    @   @@                                 █
+# █     @  @   @@         @@   @ @           █\\\\\\\\\\\\\\\\\\\\\    █
+# █      @@ @ @             @@@   @          ██\\\\\\\\\\\\\\\\\\\\\   █
+# █         @  @               @   @         ███\\\\\\\\\\\\\\\\\\\\\  █
+# █          █  █               █  █         ███▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒ █
+# █      █\\\█\\█\          █\\\█\\█\        ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █      ██\\█\\█\\         ██\\█\\█\\       ███░██░██░█☺░██░██░██░██░ █
+# █ \☺/  ███\\\\\\\\        ███\\\\\\\\      ███░██░██░██░██░██░██░██░ █
+# █  0   ███▒▒▒▒▒▒▒▒▒  ☺    ███▒▒▒▒▒▒▒▒▒  ☺  ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █ / \  ███▒▒▒▒▒▒▒▒▒ /U\   ███▒▒▒▒▒▒▒▒▒ /O] ███▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒ █
+# █      ███▒▒▒▒▒▒▒▒▒  LL   ███▒▒▒▒▒▒▒▒▒ / \ ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █   ☺   ██▒▒█▒███▒▒        ██▒▒███▒▒█▒      ██░████████░██░██░☺█░██░ █
+# █  /8\   █▒▒█▒███▒▒     ☺   █▒▒███▒▒█▒   ☺   █░████☺███░██░██░██░██░ █
+# █   /|    ▒▒▒▒███▒▒    <V>   ▒▒███▒▒▒▒  {D\   ░███[O\██░░░░░░░░░░░░░ █
+# █                      / \               /|       / \                █
+# █                                                                    █
+# ██████████████████████████████████████████████████████████████████████
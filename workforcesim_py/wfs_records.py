@@ -21,12 +21,18 @@ a distorted manner.
 """
 
 import random
-from datetime import timedelta
+import bisect
+from itertools import accumulate
+
+import numpy as np
+import pandas as pd
 
 # Import other modules from this package.
 import config as cfg
+import wfs_behaviors as bhv
 import wfs_utilities as utils
 import wfs_personnel as pers
+import wfs_summary_stats as summ
 
 
 def simulate_one_day_of_records():
@@ -43,187 +49,353 @@ def simulate_one_day_of_records():
 
     # Generate records, as appropriate. First determine how a manager 
     # records all of those *actual behaviors* that a worker performed 
-    # and which thus already have entry rows in cfg.behavs_act_df.
+    # today. These are handed off directly by simulate_one_day_of_behaviors()
+    # as the DataFrame for the current day, so the cost of this step 
+    # depends only on the number of today's behaviors (and not on the 
+    # number of all behaviors generated to date).
     #
     # In other words, determine whether those actual behaviors should be
     # recorded accurately (a "True Positive") or not noticed or recorded
     # (a "False Negative") by a manager.
     current_date = cfg.current_datetime_obj.date()
+    day_df = cfg.behavs_act_df_for_current_day
 
-    for i in range(len(cfg.behavs_act_df)):
-
-        # Only run the steps further below if the given row is for the 
-        # *current day* (i.e., hasn't already been dealt with in a 
-        # previous day).
-        if cfg.behavs_act_df["Event Date"].values[i] == current_date:
-
-            # Get the identity of the supervisor (if any) for the person
-            # who had the actual behavior.
-            recording_sup = pers.person_object_with_given_sub_ID(
-                cfg.behavs_act_df["Sup ID"].values[i])
-
-            # If the person who performed the actual behavior had no 
-            # supervisor (i.e., is the Production Director),
-            # then no record will be made. Only proceed if the person 
-            # who performed the actual behavior had a supervisor.
-            if recording_sup:
-
-                # ------------------------------------------------------
-                # Record workers' Attendance (i.e., Presence or 
-                # Absence). A worker's Attendance behavior is always 
-                # recorded by managers with 100% accuracy.
-                # ------------------------------------------------------
-                if cfg.behavs_act_df["Behavior Type"].values[i] \
-                    == "Attendance":
-
-                    # Copy the main Behavior Type and Comptype fields
-                    # into the corresponding Record fields.
-                    cfg.behavs_act_df["Record Type"].values[i] = \
-                        cfg.behavs_act_df["Behavior Type"].values[i]
-                    cfg.behavs_act_df["Record Comptype"].values[i] = \
-                        cfg.behavs_act_df["Behavior Comptype"].values[i]
-
-                    # The lack of a Note will be represented by a None value.
-                    cfg.behavs_act_df["Note"].values[i] = None
-
-                # ------------------------------------------------------
-                # Record workers' Efficacy. If an OEE system is in use, 
-                # recording of Efficacy by managers will be 100% 
-                # accurate. If no OEE system is in use, managers will 
-                # make subjective (and potentially inaccurate) 
-                # estimates of workers' Efficacy.
-                # ------------------------------------------------------
-                elif cfg.behavs_act_df["Behavior Type"].values[i] \
-                    == "Efficacy":
-
-                    # Copy the main Behavior Type and Comptype fields.
-                    cfg.behavs_act_df["Record Type"].values[i] = \
-                        cfg.behavs_act_df["Behavior Type"].values[i]
-                    cfg.behavs_act_df["Record Comptype"].values[i] = \
-                        cfg.behavs_act_df["Behavior Comptype"].values[i]
-
-                    # If an OEE system is in use (record Efficacy with 
-                    # full accuracy)...
-                    if cfg.OEE_SYSTEM_IN_USE == True:
-
-                        # Copy the exact numerical Efficacy value from
-                        # the worker's actual Efficacy behavior.
-                        cfg.behavs_act_df["Recorded Efficacy"].values[i] = \
-                            cfg.behavs_act_df["Actual Efficacy"].values[i]
-
-                    # If no OEE system is in use, record a rounded 
-                    # Efficacy estimate.
-                    else: 
-                        # Start with the worker's actual Efficacy level.
-                        eff_estimated = cfg.behavs_act_df["Actual Efficacy"].values[i]
-
-                        # Adjust the actual Efficacy by a ± random 
-                        # amount. NOTE! This is currently a plain random 
-                        # number; changing it to a randomized number 
-                        # using a mean and SD would be more realistic. 
-                        eff_estimated = eff_estimated * (
-                            1 + (random.uniform(
-                                -cfg.VARIANCE_TO_EFF_AS_RECORDED_BY_MANAGER, 
-                                cfg.VARIANCE_TO_EFF_AS_RECORDED_BY_MANAGER
-                                ))
-                            )
+    if (day_df is None) or (len(day_df) == 0):
+        return
+
+    # If the batched recording engine is enabled, generate the day's 
+    # records using array operations rather than row by row.
+    if cfg.USE_BATCHED_RECORDING_ENGINE is True:
+        simulate_one_day_of_records_batched(day_df)
+        return
 
-                        # Round the estimated Efficacy to the nearest 
-                        # 10%.
-                        eff_estimated = \
-                            round( eff_estimated*10.0, 0) / 10.0
-                        cfg.behavs_act_df["Recorded Efficacy"].values[i] = \
-                            eff_estimated
-
-                    # The lack of a Note attached to the record will be 
-                    # represented by a None value.
-                    cfg.behavs_act_df["Note"].values[i] = None
-
-                # ------------------------------------------------------
-                # Record or ignore workers' Good and Poor behaviors 
-                # (i.e., Ideas, Lapses, Feats, Slips, Teamworks, 
-                # Disruptions, Sacrifices, and Sabotages).
-                # ------------------------------------------------------
-                elif (cfg.behavs_act_df["Behavior Type"].values[i] == "Good") \
-                        | (cfg.behavs_act_df["Behavior Type"].values[i] \
-                            == "Poor"):
-
-                    # If the supervisor meets the threshold to generate 
-                    # a True Positive record...
-                    if recording_sup.prob_modified_recording_accurately \
-                        >= (random.uniform(
-                            0.0, cfg.DEFENSE_ROLL_MAX_RECORDING_TP)
-                            ):
-
-                        # Accurately copy the main Behavior Type and 
-                        # Comptype fields.
-                        cfg.behavs_act_df["Record Type"].values[i] = \
-                            cfg.behavs_act_df["Behavior Type"].values[i]
-                        cfg.behavs_act_df["Record Comptype"].values[i] = \
-                            cfg.behavs_act_df["Behavior Comptype"].values[i]
-
-                        # Mark the record as a True Positive.
-                        cfg.behavs_act_df["Record Conf Mat"].values[i] \
-                            = "True Positive"
-
-                        # Add to the record a note written by the 
-                        # supervisor who's making the entry.
-                        note_text = return_note_to_be_added_to_entry(
-                            cfg.behavs_act_df["Record Comptype"].values[i],
-                            cfg.behavs_act_df["Sub First Name"].values[i]
+    # Get the underlying arrays for the columns that will be read or 
+    # written below. (Writing to an element of one of these arrays
+    # updates the DataFrame itself.)
+    sub_ID_vals = day_df["Sub ID"].values
+    sub_fname_vals = day_df["Sub First Name"].values
+    sup_ID_vals = day_df["Sup ID"].values
+    bhv_type_vals = day_df["Behavior Type"].values
+    bhv_comptype_vals = day_df["Behavior Comptype"].values
+    act_eff_vals = day_df["Actual Efficacy"].values
+    rec_type_vals = day_df["Record Type"].values
+    rec_comptype_vals = day_df["Record Comptype"].values
+    rec_eff_vals = day_df["Recorded Efficacy"].values
+    note_vals = day_df["Note"].values
+    conf_mat_vals = day_df["Record Conf Mat"].values
+
+    # Only the rows for the *current day* are processed. (The DF for 
+    # the day may also include, e.g., Separation and Onboarding events 
+    # from a previous day, which were already recorded when they were 
+    # generated.)
+    indices_of_rows_for_current_day = np.flatnonzero(
+        day_df["Event Date"].values == current_date
+        )
+
+    for i in indices_of_rows_for_current_day:
+
+        # Get the identity of the supervisor (if any) for the person
+        # who had the actual behavior.
+        recording_sup = pers.person_object_with_given_sub_ID(
+            sup_ID_vals[i])
+
+        # If the person who performed the actual behavior had no 
+        # supervisor (i.e., is the Production Director),
+        # then no record will be made. Only proceed if the person 
+        # who performed the actual behavior had a supervisor.
+        if recording_sup:
+
+            # ----------------------------------------------------------
+            # Record workers' Attendance (i.e., Presence or Absence). A 
+            # worker's Attendance behavior is always recorded by 
+            # managers with 100% accuracy.
+            # ----------------------------------------------------------
+            if bhv_type_vals[i] == "Attendance":
+
+                # Copy the main Behavior Type and Comptype fields
+                # into the corresponding Record fields.
+                rec_type_vals[i] = bhv_type_vals[i]
+                rec_comptype_vals[i] = bhv_comptype_vals[i]
+
+                # The lack of a Note will be represented by a None value.
+                note_vals[i] = None
+
+            # ----------------------------------------------------------
+            # Record workers' Efficacy. If an OEE system is in use, 
+            # recording of Efficacy by managers will be 100% accurate. 
+            # If no OEE system is in use, managers will make subjective 
+            # (and potentially inaccurate) estimates of workers' 
+            # Efficacy.
+            # ----------------------------------------------------------
+            elif bhv_type_vals[i] == "Efficacy":
+
+                # Copy the main Behavior Type and Comptype fields.
+                rec_type_vals[i] = bhv_type_vals[i]
+                rec_comptype_vals[i] = bhv_comptype_vals[i]
+
+                # If an OEE system is in use (record Efficacy with 
+                # full accuracy)...
+                if cfg.OEE_SYSTEM_IN_USE == True:
+
+                    # Copy the exact numerical Efficacy value from
+                    # the worker's actual Efficacy behavior.
+                    rec_eff_vals[i] = act_eff_vals[i]
+
+                # If no OEE system is in use, record a rounded 
+                # Efficacy estimate.
+                else: 
+                    # Start with the worker's actual Efficacy level.
+                    eff_estimated = act_eff_vals[i]
+
+                    # Adjust the actual Efficacy by a ± random amount. 
+                    # NOTE! This is currently a plain random number; 
+                    # changing it to a randomized number using a mean 
+                    # and SD would be more realistic. 
+                    eff_estimated = eff_estimated * (
+                        1 + (random.uniform(
+                            -cfg.VARIANCE_TO_EFF_AS_RECORDED_BY_MANAGER, 
+                            cfg.VARIANCE_TO_EFF_AS_RECORDED_BY_MANAGER
+                            ))
+                        )
+
+                    # Round the estimated Efficacy to the nearest 10%.
+                    eff_estimated = \
+                        round( eff_estimated*10.0, 0) / 10.0
+                    rec_eff_vals[i] = eff_estimated
+
+                # The lack of a Note attached to the record will be 
+                # represented by a None value.
+                note_vals[i] = None
+
+            # ----------------------------------------------------------
+            # Record or ignore workers' Good and Poor behaviors (i.e., 
+            # Ideas, Lapses, Feats, Slips, Teamworks, Disruptions, 
+            # Sacrifices, and Sabotages).
+            # ----------------------------------------------------------
+            elif (bhv_type_vals[i] == "Good") \
+                    | (bhv_type_vals[i] == "Poor"):
+
+                # If the supervisor meets the threshold to generate a 
+                # True Positive record...
+                if recording_sup.prob_modified_recording_accurately \
+                    >= (random.uniform(
+                        0.0, cfg.DEFENSE_ROLL_MAX_RECORDING_TP)
+                        ):
+
+                    # Accurately copy the main Behavior Type and 
+                    # Comptype fields.
+                    rec_type_vals[i] = bhv_type_vals[i]
+                    rec_comptype_vals[i] = bhv_comptype_vals[i]
+
+                    # Mark the record as a True Positive.
+                    conf_mat_vals[i] = "True Positive"
+
+                    # Add to the record a note written by the 
+                    # supervisor who's making the entry.
+                    note_vals[i] = \
+                        return_note_or_note_code_to_be_added_to_entry(
+                            rec_comptype_vals[i],
+                            sub_fname_vals[i]
                             )
-                        cfg.behavs_act_df["Note"].values[i] = note_text
-
-
-                    # Otherwise, the supervisor falls short of the 
-                    # threshold to generate a True Positive record.
-                    else:
-                        # Inaccurately mark None as the main Behavior 
-                        # Type and Comptype fields.
-                        cfg.behavs_act_df["Record Type"].values[i] = None
-                        cfg.behavs_act_df["Record Comptype"].values[i] = None
-
-                        # Mark the record as a False Negative.
-                        cfg.behavs_act_df["Record Conf Mat"].values[i] = \
-                            "False Negative"
-
-                        # The lack of a Note will be represented by a 
-                        # None value.
-                        cfg.behavs_act_df["Note"].values[i] = None
-
-                # ------------------------------------------------------
-                # Update the relevant dictionary of the Person object 
-                # *receiving* the record that stores the number of 
-                # recordings of this type that have been *received* by 
-                # the person on each day. In the case of an Efficacy 
-                # record, add the recorded Efficacy value. In the case 
-                # of a tally-type record (Idea, Lapse, etc.), increment 
-                # the value for this day (as the key) by 1. (At dict 
-                # creation, the values for all days are 0 or 0.0.)
-                # ------------------------------------------------------
-                person = pers.person_object_with_given_sub_ID(
-                    cfg.behavs_act_df["Sub ID"].values[i]
+
+
+                # Otherwise, the supervisor falls short of the 
+                # threshold to generate a True Positive record.
+                else:
+                    # Inaccurately mark None as the main Behavior 
+                    # Type and Comptype fields.
+                    rec_type_vals[i] = None
+                    rec_comptype_vals[i] = None
+
+                    # Mark the record as a False Negative.
+                    conf_mat_vals[i] = "False Negative"
+
+                    # The lack of a Note will be represented by a 
+                    # None value.
+                    note_vals[i] = None
+
+            # ----------------------------------------------------------
+            # Update the relevant dictionary of the Person object 
+            # *receiving* the record that stores the number of 
+            # recordings of this type that have been *received* by the 
+            # person on each day. In the case of an Efficacy record, 
+            # add the recorded Efficacy value. In the case of a 
+            # tally-type record (Idea, Lapse, etc.), increment the 
+            # value for this day (as the key) by 1. (At dict creation, 
+            # the values for all days are 0 or 0.0.)
+            # ----------------------------------------------------------
+            person = pers.person_object_with_given_sub_ID(
+                sub_ID_vals[i]
+                )
+
+            if rec_comptype_vals[i] == "Absence":
+                person.dict_days_with_num_of_absences_recorded[cfg.day_of_sim_iter] += 1
+
+            # Note! This presumes that a person can only receive one
+            # Efficacy recording per day. The new value overwrites 
+            # any existing value for the day.
+            elif rec_comptype_vals[i] == "Efficacy":
+                bhv.set_eff_value_of_person_for_current_day(
+                    person,
+                    rec_eff_vals[i],
+                    "recorded",
                     )
 
-                if cfg.behavs_act_df["Record Comptype"].values[i] == "Absence":
-                    person.dict_days_with_num_of_absences_recorded[cfg.day_of_sim_iter] += 1
- 
-                # Note! This presumes that a person can only receive one
-                # Efficacy recording per day. The new value overwrites 
-                # any existing value for the day.
-                elif cfg.behavs_act_df["Record Comptype"].values[i] == \
-                        "Efficacy":
-                    person.dict_days_with_recorded_eff_values[cfg.day_of_sim_iter] = \
-                        cfg.behavs_act_df["Recorded Efficacy"].values[i]
-
-                elif cfg.behavs_act_df["Record Comptype"].values[i] == "Lapse":
-                    person.dict_days_with_num_of_lapses_recorded[cfg.day_of_sim_iter] += 1
-                elif cfg.behavs_act_df["Record Comptype"].values[i] == "Slip":
-                    person.dict_days_with_num_of_slips_recorded[cfg.day_of_sim_iter] += 1
-                elif cfg.behavs_act_df["Record Comptype"].values[i] == "Disruption":
-                    person.dict_days_with_num_of_disruptions_recorded[cfg.day_of_sim_iter] += 1
-                elif cfg.behavs_act_df["Record Comptype"].values[i] == "Sabotage":
-                    person.dict_days_with_num_of_sabotages_recorded[cfg.day_of_sim_iter] += 1
+            elif rec_comptype_vals[i] == "Lapse":
+                person.dict_days_with_num_of_lapses_recorded[cfg.day_of_sim_iter] += 1
+            elif rec_comptype_vals[i] == "Slip":
+                person.dict_days_with_num_of_slips_recorded[cfg.day_of_sim_iter] += 1
+            elif rec_comptype_vals[i] == "Disruption":
+                person.dict_days_with_num_of_disruptions_recorded[cfg.day_of_sim_iter] += 1
+            elif rec_comptype_vals[i] == "Sabotage":
+                person.dict_days_with_num_of_sabotages_recorded[cfg.day_of_sim_iter] += 1
+
+            # If the behavior was a Good one, update the person's tally 
+            # of recent True Positive or False Negative records of Good 
+            # behaviors (which can influence his Efficacy in the 
+            # following days).
+            if bhv_type_vals[i] == "Good":
+                bhv.add_good_record_to_recent_good_records_ring_of_person(
+                    person,
+                    conf_mat_vals[i],
+                    )
+
+
+def simulate_one_day_of_records_batched(day_df_u):
+    """
+    Generates managers' records for the current day's behaviors using
+    array operations: the supervisors' probabilities of recording 
+    accurately are gathered into an array, all of the day's random 
+    numbers are drawn in a single NumPy call for each kind of record, 
+    and the record columns are filled using masks. This produces records
+    following the same rules as simulate_one_day_of_records() (though 
+    not the same random draws).
+
+    PARAMETERS
+    ----------
+    day_df_u
+        The DataFrame containing the current day's behaviors
+    """
+
+    current_date = cfg.current_datetime_obj.date()
+
+    # Get the underlying arrays for the columns that will be read or 
+    # written below. (Writing to these arrays updates the DataFrame 
+    # itself.)
+    sub_ID_vals = day_df_u["Sub ID"].values
+    sub_fname_vals = day_df_u["Sub First Name"].values
+    sup_ID_vals = day_df_u["Sup ID"].values
+    bhv_type_vals = day_df_u["Behavior Type"].values
+    bhv_comptype_vals = day_df_u["Behavior Comptype"].values
+    act_eff_vals = day_df_u["Actual Efficacy"].values
+    rec_type_vals = day_df_u["Record Type"].values
+    rec_comptype_vals = day_df_u["Record Comptype"].values
+    rec_eff_vals = day_df_u["Recorded Efficacy"].values
+    note_vals = day_df_u["Note"].values
+    conf_mat_vals = day_df_u["Record Conf Mat"].values
+
+    # Look up the recording supervisor for each row. Rows for persons 
+    # who have no supervisor (i.e., the Production Director) or for
+    # an earlier day will not be recorded.
+    recording_sups = np.array(
+        [pers.person_object_with_given_sub_ID(s) for s in sup_ID_vals],
+        dtype=object,
+        )
+    is_recorded = (day_df_u["Event Date"].values == current_date) \
+        & np.array([s is not None for s in recording_sups], dtype=bool)
+
+    # ------------------------------------------------------------------
+    # Record workers' Attendance, which is always recorded with 100% 
+    # accuracy.
+    # ------------------------------------------------------------------
+    mask_att = is_recorded & (bhv_type_vals == "Attendance")
+    rec_type_vals[mask_att] = bhv_type_vals[mask_att]
+    rec_comptype_vals[mask_att] = bhv_comptype_vals[mask_att]
+    note_vals[mask_att] = None
+
+    # ------------------------------------------------------------------
+    # Record workers' Efficacy: exactly, if an OEE system is in use, or 
+    # otherwise as a rounded estimate randomly adjusted by ± up to 
+    # VARIANCE_TO_EFF_AS_RECORDED_BY_MANAGER.
+    # ------------------------------------------------------------------
+    mask_eff = is_recorded & (bhv_type_vals == "Efficacy")
+    rec_type_vals[mask_eff] = bhv_type_vals[mask_eff]
+    rec_comptype_vals[mask_eff] = bhv_comptype_vals[mask_eff]
+    if cfg.OEE_SYSTEM_IN_USE == True:
+        rec_eff_vals[mask_eff] = act_eff_vals[mask_eff]
+    else:
+        eff_actual = act_eff_vals[mask_eff].astype(float)
+        eff_estimated = eff_actual * (1 + np.random.uniform(
+            -cfg.VARIANCE_TO_EFF_AS_RECORDED_BY_MANAGER,
+            cfg.VARIANCE_TO_EFF_AS_RECORDED_BY_MANAGER,
+            size=len(eff_actual),
+            ))
+        eff_estimated = np.round(eff_estimated * 10.0, 0) / 10.0
+        rec_eff_vals[mask_eff] = eff_estimated.tolist()
+    note_vals[mask_eff] = None
+
+    # ------------------------------------------------------------------
+    # Record (as True Positives) or ignore (as False Negatives) workers'
+    # Good and Poor behaviors.
+    # ------------------------------------------------------------------
+    mask_good_poor = is_recorded \
+        & ((bhv_type_vals == "Good") | (bhv_type_vals == "Poor"))
+    indices_good_poor = np.flatnonzero(mask_good_poor)
+    probs_recording_accurately = np.array(
+        [s.prob_modified_recording_accurately 
+            for s in recording_sups[indices_good_poor]],
+        dtype=float,
+        )
+    defense_rolls = np.random.uniform(
+        0.0, cfg.DEFENSE_ROLL_MAX_RECORDING_TP, 
+        size=len(indices_good_poor),
+        )
+    is_TP = probs_recording_accurately >= defense_rolls
+    indices_TP = indices_good_poor[is_TP]
+    indices_FN = indices_good_poor[~is_TP]
+
+    rec_type_vals[indices_TP] = bhv_type_vals[indices_TP]
+    rec_comptype_vals[indices_TP] = bhv_comptype_vals[indices_TP]
+    conf_mat_vals[indices_TP] = "True Positive"
+    note_vals[indices_TP] = return_notes_or_note_codes_to_be_added_to_entries(
+        rec_comptype_vals[indices_TP],
+        sub_fname_vals[indices_TP],
+        )
+
+    rec_type_vals[indices_FN] = None
+    rec_comptype_vals[indices_FN] = None
+    conf_mat_vals[indices_FN] = "False Negative"
+    note_vals[indices_FN] = None
+
+    # ------------------------------------------------------------------
+    # Update the dictionaries of the Person objects *receiving* the 
+    # records (as in simulate_one_day_of_records()).
+    # ------------------------------------------------------------------
+    for i in np.flatnonzero(is_recorded):
+        person = pers.person_object_with_given_sub_ID(sub_ID_vals[i])
+
+        if rec_comptype_vals[i] == "Absence":
+            person.dict_days_with_num_of_absences_recorded[cfg.day_of_sim_iter] += 1
+        elif rec_comptype_vals[i] == "Efficacy":
+            bhv.set_eff_value_of_person_for_current_day(
+                person,
+                rec_eff_vals[i],
+                "recorded",
+                )
+        elif rec_comptype_vals[i] == "Lapse":
+            person.dict_days_with_num_of_lapses_recorded[cfg.day_of_sim_iter] += 1
+        elif rec_comptype_vals[i] == "Slip":
+            person.dict_days_with_num_of_slips_recorded[cfg.day_of_sim_iter] += 1
+        elif rec_comptype_vals[i] == "Disruption":
+            person.dict_days_with_num_of_disruptions_recorded[cfg.day_of_sim_iter] += 1
+        elif rec_comptype_vals[i] == "Sabotage":
+            person.dict_days_with_num_of_sabotages_recorded[cfg.day_of_sim_iter] += 1
+
+        if bhv_type_vals[i] == "Good":
+            bhv.add_good_record_to_recent_good_records_ring_of_person(
+                person,
+                conf_mat_vals[i],
+                )
 
 
 def display_simple_record_accuracy_statistics():
@@ -232,173 +404,86 @@ def display_simple_record_accuracy_statistics():
     the accuracy of managers' recording of workers' behaviors.
     """
 
+    summary_stats = summ.return_summary_stats()
+
     # Get the number of particular events by Comptype. Depending on the 
     # length of the time period and number of employees, it's possible
     # that some types of events might not have occurred.
     print("*****")
     print(
         "Number of Presences: ", 
-        cfg.behavs_act_df["Behavior Comptype"].value_counts()["Presence"]
+        summary_stats.return_count(
+            summary_stats.behavior_comptype_counts, "Presence")
         )
-    try:
-        print(
-            "Number of Absences: ", 
-            cfg.behavs_act_df["Behavior Comptype"].value_counts()["Absence"]
-            )
-    except:
-        print("No Absences occurred.")
-    try:
-        print(
-            "Number of Ideas: ", 
-            cfg.behavs_act_df["Behavior Comptype"].value_counts()["Idea"]
-            )
-    except:
-        print("No Ideas occurred.")
-    try:
-        print(
-            "Number of Lapses: ", 
-            cfg.behavs_act_df["Behavior Comptype"].value_counts()["Lapse"]
-            )
-    except:
-        print("No Lapses occurred.")
-    try:
-        print(
-            "Number of Feats: ", 
-            cfg.behavs_act_df["Behavior Comptype"].value_counts()["Feat"]
-            )
-    except:
-        print("No Feats occurred.")
-    try:
-        print(
-            "Number of Slips: ", 
-            cfg.behavs_act_df["Behavior Comptype"].value_counts()["Slip"]
-            )
-    except:
-        print("No Slips occurred.")
-    try:
-        print(
-            "Number of Teamworks: ", 
-            cfg.behavs_act_df["Behavior Comptype"].value_counts()["Teamwork"]
-            )
-    except:
-        print("No Teamworks occurred.")
-    try:
-        print(
-            "Number of Disruptions: ", 
-            cfg.behavs_act_df["Behavior Comptype"].value_counts()["Disruption"]
-            )
-    except:
-        print("No Disruptions occurred.")
-    try:
-        print(
-            "Number of Sacrifices: ", 
-            cfg.behavs_act_df["Behavior Comptype"].value_counts()["Sacrifice"]
-            )
-    except:
-        print("No Sacrifices occurred.")
-    try:
-        print(
-            "Number of Sabotages: ", 
-            cfg.behavs_act_df["Behavior Comptype"].value_counts()["Sabotage"]
-            )
-    except:
-        print("No Sabotages occurred.")
+    for comptype, comptype_plural in [
+        ("Absence", "Absences"),
+        ("Idea", "Ideas"),
+        ("Lapse", "Lapses"),
+        ("Feat", "Feats"),
+        ("Slip", "Slips"),
+        ("Teamwork", "Teamworks"),
+        ("Disruption", "Disruptions"),
+        ("Sacrifice", "Sacrifices"),
+        ("Sabotage", "Sabotages"),
+        ]:
+        comptype_num = summary_stats.return_count(
+            summary_stats.behavior_comptype_counts, comptype)
+        if comptype_num > 0:
+            print("Number of " + comptype_plural + ": ", comptype_num)
+        else:
+            print("No " + comptype_plural + " occurred.")
     print("*****")
 
     # Get the number of True Positives and False Negatives.
-    true_positives_num = \
-        cfg.behavs_act_df["Record Conf Mat"].value_counts()["True Positive"]
-    false_negatives_num = \
-        cfg.behavs_act_df["Record Conf Mat"].value_counts()["False Negative"]
+    true_positives_num = summary_stats.return_count(
+        summary_stats.record_conf_mat_counts, "True Positive")
+    false_negatives_num = summary_stats.return_count(
+        summary_stats.record_conf_mat_counts, "False Negative")
 
     # Get the number of Good TPs and Good FNs.
-    temp_df = cfg.behavs_act_df.copy()
-    temp_df[temp_df["Behavior Type"] == "Good"]
-    true_positives_good_num = \
-        temp_df["Record Conf Mat"].value_counts()["True Positive"]
-    temp_df = cfg.behavs_act_df.copy()
-    temp_df[temp_df["Behavior Type"] == "Poor"]
-    false_negatives_good_num = \
-        temp_df["Record Conf Mat"].value_counts()["False Negative"]
-
-    # Calculate the MSE for supervisors' Efficacy records. First, delete 
-    # rows that have an NaN for Actual or Recorded Efficacy.
-    temp_df = cfg.behavs_act_df.copy()
-
-    #Delete rows containing an NA value for certain fields.
-    temp_df = utils.return_df_with_rows_deleted_that_containing_na_in_col(
-        temp_df,
-        "Actual Efficacy"
+    true_positives_good_num = summary_stats.return_count(
+        summary_stats.record_conf_mat_counts_for_good_behaviors,
+        "True Positive",
         )
-    temp_df = utils.return_df_with_rows_deleted_that_containing_na_in_col(
-        temp_df,
-        "Recorded Efficacy"
+    false_negatives_good_num = summary_stats.return_count(
+        summary_stats.record_conf_mat_counts_for_good_behaviors,
+        "False Negative",
         )
 
-    # These are manually calculated, to avoid having to install and 
-    # import (e.g.) sklearn.metrics.
-    recorded_eff_absolute_errors_list = \
-        (abs(temp_df["Recorded Efficacy"] - temp_df["Actual Efficacy"])).tolist()
-    recorded_eff_mae = \
-        sum(recorded_eff_absolute_errors_list)/len(recorded_eff_absolute_errors_list)
-    recorded_eff_squared_errors_list = \
-        [x ** 2 for x in recorded_eff_absolute_errors_list]
-    recorded_eff_mse = \
-        sum(recorded_eff_squared_errors_list)/len(recorded_eff_squared_errors_list)
-
     # Display selected results.
     print("Number of Good True Positives: ", true_positives_good_num)
     print("Number of Good False Negatives: ", false_negatives_good_num)
     print("Number of True Positive Good/Poor records:", true_positives_num)
     print("Number of False Negative Good/Poor records:", false_negatives_num)
-    print("MSE for Efficacy records:", recorded_eff_mse)
-    print("MAE for Efficacy records:", recorded_eff_mae)
-
-
-def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
-    """
-    Returns a note from the recording supervisor to be added to a record
-    when it's entered in the HRM/ERP system. Not all Record Comptypes have 
-    notes; None will be returned if no note is generated.
+    print("MSE for Efficacy records:", summary_stats.recorded_eff_mse)
+    print("MAE for Efficacy records:", summary_stats.recorded_eff_mae)
 
-    PARAMETERS
-    ----------
-    entry_comptype_u
-        The Record Comptype for the given entry (e.g., "Lapse")
-    person_first_name_u
-        First name of the person who performed the behavior
-    """
 
-    # A note is created by concatenating four text elements:
-    # 
-    # - An explanation of how the supervisor gained the info about the
-    #   purported behavior (e.g., "I noticed that ", "I suspect that ",
-    #   "I was told by a worker that ", etc.). Note that this element 
-    #   can be "", in which case the note starts with the second element.
-    #
-    # - The first name of the worker who is the subject of the entry.
-    #
-    # - The verbal phrase explaining what it is that the subject did
-    #   (e.g., "had a great new idea ", "slipped and spilled the 
-    #   contents of a container")
-    #
-    # - A modifying phrase that qualifies the verbal phrase to add
-    #   variety (e.g., "while working in Warehouse 2.", "right after
-    #   finishing a break", "after failing to notice that the door was 
-    #   locked", etc.).
-    #
-    # Elements 1 and 2 are determined in an identical fashion for all
-    # Record Comptypes; the possible contents of elements 3 and 4 are
-    # specific to particular Comptypes.
+# ----------------------------------------------------------------------
+# The phrase tables from which the notes added to records are composed 
+# (see return_note_to_be_added_to_entry()). For each element of a note,
+# these give the possible contents and their relative weights.
+# ----------------------------------------------------------------------
 
-    # ------------------------------------------------------------------
-    # Calculate element 3.
-    # It is calculated first, because if it returns None, the function 
-    # ends and there's no need to calculate the other three elements' 
-    # values.
-    # ------------------------------------------------------------------
-    if entry_comptype_u == "Idea":
-        note_element_3_option_contents = [
+# Element 1 is chosen from the same options for all Record Comptypes.
+NOTE_ELEMENT_1_OPTIONS = {
+    "contents": [
+        "",
+        "I discovered that ",
+        "I noticed that ",
+        "I saw that ",
+        "I was informed that ",
+        "A worker told me that ",
+        "I overheard two workers discussing the fact that ",
+        "I believe that ",
+        ],
+    "weights": [100, 8, 7, 5, 3, 3, 1, 1],
+    }
+
+# The options for element 3 for each Record Comptype that has notes.
+NOTE_ELEMENT_3_OPTIONS = {
+    "Idea": {
+        "contents": [
             "had a great idea ",
             "came up with a brilliant solution to a recurring glitch ",
             "developed an ingenious new approach to solving a longstanding problem ",
@@ -406,16 +491,11 @@ def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
             "identified some hidden inefficiencies in our current process ",
             "had a good suggestion for how to change the order of steps ",
             "started teaching other personnel a better way of carrying out the work ",
-            ]
-        note_element_3_option_weights = [1, 1, 1, 1, 1, 1, 1]
-        note_element_3 = random.choices(
-            note_element_3_option_contents,
-            weights=note_element_3_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Lapse":
-        note_element_3_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1, 1, 1],
+        },
+    "Lapse": {
+        "contents": [
             "neglected to turn on ",
             "forgot to turn off ",
             "overloaded ",
@@ -423,16 +503,11 @@ def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
             "forgot the passcode needed for ",
             "chose the wrong diagnostic mode for ",
             "failed to notice the warning indicator on ",
-            ]
-        note_element_3_option_weights = [1, 1, 1, 1, 1, 1, 1]
-        note_element_3 = random.choices(
-            note_element_3_option_contents,
-            weights=note_element_3_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Feat":
-        note_element_3_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1, 1, 1],
+        },
+    "Feat": {
+        "contents": [
             "managed to complete twice (!) the nominal maximum number of jobs on ",
             "manually (without any tools!) reconfigured ",
             "leapt out of nowhere to catch a neural filament tube " \
@@ -445,16 +520,11 @@ def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
                 + "consecutive flips without an error on ",
             "was able to simultaneously juggle (and resolve!) twelve " \
                 + "open orders on ",
-            ]
-        note_element_3_option_weights = [1, 1, 1, 1, 1, 1, 1]
-        note_element_3 = random.choices(
-            note_element_3_option_contents,
-            weights=note_element_3_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Slip":
-        note_element_3_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1, 1, 1],
+        },
+    "Slip": {
+        "contents": [
             "tripped and – while falling – ripped one of the " \
                 + "articulators off of ",
             "knocked over a full tank of the genobaric fluid needed to operate ",
@@ -467,16 +537,11 @@ def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
             "stumbled and spilled a whole box of quantum fuses down " \
                 + "the drains next to ",
             "pushed too hard and broke the recapitulator mechanism on ",
-            ]
-        note_element_3_option_weights = [1, 1, 1, 1, 1, 1, 1]
-        note_element_3 = random.choices(
-            note_element_3_option_contents,
-            weights=note_element_3_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Teamwork":
-        note_element_3_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1, 1, 1],
+        },
+    "Teamwork": {
+        "contents": [
             "filled in for a teammate who didn’t yet feel " \
                 + "comfortable climbing into ",
             "helped a colleague who was struggling to unpackage ",
@@ -489,16 +554,11 @@ def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
                 + "yet certified on ",
             "encouraged (and cleaned up after) a teammate who’d " \
                 + "become discouraged after breaking ",
-            ]
-        note_element_3_option_weights = [1, 1, 1, 1, 1, 1, 1]
-        note_element_3 = random.choices(
-            note_element_3_option_contents,
-            weights=note_element_3_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Disruption":
-        note_element_3_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1, 1, 1],
+        },
+    "Disruption": {
+        "contents": [
             "forced R&D personnel to wait half an hour to use ",
             "angrily refused my request to show the new hire " \
                 + "how to unclog ",
@@ -510,16 +570,11 @@ def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
             "kept running the Sonomattica-7 at full power (and loudly) " \
                 + "while others were trying to hold a meeting to discuss changes to ",
             "refused (once again) to let anyone else work on ",
-            ]
-        note_element_3_option_weights = [1, 1, 1, 1, 1, 1, 1]
-        note_element_3 = random.choices(
-            note_element_3_option_contents,
-            weights=note_element_3_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Sacrifice":
-        note_element_3_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1, 1, 1],
+        },
+    "Sacrifice": {
+        "contents": [
             "volunteered to work late today, because ",
             "agreed to come in early, because ",
             "offered to take a later vacation this year, because ",
@@ -531,16 +586,11 @@ def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
                 + "though it’s less pleasant to use), because ",
             "didn’t complain when I suggested crawling inside the " \
                 + "Photon-5 to clean it out again, because ",
-            ]
-        note_element_3_option_weights = [1, 1, 1, 1, 1, 1, 1]
-        note_element_3 = random.choices(
-            note_element_3_option_contents,
-            weights=note_element_3_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Sabotage":
-        note_element_3_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1, 1, 1],
+        },
+    "Sabotage": {
+        "contents": [
             "loosened a bolt on ",
             "deactivated the security lock on ",
             "changed the passcode to prevent anyone else from opening ",
@@ -549,53 +599,36 @@ def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
             "“borrowed” the emergency ionic stimulator from ",
             "secretly disassembled ",
             "purposefully erased all the preconfigured models from ",
-            ]
-        note_element_3_option_weights = [1, 1, 1, 1, 1, 1, 1]
-        note_element_3 = random.choices(
-            note_element_3_option_contents,
-            weights=note_element_3_option_weights,
-            k=1,
-            )[0]
-
-    else:
-        return None
-
-    # ------------------------------------------------------------------
-    # Calculate element 4.
-    # ------------------------------------------------------------------
-    if entry_comptype_u == "Idea":
-        note_element_4_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1, 1, 1],
+        },
+    }
+
+# The options for element 4 for each Record Comptype that has notes.
+NOTE_ELEMENT_4_OPTIONS = {
+    "Idea": {
+        "contents": [
             "regarding maintenance of the Photon-3 machine.",
             "connected with the regular cleaning of the Electrum-8 system.",
             "regarding upgrades to the Photon-5 machine’s manipulator assembly.",
             "related to the Sonomattica-7 system’s daily reset cycle.",
             "regarding placement of the main RF scanner on the operations floor.",
-            ]
-        note_element_4_option_weights = [1, 1, 1, 1, 1]
-        note_element_4 = random.choices(
-            note_element_4_option_contents,
-            weights=note_element_4_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Lapse":
-        note_element_4_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1],
+        },
+    "Lapse": {
+        "contents": [
             "the Sonomattica-7 analyzer at the end of the shift.",
             "the Platinum-383 supercondensor during its cooldown cycle.",
             "the RF scanner when moving it into its recharging position.",
             "the new Electrum-43 device, mistakenly thinking that it " \
                 + "was one of the old Electrum-41 models, instead.",
             "the quantum isolator unit.",
-            ]
-        note_element_4_option_weights = [1, 1, 1, 1, 1]
-        note_element_4 = random.choices(
-            note_element_4_option_contents,
-            weights=note_element_4_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Feat":
-        note_element_4_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1],
+        },
+    "Feat": {
+        "contents": [
             "the RF scanner.",
             "the new Electrum-43.",
             "the old Electrum-41.",
@@ -603,16 +636,11 @@ def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
             "the Photon-3.",
             "the Data Section’s aggregator array.",
             "the Engineering Section’s ZX-4721.",
-            ]
-        note_element_4_option_weights = [1, 1, 1, 1, 1, 1, 1]
-        note_element_4 = random.choices(
-            note_element_4_option_contents,
-            weights=note_element_4_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Slip":
-        note_element_4_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1, 1, 1],
+        },
+    "Slip": {
+        "contents": [
             "the hydraulic loading ramp.",
             "the lower door to Secure Warehouse B.",
             "the retractable lighting array.",
@@ -620,16 +648,11 @@ def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
             "one of the sub-ionic sterilizers.",
             "the R&D Section’s main data transducer.",
             "the neuro-aquatic simulator.",
-            ]
-        note_element_4_option_weights = [1, 1, 1, 1, 1, 1, 1]
-        note_element_4 = random.choices(
-            note_element_4_option_contents,
-            weights=note_element_4_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Teamwork":
-        note_element_4_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1, 1, 1],
+        },
+    "Teamwork": {
+        "contents": [
             "a quantum fuse compiler.",
             "a Sirtizant-B torogenic recycler.",
             "the control passage suspended above the particulate analyzer vats.",
@@ -637,16 +660,11 @@ def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
             "a Photon-5.",
             "the RF scanner’s spectral differentiator.",
             "a virtual hibernation pod.",
-            ]
-        note_element_4_option_weights = [1, 1, 1, 1, 1, 1, 1]
-        note_element_4 = random.choices(
-            note_element_4_option_contents,
-            weights=note_element_4_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Disruption":
-        note_element_4_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1, 1, 1],
+        },
+    "Disruption": {
+        "contents": [
             "the Platinum-383 supercondensor.",
             "the RF scanner.",
             "the sub-ionic sterilizers.",
@@ -654,16 +672,11 @@ def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
             "the old Electrum-41.",
             "the Sonomattica-7.",
             "the Photon-3.",
-            ]
-        note_element_4_option_weights = [1, 1, 1, 1, 1, 1, 1]
-        note_element_4 = random.choices(
-            note_element_4_option_contents,
-            weights=note_element_4_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Sacrifice":
-        note_element_4_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1, 1, 1],
+        },
+    "Sacrifice": {
+        "contents": [
             "the others still don’t know how to use the resonation " \
                 + "decoder yet.",
             "there hasn’t been enough time to set up and test the new Genomentor.",
@@ -673,61 +686,452 @@ def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
                 + "training session today.",
             "no one else is qualified to perform the H-Type " \
                 + "reconfiguration process.",
-            ]
-        note_element_4_option_weights = [1, 1, 1, 1, 1]
-        note_element_4 = random.choices(
-            note_element_4_option_contents,
-            weights=note_element_4_option_weights,
-            k=1,
-            )[0]
-
-    elif entry_comptype_u == "Sabotage":
-        note_element_4_option_contents = [
+            ],
+        "weights": [1, 1, 1, 1, 1],
+        },
+    "Sabotage": {
+        "contents": [
             "the quantum isolator unit’s lateral manifold assembly.",
             "the RF scanner’s spectral differentiator.",
             "the Photon-5 without permission.",
             "the R&D Section’s Platinum-383 supercondensor.",
             "my production-line workstation.",
-            ]
-        note_element_4_option_weights = [1, 1, 1, 1, 1]
-        note_element_4 = random.choices(
-            note_element_4_option_contents,
-            weights=note_element_4_option_weights,
-            k=1,
-            )[0]
+            ],
+        "weights": [1, 1, 1, 1, 1],
+        },
+    }
 
-    # ------------------------------------------------------------------
-    # Calculate element 1.
-    # ------------------------------------------------------------------
-    note_element_1_option_contents = [
-        "",
-        "I discovered that ",
-        "I noticed that ",
-        "I saw that ",
-        "I was informed that ",
-        "A worker told me that ",
-        "I overheard two workers discussing the fact that ",
-        "I believe that ",
-        ]
-    note_element_1_option_weights = [100, 8, 7, 5, 3, 3, 1, 1]
-    note_element_1 = random.choices(
-        note_element_1_option_contents,
-        weights=note_element_1_option_weights,
-        k=1,
-        )[0]
 
-    # ------------------------------------------------------------------
-    # Calculate element 2.
-    # ------------------------------------------------------------------
+def return_compiled_note_element_options(note_element_options_u):
+    """
+    Returns the options for an element of a note in the precompiled form
+    used for sampling them: their contents as an array, along with their
+    cumulative weights (exactly as calculated by random.choices()).
+
+    PARAMETERS
+    ----------
+    note_element_options_u : dict
+        The contents and weights of the options for the element
+    """
+
+    cum_weights = list(accumulate(note_element_options_u["weights"]))
+
+    return {
+        "contents": np.array(note_element_options_u["contents"], dtype=object),
+        "cum_weights": cum_weights,
+        "cum_weights_array": np.array(cum_weights, dtype=float),
+        "total_weight": cum_weights[-1] + 0.0,
+        }
+
+
+# The phrase tables above, precompiled once at import.
+COMPILED_NOTE_ELEMENT_1_OPTIONS = \
+    return_compiled_note_element_options(NOTE_ELEMENT_1_OPTIONS)
+COMPILED_NOTE_ELEMENT_3_OPTIONS = {
+    comptype: return_compiled_note_element_options(options)
+    for comptype, options in NOTE_ELEMENT_3_OPTIONS.items()
+    }
+COMPILED_NOTE_ELEMENT_4_OPTIONS = {
+    comptype: return_compiled_note_element_options(options)
+    for comptype, options in NOTE_ELEMENT_4_OPTIONS.items()
+    }
+
+# The base in which the indices of a note's phrases are packed into a 
+# note code. This is 10 (so that a note code's digits are the indices), 
+# unless some element has more options than that.
+NOTE_CODE_BASE = max(
+    [10, len(NOTE_ELEMENT_1_OPTIONS["contents"])] \
+    + [len(options["contents"]) 
+        for options in NOTE_ELEMENT_3_OPTIONS.values()] \
+    + [len(options["contents"]) 
+        for options in NOTE_ELEMENT_4_OPTIONS.values()]
+    )
+
+
+def return_note_code_from_note_element_indices(
+    note_element_1_index_u,
+    note_element_3_index_u,
+    note_element_4_index_u,
+    ):
+    """
+    Returns the note code (or an array of note codes) for the given 
+    indices of the options selected for elements 1, 3, and 4 of a note.
+
+    PARAMETERS
+    ----------
+    note_element_1_index_u
+        The index (or an array of indices) of the option for element 1
+    note_element_3_index_u
+        The index (or an array of indices) of the option for element 3
+    note_element_4_index_u
+        The index (or an array of indices) of the option for element 4
+    """
+
+    return (note_element_1_index_u*NOTE_CODE_BASE \
+        + note_element_3_index_u)*NOTE_CODE_BASE + note_element_4_index_u
+
+
+def return_note_element_indices_from_note_code(note_code_u):
+    """
+    Returns the indices of the options selected for elements 1, 3, and 4
+    of a note, given its note code (or an array of note codes).
+
+    PARAMETERS
+    ----------
+    note_code_u
+        The note code (or an array of note codes)
+    """
+
+    return (
+        note_code_u // (NOTE_CODE_BASE*NOTE_CODE_BASE),
+        (note_code_u // NOTE_CODE_BASE) % NOTE_CODE_BASE,
+        note_code_u % NOTE_CODE_BASE,
+        )
+
+
+def return_note_to_be_added_to_entry(entry_comptype_u, person_first_name_u):
+    """
+    Returns a note from the recording supervisor to be added to a record
+    when it's entered in the HRM/ERP system. Not all Record Comptypes have 
+    notes; None will be returned if no note is generated.
+
+    PARAMETERS
+    ----------
+    entry_comptype_u
+        The Record Comptype for the given entry (e.g., "Lapse")
+    person_first_name_u
+        First name of the person who performed the behavior
+    """
+
+    return return_note_text_from_note_code(
+        entry_comptype_u,
+        person_first_name_u,
+        return_note_code_for_note_to_be_added_to_entry(entry_comptype_u),
+        )
+
+
+def return_note_or_note_code_to_be_added_to_entry(
+    entry_comptype_u,
+    person_first_name_u,
+    ):
+    """
+    Returns the value to be stored as the Note of a record: either the
+    note's text or (if cfg.STORE_NOTES_AS_NOTE_CODES is True) just its 
+    note code, from which the identical text can later be rendered.
+
+    PARAMETERS
+    ----------
+    entry_comptype_u
+        The Record Comptype for the given entry (e.g., "Lapse")
+    person_first_name_u
+        First name of the person who performed the behavior
+    """
+
+    if cfg.STORE_NOTES_AS_NOTE_CODES is True:
+        return return_note_code_for_note_to_be_added_to_entry(
+            entry_comptype_u)
+    return return_note_to_be_added_to_entry(
+        entry_comptype_u,
+        person_first_name_u,
+        )
+
+
+def return_random_index_of_note_element_option(
+    compiled_note_element_options_u,
+    ):
+    """
+    Randomly selects one of the options for an element of a note and 
+    returns its index. This draws one random number and selects the 
+    option in exactly the same way as random.choices(..., k=1) would.
+
+    PARAMETERS
+    ----------
+    compiled_note_element_options_u : dict
+        The precompiled options for the element
+    """
+
+    cum_weights = compiled_note_element_options_u["cum_weights"]
+    return bisect.bisect(
+        cum_weights,
+        random.random() * compiled_note_element_options_u["total_weight"],
+        0,
+        len(cum_weights) - 1,
+        )
+
+
+def return_indices_of_note_element_options_for_random_nums(
+    compiled_note_element_options_u,
+    random_nums_u,
+    ):
+    """
+    Returns an array of the indices of the options for an element of a 
+    note that are selected by an array of random numbers (each of which
+    selects an option exactly as in 
+    return_random_index_of_note_element_option()).
+
+    PARAMETERS
+    ----------
+    compiled_note_element_options_u : dict
+        The precompiled options for the element
+    random_nums_u
+        An array of random numbers in [0, 1)
+    """
+
+    cum_weights_array = compiled_note_element_options_u["cum_weights_array"]
+    return np.minimum(
+        np.searchsorted(
+            cum_weights_array,
+            random_nums_u * compiled_note_element_options_u["total_weight"],
+            side="right",
+            ),
+        len(cum_weights_array) - 1,
+        )
+
+
+def return_note_code_for_note_to_be_added_to_entry(entry_comptype_u):
+    """
+    Randomly selects the phrases for a note to be added to a record and
+    returns them as a note code: an int whose digits in base 
+    NOTE_CODE_BASE are the indices of the options selected for elements
+    1, 3, and 4 of the note. None will be returned if no note is 
+    generated for the Record Comptype.
+
+    PARAMETERS
+    ----------
+    entry_comptype_u
+        The Record Comptype for the given entry (e.g., "Lapse")
+    """
+
+    # A note is created by concatenating four text elements:
+    # 
+    # - An explanation of how the supervisor gained the info about the
+    #   purported behavior (e.g., "I noticed that ", "I suspect that ",
+    #   "I was told by a worker that ", etc.). Note that this element 
+    #   can be "", in which case the note starts with the second element.
+    #
+    # - The first name of the worker who is the subject of the entry.
+    #
+    # - The verbal phrase explaining what it is that the subject did
+    #   (e.g., "had a great new idea ", "slipped and spilled the 
+    #   contents of a container")
+    #
+    # - A modifying phrase that qualifies the verbal phrase to add
+    #   variety (e.g., "while working in Warehouse 2.", "right after
+    #   finishing a break", "after failing to notice that the door was 
+    #   locked", etc.).
+    #
+    # Elements 1 and 2 are determined in an identical fashion for all
+    # Record Comptypes; the possible contents of elements 3 and 4 are
+    # specific to particular Comptypes.
+
+    if entry_comptype_u not in COMPILED_NOTE_ELEMENT_3_OPTIONS:
+        return None
+
+    # Elements 3, 4, and 1 are selected in that order.
+    note_element_3_index = return_random_index_of_note_element_option(
+        COMPILED_NOTE_ELEMENT_3_OPTIONS[entry_comptype_u])
+    note_element_4_index = return_random_index_of_note_element_option(
+        COMPILED_NOTE_ELEMENT_4_OPTIONS[entry_comptype_u])
+    note_element_1_index = return_random_index_of_note_element_option(
+        COMPILED_NOTE_ELEMENT_1_OPTIONS)
+
+    return return_note_code_from_note_element_indices(
+        note_element_1_index, note_element_3_index, note_element_4_index)
+
+
+def return_note_text_from_note_code(
+    entry_comptype_u,
+    person_first_name_u,
+    note_code_u,
+    ):
+    """
+    Returns the text of the note with a given note code (or None, if 
+    the note code is None).
+
+    PARAMETERS
+    ----------
+    entry_comptype_u
+        The Record Comptype for the given entry (e.g., "Lapse")
+    person_first_name_u
+        First name of the person who performed the behavior
+    note_code_u : int
+        The note code (see return_note_code_for_note_to_be_added_to_entry())
+    """
+
+    if note_code_u is None:
+        return None
+
+    note_element_1_index, note_element_3_index, note_element_4_index = \
+        return_note_element_indices_from_note_code(note_code_u)
+
+    note_element_1 = \
+        COMPILED_NOTE_ELEMENT_1_OPTIONS["contents"][note_element_1_index]
     note_element_2 = person_first_name_u + " "
+    note_element_3 = COMPILED_NOTE_ELEMENT_3_OPTIONS[entry_comptype_u][
+        "contents"][note_element_3_index]
+    note_element_4 = COMPILED_NOTE_ELEMENT_4_OPTIONS[entry_comptype_u][
+        "contents"][note_element_4_index]
 
+    return note_element_1 + note_element_2 + note_element_3 + note_element_4
 
-    # ------------------------------------------------------------------
-    # Return the concatenated Note text.
-    # ------------------------------------------------------------------
-    note_to_return = note_element_1 + note_element_2 \
-        + note_element_3 + note_element_4
-    return note_to_return
+
+def return_note_texts_from_note_element_indices(
+    entry_comptype_u,
+    person_first_names_u,
+    note_element_1_indices_u,
+    note_element_3_indices_u,
+    note_element_4_indices_u,
+    ):
+    """
+    Returns an array of the texts of a batch of notes for records of the
+    same Record Comptype, assembled from the indices of their elements' 
+    options using array operations.
+
+    PARAMETERS
+    ----------
+    entry_comptype_u
+        The Record Comptype shared by the entries (e.g., "Lapse")
+    person_first_names_u
+        An array of the first names of the persons who performed the 
+        behaviors
+    note_element_1_indices_u, note_element_3_indices_u, 
+    note_element_4_indices_u
+        Arrays of the indices of the options selected for elements 1, 
+        3, and 4 of the notes
+    """
+
+    return COMPILED_NOTE_ELEMENT_1_OPTIONS["contents"][
+            note_element_1_indices_u] \
+        + np.asarray(person_first_names_u, dtype=object) + " " \
+        + COMPILED_NOTE_ELEMENT_3_OPTIONS[entry_comptype_u]["contents"][
+            note_element_3_indices_u] \
+        + COMPILED_NOTE_ELEMENT_4_OPTIONS[entry_comptype_u]["contents"][
+            note_element_4_indices_u]
+
+
+def return_notes_or_note_codes_to_be_added_to_entries(
+    entry_comptypes_u,
+    person_first_names_u,
+    ):
+    """
+    Returns an array of the values to be stored as the Notes of a batch
+    of records (e.g., all of a day's True Positive records). The random 
+    numbers for all of the notes are drawn at once, and the options for 
+    each Record Comptype are then selected and the notes assembled using
+    array operations. The results are identical to those of calling 
+    return_note_or_note_code_to_be_added_to_entry() for each record in 
+    turn, since the same random numbers are drawn in the same order.
+
+    PARAMETERS
+    ----------
+    entry_comptypes_u
+        An array of the Record Comptypes of the entries
+    person_first_names_u
+        An array of the first names of the persons who performed the 
+        behaviors
+    """
+
+    entry_comptypes = np.asarray(entry_comptypes_u, dtype=object)
+    person_first_names = np.asarray(person_first_names_u, dtype=object)
+    notes = np.full(len(entry_comptypes), None, dtype=object)
+
+    indices_with_note = np.flatnonzero(np.array(
+        [c in COMPILED_NOTE_ELEMENT_3_OPTIONS for c in entry_comptypes],
+        dtype=bool,
+        ))
+    if len(indices_with_note) == 0:
+        return notes
+
+    # Three random numbers are drawn for each note (for its elements 3, 
+    # 4, and 1, in that order).
+    random_nums = np.array(
+        [random.random() for _ in range(3 * len(indices_with_note))],
+        dtype=float,
+        ).reshape(-1, 3)
+
+    note_element_1_indices = \
+        return_indices_of_note_element_options_for_random_nums(
+            COMPILED_NOTE_ELEMENT_1_OPTIONS, random_nums[:, 2])
+
+    comptypes_with_note = entry_comptypes[indices_with_note]
+    for comptype in set(comptypes_with_note):
+        is_of_comptype = (comptypes_with_note == comptype)
+        rows_of_comptype = indices_with_note[is_of_comptype]
+        note_element_3_indices = \
+            return_indices_of_note_element_options_for_random_nums(
+                COMPILED_NOTE_ELEMENT_3_OPTIONS[comptype],
+                random_nums[is_of_comptype, 0],
+                )
+        note_element_4_indices = \
+            return_indices_of_note_element_options_for_random_nums(
+                COMPILED_NOTE_ELEMENT_4_OPTIONS[comptype],
+                random_nums[is_of_comptype, 1],
+                )
+
+        if cfg.STORE_NOTES_AS_NOTE_CODES is True:
+            notes[rows_of_comptype] = \
+                return_note_code_from_note_element_indices(
+                    note_element_1_indices[is_of_comptype],
+                    note_element_3_indices,
+                    note_element_4_indices,
+                    ).tolist()
+        else:
+            notes[rows_of_comptype] = \
+                return_note_texts_from_note_element_indices(
+                    comptype,
+                    person_first_names[rows_of_comptype],
+                    note_element_1_indices[is_of_comptype],
+                    note_element_3_indices,
+                    note_element_4_indices,
+                    )
+
+    return notes
+
+
+def return_notes_with_note_codes_rendered_as_text(
+    notes_u,
+    record_comptypes_u,
+    person_first_names_u,
+    ):
+    """
+    Returns an array of Notes in which any notes that were stored as 
+    note codes have been replaced by their text. (Notes already stored 
+    as text are returned unchanged.)
+
+    PARAMETERS
+    ----------
+    notes_u
+        The Notes (e.g., the "Note" column of behavs_act_df)
+    record_comptypes_u
+        The corresponding Record Comptypes
+    person_first_names_u
+        The corresponding first names of the persons who performed the
+        behaviors
+    """
+
+    notes = np.array(notes_u, dtype=object)
+    record_comptypes = np.asarray(record_comptypes_u, dtype=object)
+    person_first_names = np.asarray(person_first_names_u, dtype=object)
+
+    indices_with_note_code = np.flatnonzero(np.array(
+        [isinstance(n, (int, np.integer)) for n in notes],
+        dtype=bool,
+        ))
+    note_codes = notes[indices_with_note_code].astype(np.int64)
+    comptypes_with_note_code = record_comptypes[indices_with_note_code]
+
+    for comptype in set(comptypes_with_note_code):
+        is_of_comptype = (comptypes_with_note_code == comptype)
+        rows_of_comptype = indices_with_note_code[is_of_comptype]
+        notes[rows_of_comptype] = \
+            return_note_texts_from_note_element_indices(
+                comptype,
+                person_first_names[rows_of_comptype],
+                *return_note_element_indices_from_note_code(
+                    note_codes[is_of_comptype]),
+                )
+
+    return notes
 
 
 def add_eff_mday_series_to_behavs_act_df():
@@ -740,112 +1144,56 @@ def add_eff_mday_series_to_behavs_act_df():
 
     utils.begin_tracking_elapsed_processing_time()
 
-    # Create the new columns whose values will be populated.
-    cfg.behavs_act_df["D-4 Eff"] = None
-    cfg.behavs_act_df["D-3 Eff"] = None
-    cfg.behavs_act_df["D-2 Eff"] = None
-    cfg.behavs_act_df["D-1 Eff"] = None
-    cfg.behavs_act_df["D0 Eff"] = None
-    cfg.behavs_act_df["D+1 Eff"] = None
-    cfg.behavs_act_df["D+2 Eff"] = None
-    cfg.behavs_act_df["D+3 Eff"] = None
-    cfg.behavs_act_df["D+4 Eff"] = None
-
-    # Create a dictionary that contains a key for each person's ID,
-    # and each of their values is a dictionary with a separate key
-    # for each week in the dataset. Each of those values is a DF with
-    # the entries for just that person in just that week.
-    dict_of_behavs_act_Eff_dfs_by_person_ID_and_week = {}
-
-    # Calculate how many weeks are in the series comprising the
-    # dataset. That can be done by taking the 
-    final_week_in_series_num = \
-        utils.return_week_in_series_for_given_date(
-            utils.return_date_of_final_day_to_simulate()
-            )
-
-    for p in cfg.persons:
-        dict_of_behavs_act_Eff_dfs_by_person_ID_and_week[cfg.persons[p].per_id] \
-            = {}
-
-        for w in range(0, final_week_in_series_num + 1):
+    # ------------------------------------------------------------------
+    # Index the Actual Efficacy values of all Eff behaviors by their 
+    # (subject ID, date) pairs. A person has at most one Eff behavior 
+    # per day; if there were more than one, the last would be used.
+    # ------------------------------------------------------------------
+    eff_behavs_df = cfg.behavs_act_df[
+        cfg.behavs_act_df["Behavior Type"] == "Efficacy"
+        ].drop_duplicates(subset=["Sub ID", "Event Date"], keep="last")
 
-            # Create a temp DF with only that person's Eff behaviors
-            # (and the records made of them for the person by
-            # supervisors) for the given week.
-            behavs_act_df_this_pers = \
-                utils.return_df_with_rows_filtered_to_one_val_in_col(
-                    cfg.behavs_act_df,
-                    "Sub ID",
-                    cfg.persons[p].per_id,
-                    )
+    eff_behavs_index = pd.MultiIndex.from_arrays([
+        eff_behavs_df["Sub ID"].values,
+        pd.to_datetime(eff_behavs_df["Event Date"]).values,
+        ])
+    eff_behavs_values = eff_behavs_df["Actual Efficacy"].values
 
-            behavs_act_df_this_pers = \
-                behavs_act_df_this_pers[behavs_act_df_this_pers["Behavior Type"] \
-                    == "Efficacy"]
+    # ------------------------------------------------------------------
+    # For each desired mday (as defined relative to D0), look up the 
+    # (subject ID, date) pair of every row in the main 
+    # cfg.behavs_act_df all at once, and populate the column with any 
+    # Eff behavior found (or None, if the subject had no Eff behavior 
+    # on that mday).
+    # ------------------------------------------------------------------
+    rows_sub_IDs = cfg.behavs_act_df["Sub ID"].values
+    rows_dates = pd.to_datetime(cfg.behavs_act_df["Event Date"]).values
+
+    for delta_days, mday_label in [
+        (-4, "D-4 Eff"),
+        (-3, "D-3 Eff"),
+        (-2, "D-2 Eff"),
+        (-1, "D-1 Eff"),
+        (0, "D0 Eff"),
+        (1, "D+1 Eff"),
+        (2, "D+2 Eff"),
+        (3, "D+3 Eff"),
+        (4, "D+4 Eff"),
+        ]:
+
+        positions = eff_behavs_index.get_indexer(
+            pd.MultiIndex.from_arrays([
+                rows_sub_IDs,
+                rows_dates + np.timedelta64(delta_days, "D"),
+                ])
+            )
 
-            behavs_act_df_this_pers = \
-                utils.return_df_with_rows_filtered_to_one_val_in_col(
-                    behavs_act_df_this_pers,
-                    "Week in Series",
-                    w,
-                    )
+        mday_eff_values = np.full(len(positions), None, dtype=object)
+        positions_found = positions >= 0
+        mday_eff_values[positions_found] = \
+            eff_behavs_values[positions[positions_found]]
 
-            # Add this person's Eff DF to the dictionary for all persons.
-            dict_of_behavs_act_Eff_dfs_by_person_ID_and_week[cfg.persons[p].per_id][w] \
-                = behavs_act_df_this_pers
-
-    # For each row in the main cfg.behavs_act_df...
-    for i in range(len(cfg.behavs_act_df)):
-
-        date_of_row_to_populate = cfg.behavs_act_df["Event Date"].values[i]
-        subject_ID_in_row_to_populate = cfg.behavs_act_df["Sub ID"].values[i]
-
-        # First, search in the week during which D0 falls. Then check in
-        # the previous week (if it exists) and the following week (if 
-        # it exists).
-        focal_week = \
-            utils.return_week_in_series_for_given_date(date_of_row_to_populate)
-
-        weeks_to_search = [focal_week]
-        if focal_week > 0:
-            weeks_to_search.append(focal_week - 1)
-        if focal_week < final_week_in_series_num:
-            weeks_to_search.append(focal_week + 1)
-
-        for week in weeks_to_search:
-            behavs_act_Eff_df_this_sub = \
-                dict_of_behavs_act_Eff_dfs_by_person_ID_and_week[
-                    subject_ID_in_row_to_populate
-                    ][week]
-
-            # Search the correct person's DF for an Eff behavior 
-            # recorded on particular mdays defined relative to that 
-            # row's entry date.
-            for j in range(len(behavs_act_Eff_df_this_sub)):
-
-                # Check each desired mday, as defined relative to D0.
-                for delta_days, mday_label in [
-                    (-4, "D-4 Eff"),
-                    (-3, "D-3 Eff"),
-                    (-2, "D-2 Eff"),
-                    (-1, "D-1 Eff"),
-                    (0, "D0 Eff"),
-                    (1, "D+1 Eff"),
-                    (2, "D+2 Eff"),
-                    (3, "D+3 Eff"),
-                    (4, "D+4 Eff"),
-                    ]:
-
-                    # Find and note any Eff behavior from the given mday.
-                    date_of_sought_mday = \
-                        date_of_row_to_populate + timedelta(days = delta_days)
-                    if (behavs_act_Eff_df_this_sub["Behavior Type"].values[j] \
-                                == "Efficacy") \
-                            & (behavs_act_Eff_df_this_sub["Event Date"].values[j] == date_of_sought_mday):
-                        mday_eff_act = \
-                            behavs_act_Eff_df_this_sub["Actual Efficacy"].values[j]
-                        cfg.behavs_act_df[mday_label].values[i] = mday_eff_act
+        cfg.behavs_act_df[mday_label] = mday_eff_values
 
     print("   Elapsed processing time for mday series: " + utils.return_elapsed_processing_time())
 
@@ -0,0 +1,239 @@
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   Synaptans WorkforceSim™ is open-source software for simulating   ║
+# ║   the complex dynamics of a factory workforce.                     ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden • ©2021-23 NeuraXenetica LLC     ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+"""
+This module calculates the simple summary statistics (e.g., the numbers
+of behaviors of each type, the confusion-matrix tallies of supervisors'
+records, and the error of their Efficacy records) that are displayed at
+the end of a simulation. All of the counts are derived from a single 
+grouped scan of behavs_act_df, and the results are kept in a 
+Summary_stats_class object in cfg.summary_stats, so that the 
+statistics displayed by the personnel, records, and behaviors modules 
+needn't be recalculated.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Import other modules from this package.
+import config as cfg
+
+
+# ----------------------------------------------------------------------
+# The columns of behavs_act_df by whose combinations of values the rows
+# are counted. Every count in the summary statistics is a sum over some
+# subset of these combinations.
+# ----------------------------------------------------------------------
+SUMMARY_STATS_KEY_COLS = [
+    "Behavior Type",
+    "Behavior Comptype",
+    "Behavior Nature",
+    "Record Comptype",
+    "Record Nature",
+    "Record Conf Mat",
+    ]
+
+
+class Summary_stats_class(object):
+    """
+    Holds the summary statistics calculated for a given behavs_act_df.
+    """
+
+    def __init__(self, behavs_act_df_u):
+        """
+        Calculates the summary statistics.
+
+        PARAMETERS
+        ----------
+        behavs_act_df_u
+            The behavs_act_df (excluding any priming period) for which 
+            the statistics should be calculated
+        """
+
+        # The DF from which the statistics were calculated (which allows
+        # return_summary_stats() to determine whether they're current).
+        self.source_df = behavs_act_df_u
+
+        # --------------------------------------------------------------
+        # Count the rows with each combination of values in the key 
+        # columns. This is the only pass over the full DF that's needed
+        # for the counts; everything below works with the (small) 
+        # table of combinations. The combinations are kept in the order
+        # in which they first appear in the DF, so that values with 
+        # equal counts are listed in the same order as by value_counts().
+        # --------------------------------------------------------------
+        self.key_col_combinations_df = behavs_act_df_u.groupby(
+            SUMMARY_STATS_KEY_COLS,
+            dropna=False,
+            observed=True,
+            sort=False,
+            ).size().rename("Count").reset_index()
+
+        self.behavior_type_counts = \
+            self.return_counts_of_values_in_col("Behavior Type")
+        self.behavior_comptype_counts = \
+            self.return_counts_of_values_in_col("Behavior Comptype")
+        self.record_conf_mat_counts = \
+            self.return_counts_of_values_in_col("Record Conf Mat")
+
+        # The numbers of each kind of Record Conf Mat among the records 
+        # of Good behaviors.
+        self.record_conf_mat_counts_for_good_behaviors = \
+            self.return_counts_of_values_in_col(
+                "Record Conf Mat",
+                "Behavior Type",
+                "Good",
+                )
+
+        # The numbers of Resignations and Terminations of various types.
+        self.resignation_nature_counts = \
+            self.return_counts_of_values_in_col(
+                "Behavior Nature",
+                "Behavior Comptype",
+                "Resignation",
+                )
+        self.termination_nature_counts = \
+            self.return_counts_of_values_in_col(
+                "Record Nature",
+                "Record Comptype",
+                "Termination",
+                )
+
+        self.unique_subjects_num = behavs_act_df_u["Sub ID"].nunique()
+
+        # --------------------------------------------------------------
+        # The error of supervisors' Efficacy records, calculated for the
+        # rows that have both an Actual and a Recorded Efficacy. These 
+        # are manually calculated, to avoid having to install and 
+        # import (e.g.) sklearn.metrics. (The errors are summed in row 
+        # order with Python's sum(), as NumPy's pairwise summation can 
+        # differ in the last digits.)
+        # --------------------------------------------------------------
+        actual_eff_values = pd.to_numeric(
+            behavs_act_df_u["Actual Efficacy"], errors="coerce").values
+        recorded_eff_values = pd.to_numeric(
+            behavs_act_df_u["Recorded Efficacy"], errors="coerce").values
+        have_both_values = \
+            ~np.isnan(actual_eff_values) & ~np.isnan(recorded_eff_values)
+        recorded_eff_absolute_errors_list = np.abs(
+            recorded_eff_values[have_both_values] \
+                - actual_eff_values[have_both_values]
+            ).tolist()
+
+        self.eff_records_num = len(recorded_eff_absolute_errors_list)
+        if self.eff_records_num > 0:
+            self.recorded_eff_mae = \
+                sum(recorded_eff_absolute_errors_list) / self.eff_records_num
+            self.recorded_eff_mse = \
+                sum([x ** 2 for x in recorded_eff_absolute_errors_list]) \
+                    / self.eff_records_num
+        else:
+            self.recorded_eff_mae = None
+            self.recorded_eff_mse = None
+
+    def return_counts_of_values_in_col(self,
+        col_u,
+        filter_col_u=None,
+        filter_val_u=None,
+        ):
+        """
+        Returns a Series (like that returned by value_counts()) with the
+        number of rows having each value in a given key column, 
+        optionally counting only the rows with a given value in another 
+        key column.
+
+        PARAMETERS
+        ----------
+        col_u : str
+            The key column whose values should be counted
+        filter_col_u : str
+            The key column (if any) by which rows should be filtered
+        filter_val_u
+            The value that rows must have in filter_col_u
+        """
+
+        combinations_df = self.key_col_combinations_df
+        if filter_col_u is not None:
+            combinations_df = combinations_df[
+                combinations_df[filter_col_u] == filter_val_u]
+
+        counts = combinations_df.groupby(col_u, sort=False)["Count"].sum()
+        counts = counts[counts > 0].sort_values(ascending=False)
+        counts.name = col_u
+        counts.index.name = None
+
+        return counts
+
+    def return_count(self, counts_u, value_u):
+        """
+        Returns the number of rows with a given value in a Series of 
+        counts (0, if there were no such rows).
+
+        PARAMETERS
+        ----------
+        counts_u
+            A Series of counts (e.g., self.behavior_comptype_counts)
+        value_u
+            The value whose count is sought (e.g., "Idea")
+        """
+
+        return int(counts_u.get(value_u, 0))
+
+
+def return_summary_stats():
+    """
+    Returns the summary statistics for the current cfg.behavs_act_df, 
+    calculating them (and storing them in cfg.summary_stats) only if 
+    they haven't already been calculated for that DF.
+    """
+
+    if (cfg.summary_stats is None) \
+            or (cfg.summary_stats.source_df is not cfg.behavs_act_df):
+        cfg.summary_stats = Summary_stats_class(cfg.behavs_act_df)
+
+    return cfg.summary_stats
+
+
+# ██████████████████████████████████████████████████████████████████████
+# █                                                                    █
+# █    █████  ██  ██ █ ███   ████   ████ █████  ███   █ ███   █████    █
+# █   ██   ██ ██  ██ ██  ██ ██  ██ ██  █  ██   ██  ██ ██  ██ ██   ██   █
+# █   ██      ██  ██ ██  ██ ██   █ ██  █  ██   ██   █ ██  ██ ██        █
+# █    █████   ██ ██ ██  ██ ██   █ ██  █  ██   ██   █ ██  ██  █████    █
+# █        ██   ███  ██  ██ ██████ ██  █  ██   ██████ ██  ██      ██   █
+# █   ██   ██   ██   ██  ██ ██   █ ████   ██   ██   █ ██  ██ ██   ██   █
+# █    █████    ██   ██  ██ ██   █ ██     ██   ██   █ ██  ██  █████    █
+# █                                                                    █
+# █                        /██\                      /███\             █
+# █  █   █            █    █  █                      █   █  ██    (TM) █
+# █  █   █            █    █                         █                 █
+# █  █ █ █ /███\ /██\ █  █ ███ /███\ /██\ /███ /███\ \███\  █  █/█ █\  █
+# █  █ █ █ █   █ █  █ ███  █   █   █ █  █ █    █  ██     █  █  ██ █ █  █
+# █  █ █ █ █   █ █    █  █ █   █   █ █    █    ███   █   █  █  ██ █ █  █
+# █  \█ █/ \███/ █    █  █ █   \███/ █    \███ \███  \███/  █  ██ █ █  █
+# █                                                                    █
+# █         @     @          @     @                                   █
+# █      @    @ @  @       @    @   @@                                 █
+# █     @  @   @@         @@   @ @           █\\\\\\\\\\\\\\\\\\\\\    █
+# █      @@ @ @             @@@   @          ██\\\\\\\\\\\\\\\\\\\\\   █
+# █         @  @               @   @         ███\\\\\\\\\\\\\\\\\\\\\  █
+# █          █  █               █  █         ███▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒ █
+# █      █\\\█\\█\          █\\\█\\█\        ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █      ██\\█\\█\\         ██\\█\\█\\       ███░██░██░█☺░██░██░██░██░ █
+# █ \☺/  ███\\\\\\\\        ███\\\\\\\\      ███░██░██░██░██░██░██░██░ █
+# █  0   ███▒▒▒▒▒▒▒▒▒  ☺    ███▒▒▒▒▒▒▒▒▒  ☺  ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █ / \  ███▒▒▒▒▒▒▒▒▒ /U\   ███▒▒▒▒▒▒▒▒▒ /O] ███▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒ █
+# █      ███▒▒▒▒▒▒▒▒▒  LL   ███▒▒▒▒▒▒▒▒▒ / \ ███░░░░░░░░░░░░░░░░░░░░░░ █
+# █   ☺   ██▒▒█▒███▒▒        ██▒▒███▒▒█▒      ██░████████░██░██░☺█░██░ █
+# █  /8\   █▒▒█▒███▒▒     ☺   █▒▒███▒▒█▒   ☺   █░████☺███░██░██░██░██░ █
+# █   /|    ▒▒▒▒███▒▒    <V>   ▒▒███▒▒▒▒  {D\   ░███[O\██░░░░░░░░░░░░░ █
+# █                      / \               /|       / \                █
+# █                                                                    █
+# ██████████████████████████████████████████████████████████████████████
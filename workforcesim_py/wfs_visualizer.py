@@ -18,6 +18,8 @@ between particular variables.
 import io
 import os
 import colorsys
+import multiprocessing
+import threading
 import warnings
 
 import matplotlib.pyplot as plt
@@ -26,11 +28,10 @@ import matplotlib.colors
 from matplotlib.offsetbox import OffsetImage, AnchoredOffsetbox
 from PIL import Image
 from PIL import ImageColor
-import pandas as pd
 
 # Import other modules from this package.
 import config as cfg
-import wfs_utilities as utils
+import wfs_plot_data as pdata
 
 
 def generate_plot_return_png_and_save_to_file(
@@ -46,7 +47,9 @@ def generate_plot_return_png_and_save_to_file(
     color_mapping_for_legend_u,
     plot_title_u,
     wfs_logo_location_u,
-    name_for_file_u
+    name_for_file_u,
+    render_profile_u=None,
+    file_path_u=None,
     ):
     """
     This is the most generalized plotting function, which is capable of 
@@ -83,8 +86,35 @@ def generate_plot_return_png_and_save_to_file(
         in the plot (e.g., "upper right")
     name_for_file_u
         The desired name for the PNG file to be saved
+    render_profile_u : str
+        The name of the render profile in cfg.PLOT_RENDER_PROFILES whose
+        DPI and PNG compression level should be used (optional; if None,
+        cfg.PLOT_FIGURE_DPI and cfg.PLOT_SAVEFIG_DPI are used)
+    file_path_u : str
+        The path at which the PNG file should be saved (optional; if 
+        None, the file is saved in cfg.PLOTS_DIR as name_for_file_u)
     """
 
+    # If plots are being queued for parallel rendering, simply note the 
+    # arguments with which this plot is to be rendered.
+    if cfg.plot_rendering_jobs is not None:
+        cfg.plot_rendering_jobs.append((
+            plot_type_u,
+            data_x_u,
+            data_y_u,
+            x_axis_label_u,
+            y_axis_label_u,
+            x_tick_labels_rotation_u,
+            xy_tick_labels_custom_fontsize_u,
+            data_color_main_u,
+            data_alpha_main_u,
+            color_mapping_for_legend_u,
+            plot_title_u,
+            wfs_logo_location_u,
+            name_for_file_u,
+            ))
+        return None
+
     # ------------------------------------------------------------------
     # Create the empty figure where data will be plotted.
     # ------------------------------------------------------------------
@@ -94,8 +124,17 @@ def generate_plot_return_png_and_save_to_file(
     # are being generated outside of the main thread.
     matplotlib.use('agg')
 
-    plt.rcParams['figure.dpi'] = cfg.PLOT_FIGURE_DPI
-    plt.rcParams['savefig.dpi'] = cfg.PLOT_SAVEFIG_DPI
+    if render_profile_u is None:
+        plt.rcParams['figure.dpi'] = cfg.PLOT_FIGURE_DPI
+        plt.rcParams['savefig.dpi'] = cfg.PLOT_SAVEFIG_DPI
+        png_pil_kwargs = None
+    else:
+        render_profile = cfg.PLOT_RENDER_PROFILES[render_profile_u]
+        plt.rcParams['figure.dpi'] = render_profile["dpi"]
+        plt.rcParams['savefig.dpi'] = render_profile["dpi"]
+        png_pil_kwargs = {
+            "compress_level": render_profile["png_compress_level"]
+            }
 
     # Seaborn heatmaps are square.
     if plot_type_u == "heatmap":
@@ -546,19 +585,128 @@ def generate_plot_return_png_and_save_to_file(
     generated_PNG_plot_as_var = Image.open(buffer_m)
 
     # Save the plot as a PNG.
-    plt.savefig(
-        os.path.join(
+    if file_path_u is None:
+        file_path_u = os.path.join(
             cfg.PLOTS_DIR,
             name_for_file_u,
-            ),
+            )
+    plt.savefig(
+        file_path_u,
+        format='png',
         bbox_inches='tight',
         facecolor=fig.get_facecolor(),
         edgecolor='none',
+        pil_kwargs=png_pil_kwargs,
         )
 
     return generated_PNG_plot_as_var
 
 
+def return_num_of_plot_rendering_processes():
+    """
+    Returns the number of worker processes in which plots should be 
+    rendered.
+    """
+
+    if cfg.NUM_OF_PLOT_RENDERING_PROCESSES is None:
+        return os.cpu_count() or 1
+    return max(int(cfg.NUM_OF_PLOT_RENDERING_PROCESSES), 1)
+
+
+def begin_queuing_plots_for_parallel_rendering():
+    """
+    Causes subsequently requested plots to be queued (rather than being
+    rendered immediately), if they're to be rendered in parallel.
+    """
+
+    if return_num_of_plot_rendering_processes() > 1:
+        cfg.plot_rendering_jobs = []
+    else:
+        cfg.plot_rendering_jobs = None
+
+
+def return_cfg_plot_settings():
+    """
+    Returns the values of the config.py settings that affect plotting, 
+    for passing to a worker process.
+    """
+
+    return {
+        name: getattr(cfg, name) for name in dir(cfg) \
+            if name.startswith("PLOT_") \
+                or name in ["PLOTS_DIR", "GRAPHICS_DIR"]
+        }
+
+
+def render_plot_in_worker_process(plot_args_u, cfg_plot_settings_u):
+    """
+    Renders a single queued plot. This is run in its own worker process,
+    which receives only the (small) aggregated data needed for the plot,
+    rather than behavs_act_df.
+
+    PARAMETERS
+    ----------
+    plot_args_u : tuple
+        The arguments to be passed to 
+        generate_plot_return_png_and_save_to_file()
+    cfg_plot_settings_u : dict
+        The values of the config.py settings that affect plotting
+    """
+
+    for name, value in cfg_plot_settings_u.items():
+        setattr(cfg, name, value)
+    cfg.plot_rendering_jobs = None
+
+    # Any changes to Matplotlib's settings made while rendering the plot
+    # (e.g., those made by Seaborn when rendering a heatmap) are undone
+    # afterward, so that they can't affect the next plot rendered in 
+    # the same worker process.
+    plt.switch_backend("agg")
+    with matplotlib.rc_context():
+        generate_plot_return_png_and_save_to_file(*plot_args_u)
+    plt.close("all")
+
+    return plot_args_u[-1]
+
+
+def render_queued_plots_in_parallel():
+    """
+    Renders all of the plots that have been queued since 
+    begin_queuing_plots_for_parallel_rendering() was called, in a pool 
+    of worker processes.
+
+    The worker processes are started with the "spawn" method rather than
+    by forking this process, which may be the multithreaded web server.
+    They receive only the plots' arguments and the plot settings from 
+    config.py.
+    """
+
+    plot_rendering_jobs = cfg.plot_rendering_jobs
+    cfg.plot_rendering_jobs = None
+    if not plot_rendering_jobs:
+        return
+
+    cfg_plot_settings = return_cfg_plot_settings()
+
+    with multiprocessing.get_context("spawn").Pool(
+        processes=min(
+            return_num_of_plot_rendering_processes(),
+            len(plot_rendering_jobs),
+            ),
+        ) as pool:
+        async_results = [
+            pool.apply_async(
+                render_plot_in_worker_process,
+                (plot_args, cfg_plot_settings),
+                )
+            for plot_args in plot_rendering_jobs
+            ]
+
+        # This re-raises any error that occurred in rendering a plot.
+        for async_result in async_results:
+            async_result.get()
+
+
 # ----------------------------------------------------------------------
 # Below are the more particular functions for generating specific
 # types of plots, each of which calls the the generalized plotting 
@@ -571,7 +719,7 @@ def plot_distribution_of_MNGR_CAP_scores_hist():
     Save to file and return a PNG histogram plot of MNGR_CAP scores.
     """
     # Prepare the data.
-    df_to_plot = cfg.persons_df.copy()
+    df_to_plot = pdata.return_plot_data_cache().persons_df
 
     generate_plot_return_png_and_save_to_file(
         "hist",
@@ -597,10 +745,8 @@ def plot_Eff_by_weekday_bar():
     """
 
     # Prepare the data.
-    df_to_plot = cfg.behavs_act_df.copy()
-    df_to_plot = df_to_plot.groupby(
-        "Weekday Num", as_index=False).agg({"Actual Efficacy": 'mean'}
-        )
+    df_to_plot = pdata.return_plot_data_cache().return_mean_of_col_by_group(
+        "Weekday Num", "Actual Efficacy")
     generate_plot_return_png_and_save_to_file(
         "bar",
         df_to_plot["Weekday Num"],
@@ -626,10 +772,8 @@ def plot_recorded_Eff_by_sub_sup_age_difference_line():
     """
 
     # Prepare the data.
-    df_to_plot = cfg.behavs_act_df.copy()
-    df_to_plot = df_to_plot.groupby(
-        "Sup-Sub Age Difference", as_index=False).agg({"Recorded Efficacy": 'mean'}
-        )
+    df_to_plot = pdata.return_plot_data_cache().return_mean_of_col_by_group(
+        "Sup-Sub Age Difference", "Recorded Efficacy")
     generate_plot_return_png_and_save_to_file(
         "line",
         df_to_plot["Sup-Sub Age Difference"],
@@ -655,14 +799,7 @@ def plot_Eff_mean_vs_Eff_sd_with_workstyles_scatter():
     """
 
     # Prepare the data.
-    df_to_plot = cfg.behavs_act_df.copy()
-    df_to_plot = df_to_plot.groupby("Sub ID", as_index=False).agg(
-        {
-            "Actual Efficacy": 'mean',
-            "Actual Efficacy (SD)": 'std',
-            "Sub Workstyle": 'last',
-            }
-        )
+    df_to_plot = pdata.return_plot_data_cache().return_per_person_df()
     colors = {
         "Group A": cfg.PLOT_COLOR_GREEN,
         "Group B": cfg.PLOT_COLOR_MAGENTA,
@@ -709,62 +846,15 @@ def plot_mday_series_Eff_for_behav_comptype_bar(
         Desired color for the bars
     """
 
-    # Prepare the data.
-    df_to_plot = cfg.behavs_act_df.copy()
-
-    # Extract only those rows containing the selected Behavior Type
-    # or Behavior Comptype.
-    df_to_plot \
-        = df_to_plot[df_to_plot[d0_event_col_name_u] == d0_event_name_u]
-
-    # Flatten the DataFrame to only include a row for its mean values.
-    df_to_plot \
-        = df_to_plot.groupby(d0_event_col_name_u, as_index=False).agg(
-            {
-                "D-4 Eff": 'mean',
-                "D-3 Eff": 'mean',
-                "D-2 Eff": 'mean',
-                "D-1 Eff": 'mean',
-                "D0 Eff": 'mean',
-                "D+1 Eff": 'mean',
-                "D+2 Eff": 'mean',
-                "D+3 Eff": 'mean',
-                "D+4 Eff": 'mean',
-                }
-            )
-
-    # Extract only those columns containing the mday series Actual 
-    # Efficacy values.
-    df_to_plot = df_to_plot[[
-        "D-4 Eff",
-        "D-3 Eff",
-        "D-2 Eff",
-        "D-1 Eff",
-        "D0 Eff",
-        "D+1 Eff",
-        "D+2 Eff",
-        "D+3 Eff",
-        "D+4 Eff",
-        ]]
-
-    # Specify as X values for the plot the names of the columns 
-    # containing the mday series Actual Efficacy values.
-    data_x = [
-        "D-4 Eff",
-        "D-3 Eff",
-        "D-2 Eff",
-        "D-1 Eff",
-        "D0 Eff",
-        "D+1 Eff",
-        "D+2 Eff",
-        "D+3 Eff",
-        "D+4 Eff",
-        ]
-
-    # Specify as Y values for the plot the contents of the lone row of 
-    # the DF (i.e., the mean Actual Efficacy values for each day in the 
-    # mday series).
-    data_y = df_to_plot.loc[0, :].values.tolist()
+    # Prepare the data. Specify as X values for the plot the names of 
+    # the columns containing the mday series Actual Efficacy values, and
+    # as Y values the mean of each column for those rows containing the
+    # selected Behavior Type or Behavior Comptype.
+    data_x = list(pdata.MDAY_SERIES_COLS)
+    data_y = pdata.return_plot_data_cache().return_mday_series_means(
+        d0_event_col_name_u,
+        d0_event_name_u,
+        )
 
     generate_plot_return_png_and_save_to_file(
         "bar",
@@ -792,24 +882,7 @@ def plot_ideas_mean_by_workstyle_group_bar():
     """
 
     # Prepare the data.
-    df_to_plot = cfg.behavs_act_df.copy()
-
-    df_to_plot_OHE_Behavior_Comptype = pd.get_dummies(
-        df_to_plot["Behavior Comptype"],
-        prefix = "BC",
-        prefix_sep = " "
-        )
-    df_to_plot = pd.merge(
-        left = df_to_plot,
-        right = df_to_plot_OHE_Behavior_Comptype,
-        left_index=True,
-        right_index=True,
-        )
-
-    df_to_plot = df_to_plot.groupby("Sub ID", as_index=False).agg({
-        "Sub Workstyle": 'last',
-        "BC Idea": 'sum',
-        })
+    df_to_plot = pdata.return_plot_data_cache().return_per_person_df()
     df_to_plot = df_to_plot.groupby(
         "Sub Workstyle", as_index=False).agg({"BC Idea": 'mean'}
         )
@@ -847,30 +920,8 @@ def generate_event_row_internal_correlations_heatmap():
     """
 
     # Prepare the data.
-    correlations_df = utils.return_df_with_selected_cols_from_df(
-        cfg.behavs_act_df,
-        [
-            "Sub Health",
-            "Sub Commitment",
-            "Sub Perceptiveness",
-            "Sub Dexterity",
-            "Sub Sociality",
-            "Sub Goodness",
-            "Sub Strength",
-            "Sub Openmindedness",
-            "Sub Age",
-            "Sup-Sub Age Difference",
-            "Sub Same-Sex Colleagues Prtn",
-            "Weekday Num",
-            "Actual Efficacy",
-            "Recorded Efficacy",
-            ],
-        )
-
-    # It's important to convert all columns to a numerical type, to keep
-    # Pandas from eliminating some of the (non-numerical) columns.
-    correlations_df = correlations_df.astype(float)
-    correlations_df = correlations_df.corr()
+    correlations_df = \
+        pdata.return_plot_data_cache().return_event_row_correlations_df()
 
     generate_plot_return_png_and_save_to_file(
         "heatmap",
@@ -892,6 +943,46 @@ def generate_event_row_internal_correlations_heatmap():
         )
 
 
+def calculate_interpersonal_correlations_df():
+    """
+    Returns a DF with the correlations between different subjects' 
+    stats and events (e.g., between the number of Lapses and average
+    Efficacy).
+    """
+
+    correlations_df = pdata.return_plot_data_cache().return_per_person_df()
+    correlations_df = correlations_df[[
+        "Sub Health",
+        "Sub Commitment",
+        "Sub Perceptiveness",
+        "Sub Dexterity",
+        "Sub Sociality",
+        "Sub Goodness",
+        "Sub Strength",
+        "Sub Openmindedness",
+        "Sub Age",
+        "Sup-Sub Age Difference",
+        "Sub Same-Sex Colleagues Prtn",
+        "BC Presence",
+        "Actual Efficacy",
+        "Recorded Efficacy",
+        "BC Idea",
+        "BC Lapse",
+        "BC Feat",
+        "BC Slip",
+        "BC Teamwork",
+        "BC Disruption",
+        "BC Sacrifice",
+        "BC Sabotage",
+        "RCM True Positive",
+        "RCM False Negative",
+        ]]
+
+    # It's important to convert all columns to a numerical type, to keep
+    # Pandas from eliminating some of the (non-numerical) columns.
+    return correlations_df.astype(float).corr()
+
+
 def generate_interpersonal_correlations_heatmap():
     """
     Save to file and return a PNG with a heatmap showing correlations 
@@ -906,120 +997,12 @@ def generate_interpersonal_correlations_heatmap():
     (non-Seaborn) Matplotlib plots have been created.
     """
 
-    # Prepare the data.
-    correlations_df = cfg.behavs_act_df.copy()
-
-    correlations_df_OHE_Behavior_Comptype = \
-        pd.get_dummies(correlations_df["Behavior Comptype"].astype(
-            pd.CategoricalDtype(categories=[
-                "Presence",
-                "Idea",
-                "Lapse",
-                "Feat",
-                "Slip",
-                "Teamwork",
-                "Disruption",
-                "Sacrifice",
-                "Sabotage"
-                ])),
-            prefix = "BC",
-            prefix_sep = " ",
-        )
-
-    correlations_df = pd.merge(
-        left = correlations_df,
-        right = correlations_df_OHE_Behavior_Comptype,
-        left_index=True,
-        right_index=True,
-        )
-
-    correlations_df_OHE_Record_Conf_Mat = \
-        pd.get_dummies(
-            correlations_df["Record Conf Mat"],
-            prefix = "RCM",
-            prefix_sep = " "
-            )
-
-    correlations_df = pd.merge(
-        left = correlations_df,
-        right = correlations_df_OHE_Record_Conf_Mat,
-        left_index=True,
-        right_index=True,
-        )
-
-    correlations_df = utils.return_df_with_selected_cols_from_df(
-        correlations_df,
-        [
-            "Sub ID",
-            "Sub Health",
-            "Sub Commitment",
-            "Sub Perceptiveness",
-            "Sub Dexterity",
-            "Sub Sociality",
-            "Sub Goodness",
-            "Sub Strength",
-            "Sub Openmindedness",
-            "Sub Age",
-            "Sup-Sub Age Difference",
-            "Sub Same-Sex Colleagues Prtn",
-            "Weekday Num",
-            "BC Presence",
-            "Actual Efficacy",
-            "Recorded Efficacy",
-            "BC Idea",
-            "BC Lapse",
-            "BC Feat",
-            "BC Slip",
-            "BC Teamwork",
-            "BC Disruption",
-            "BC Sacrifice",
-            "BC Sabotage",
-            "RCM True Positive",
-            "RCM False Negative",
-            ],
-        )
-
-    # Flatten the DF to only include one row for each person.
-    correlations_df = correlations_df.groupby("Sub ID", as_index=False).agg(
-        {
-            "Sub Health": 'last',
-            "Sub Commitment": 'last',
-            "Sub Perceptiveness": 'last',
-            "Sub Dexterity": 'last',
-            "Sub Sociality": 'last',
-            "Sub Goodness": 'last',
-            "Sub Strength": 'last',
-            "Sub Openmindedness": 'last',
-            "Sub Age": 'last',
-            "Sup-Sub Age Difference": 'mean',
-            "Sub Same-Sex Colleagues Prtn": 'mean',
-            "BC Presence": 'sum',
-            "Actual Efficacy": 'mean',
-            "Recorded Efficacy": 'mean',
-            "BC Idea": 'sum',
-            "BC Lapse": 'sum',
-            "BC Feat": 'sum',
-            "BC Slip": 'sum',
-            "BC Teamwork": 'sum',
-            "BC Disruption": 'sum',
-            "BC Sacrifice": 'sum',
-            "BC Sabotage": 'sum',
-            "RCM True Positive": 'sum',
-            "RCM False Negative": 'sum',
-            }
+    # Prepare the data, using the DF with one row for each person.
+    correlations_df = pdata.return_plot_data_cache().return_aggregate(
+        "Interpersonal correlations",
+        calculate_interpersonal_correlations_df,
         )
 
-    # Delete the "Sub ID" column.
-    correlations_df = utils.return_df_with_selected_cols_deleted(
-        correlations_df,
-        ["Sub ID"],
-        )
-
-    # It's important to convert all columns to a numerical type, to keep
-    # Pandas from eliminating some of the (non-numerical) columns.
-    correlations_df = correlations_df.astype(float)
-    correlations_df = correlations_df.corr()
-
     generate_plot_return_png_and_save_to_file(
         "heatmap",
         correlations_df,
@@ -1047,10 +1030,8 @@ def plot_Eff_by_day_in_series_bar():
     """
 
     # Prepare the data.
-    df_to_plot = cfg.behavs_act_df.copy()
-    df_to_plot = df_to_plot.groupby(
-        "Day in Series (1-based)", as_index=False
-        ).agg({"Actual Efficacy": 'mean'})
+    df_to_plot = pdata.return_plot_data_cache().return_mean_of_col_by_group(
+        "Day in Series (1-based)", "Actual Efficacy")
 
     generate_plot_return_png_and_save_to_file(
         "bar",
@@ -1069,6 +1050,199 @@ def plot_Eff_by_day_in_series_bar():
         )
 
 
+# ----------------------------------------------------------------------
+# The functions below allow the web interface to render each plot only 
+# when it's first requested, using a named render profile (see 
+# cfg.PLOT_RENDER_PROFILES). Each rendered plot is cached on disk in 
+# cfg.PLOTS_DIR/<dataset ID>/<render profile>/<plot name>.png, so that 
+# it's rendered just once for a given dataset and render profile.
+# ----------------------------------------------------------------------
+
+# The plots that are generated for a dataset, in the order in which 
+# they're displayed. For each plot name, this gives the function that 
+# generates the plot, the arguments with which it's called, and whether
+# the dataset might lack the data needed for the plot (in which case 
+# the plot is simply skipped).
+PLOTS_FOR_DATASET = {
+    "Eff_mean_vs_Eff_sd_with_workstyles_scatter": (
+        plot_Eff_mean_vs_Eff_sd_with_workstyles_scatter, (), False),
+    "ideas_mean_by_workstyle_group_bar": (
+        plot_ideas_mean_by_workstyle_group_bar, (), False),
+    "distribution_of_MNGR_CAP_scores_hist": (
+        plot_distribution_of_MNGR_CAP_scores_hist, (), False),
+    "Eff_by_weekday_bar": (
+        plot_Eff_by_weekday_bar, (), False),
+    "Eff_by_day_in_series_bar": (
+        plot_Eff_by_day_in_series_bar, (), False),
+    "recorded_Eff_by_sub_sup_age_difference_line": (
+        plot_recorded_Eff_by_sub_sup_age_difference_line, (), False),
+    "event_row_internal_correlations_heatmap": (
+        generate_event_row_internal_correlations_heatmap, (), False),
+    "interpersonal_correlations_heatmap": (
+        generate_interpersonal_correlations_heatmap, (), False),
+    "mday_series_Eff_for_True_Positive_bar": (
+        plot_mday_series_Eff_for_behav_comptype_bar,
+        ("Record Conf Mat", "True Positive", cfg.PLOT_COLOR_GREEN),
+        True),
+    "mday_series_Eff_for_False_Negative_bar": (
+        plot_mday_series_Eff_for_behav_comptype_bar,
+        ("Record Conf Mat", "False Negative", cfg.PLOT_COLOR_SALMON),
+        True),
+    }
+
+# Matplotlib isn't thread-safe, and the web interface may receive 
+# several requests for plots at once. This lock must be held while 
+# capturing a plot's arguments or rendering a plot in this process.
+plot_rendering_lock = threading.Lock()
+
+# The locks that prevent the same plot from being rendered twice with 
+# the same render profile, keyed by (dataset ID, plot name, profile). 
+# Only the locks for the current dataset are kept.
+plot_file_locks = {}
+plot_file_locks_lock = threading.Lock()
+
+
+def generate_plots_for_dataset():
+    """
+    Generates (and saves to file) all of the plots in PLOTS_FOR_DATASET
+    for the current dataset.
+    """
+
+    for plot_function, plot_function_args, plot_may_lack_data in \
+            PLOTS_FOR_DATASET.values():
+        if plot_may_lack_data:
+            try:
+                plot_function(*plot_function_args)
+            except:
+                pass
+        else:
+            plot_function(*plot_function_args)
+
+
+def return_args_of_plot(plot_name_u):
+    """
+    Returns the arguments with which a plot is to be rendered for the 
+    current dataset (which are prepared only once per dataset).
+
+    PARAMETERS
+    ----------
+    plot_name_u : str
+        The name of the plot (a key in PLOTS_FOR_DATASET)
+    """
+
+    def capture_args_of_plot():
+        plot_function, plot_function_args, _ = PLOTS_FOR_DATASET[plot_name_u]
+        with plot_rendering_lock:
+            cfg.plot_rendering_jobs = []
+            try:
+                plot_function(*plot_function_args)
+                return cfg.plot_rendering_jobs[0]
+            finally:
+                cfg.plot_rendering_jobs = None
+
+    return pdata.return_plot_data_cache().return_aggregate(
+        ("Plot args", plot_name_u),
+        capture_args_of_plot,
+        )
+
+
+def return_names_of_available_plots():
+    """
+    Returns the names of the plots in PLOTS_FOR_DATASET for which the 
+    current dataset contains the needed data.
+    """
+
+    names_of_available_plots = []
+    for plot_name, (_, _, plot_may_lack_data) in PLOTS_FOR_DATASET.items():
+        if plot_may_lack_data:
+            try:
+                return_args_of_plot(plot_name)
+            except:
+                continue
+        names_of_available_plots.append(plot_name)
+
+    return names_of_available_plots
+
+
+def return_urls_of_plots_rendered_on_demand(render_profile_u):
+    """
+    Returns the (relative) URLs at which the web interface serves the 
+    available plots for the current dataset, rendered on demand.
+
+    PARAMETERS
+    ----------
+    render_profile_u : str
+        The name of the render profile to be used
+    """
+
+    dataset_id = pdata.return_plot_data_cache().dataset_id
+
+    return [
+        "plots/" + dataset_id + "/" + render_profile_u + "/" \
+            + plot_name + ".png"
+        for plot_name in return_names_of_available_plots()
+        ]
+
+
+def return_path_of_plot_rendered_on_demand(plot_name_u, render_profile_u):
+    """
+    Returns the path of the PNG file of a plot for the current dataset,
+    rendering the plot first if it hasn't yet been rendered with the 
+    given render profile.
+
+    PARAMETERS
+    ----------
+    plot_name_u : str
+        The name of the plot (a key in PLOTS_FOR_DATASET)
+    render_profile_u : str
+        The name of the render profile (a key in cfg.PLOT_RENDER_PROFILES)
+    """
+
+    dataset_id = pdata.return_plot_data_cache().dataset_id
+    file_path = os.path.join(
+        cfg.PLOTS_DIR,
+        dataset_id,
+        render_profile_u,
+        plot_name_u + ".png",
+        )
+
+    with plot_file_locks_lock:
+        for key in [
+                key for key in plot_file_locks if key[0] != dataset_id]:
+            del plot_file_locks[key]
+        plot_file_lock = plot_file_locks.setdefault(
+            (dataset_id, plot_name_u, render_profile_u),
+            threading.Lock(),
+            )
+
+    with plot_file_lock:
+        if os.path.exists(file_path):
+            return file_path
+
+        plot_args = return_args_of_plot(plot_name_u)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        # The plot is saved under a temporary name and only then moved 
+        # into place, so that a partially written file is never served.
+        # (It's rendered in this process, as forking the multithreaded 
+        # web server to render a single plot isn't safe. Any changes to
+        # Matplotlib's settings made while rendering it, e.g., by 
+        # Seaborn when rendering a heatmap, are undone afterward, so 
+        # that a plot doesn't depend on which plots were rendered 
+        # before it.)
+        temp_file_path = file_path + ".tmp"
+        with plot_rendering_lock, matplotlib.rc_context():
+            generate_plot_return_png_and_save_to_file(
+                *plot_args,
+                render_profile_u=render_profile_u,
+                file_path_u=temp_file_path,
+                )
+            plt.close("all")
+        os.replace(temp_file_path, file_path)
+
+    return file_path
+
+
 # ██████████████████████████████████████████████████████████████████████
 # █                                                                    █
 # █    █████  ██  ██ █ ███   ████   ████ █████  ███   █ ███   █████    █